@@ -1,33 +1,298 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.interfaces.file_storage import AbstractFileStorage
+from app.application.interfaces.job_queue import AbstractJobQueue
+from app.application.interfaces.keyword_index import AbstractKeywordIndex
 from app.application.services.analytics import AnalyticsService
 from app.application.services.auth import AuthService
+from app.application.services.bulk_import import ResumeImportService
+from app.application.services.extraction import ResumeExtractionService
+from app.application.services.jobs import JobWorker
 from app.application.services.resume_scoring import ResumeScoringService
-from app.infrastructure.db.session import get_db_session
+from app.application.services.scoring_jobs import ScoringJobHandlers
+from app.core.config import get_settings
+from app.domain.entities.user import User
+from app.infrastructure.cache.analytics_cache import RedisAnalyticsCache
+from app.infrastructure.cache.memory import TTLLRUCache
+from app.infrastructure.cache.redis import get_redis_client
+from app.infrastructure.cache.score_cache import TieredScoreCache
+from app.infrastructure.extraction.pool import ProcessPoolExtractor
+from app.infrastructure.jobs.memory import InMemoryJobQueue
+from app.infrastructure.jobs.redis_queue import RedisJobQueue
+from app.infrastructure.scoring.sparse_engine import SparseScoringEngine
+from app.infrastructure.search.keyword_index import KeywordIndexRegistry
+from app.infrastructure.storage.local import LocalFileStorage
+from app.infrastructure.storage.s3 import S3FileStorage
+from app.infrastructure.db.session import get_db_session, session_factory
 from app.infrastructure.repositories.resume_repository import ResumeRepository
+from app.infrastructure.repositories.score_card_repository import ScoreCardRepository
 from app.infrastructure.repositories.user_repository import UserRepository
+from app.infrastructure.security.auth import VerifiedTokenCache
+from app.infrastructure.security.hasher import ExecutorPasswordHasher
+from app.infrastructure.skills.automaton import (
+    DEFAULT_TAXONOMY_PATH,
+    SkillAutomaton,
+    load_skill_automaton,
+)
 
+_bearer = HTTPBearer(auto_error=False)
 
-async def get_resume_repository(db: AsyncSession = Depends(get_db_session)) -> ResumeRepository:
-    return ResumeRepository(db)
+
+@lru_cache
+def get_file_storage() -> AbstractFileStorage:
+    settings = get_settings()
+    if settings.storage_backend == "s3":
+        try:
+            import boto3
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("STORAGE_BACKEND=s3 requires the boto3 package") from exc
+        client = boto3.client("s3", endpoint_url=settings.s3_endpoint_url or None)
+        return S3FileStorage(
+            client,
+            bucket=settings.s3_bucket,
+            public_base_url=settings.s3_public_base_url
+            or f"{settings.s3_endpoint_url or ''}/{settings.s3_bucket}",
+        )
+    return LocalFileStorage(
+        Path(settings.upload_dir),
+        state_dir=Path(settings.upload_state_dir),
+        public_base_url=str(settings.public_base_url),
+    )
+
+
+@lru_cache
+def get_keyword_index() -> AbstractKeywordIndex:
+    settings = get_settings()
+    skills = get_skill_matcher()
+    return KeywordIndexRegistry(
+        max_owners=settings.keyword_index_max_owners,
+        ttl_seconds=settings.keyword_index_ttl_seconds,
+        canonicalize=skills.canonicalize if skills else None,
+    )
+
+
+async def get_resume_repository(
+    db: AsyncSession = Depends(get_db_session),
+    index: AbstractKeywordIndex = Depends(get_keyword_index),
+    storage: AbstractFileStorage = Depends(get_file_storage),
+) -> ResumeRepository:
+    return ResumeRepository(db, index=index, storage=storage)
+
+
+async def get_score_card_repository(
+    db: AsyncSession = Depends(get_db_session),
+) -> ScoreCardRepository:
+    return ScoreCardRepository(db)
+
+
+@lru_cache
+def get_score_cache() -> TieredScoreCache | None:
+    settings = get_settings()
+    if not settings.score_cache_enabled:
+        return None
+    return TieredScoreCache(
+        max_entries=settings.score_cache_max_entries,
+        ttl_seconds=settings.score_cache_ttl_seconds,
+        redis=get_redis_client() if settings.score_cache_redis_enabled else None,
+    )
+
+
+@lru_cache
+def get_scoring_engine() -> SparseScoringEngine | None:
+    settings = get_settings()
+    if settings.scoring_engine != "sparse":
+        return None
+    return SparseScoringEngine(min_batch_size=settings.sparse_engine_min_batch)
+
+
+@lru_cache
+def get_skill_matcher() -> SkillAutomaton | None:
+    settings = get_settings()
+    if not settings.skill_matching_enabled:
+        return None
+    taxonomy = settings.skill_taxonomy_path
+    return load_skill_automaton(
+        Path(settings.skill_automaton_path),
+        Path(taxonomy) if taxonomy else DEFAULT_TAXONOMY_PATH,
+    )
 
 
 def get_resume_scoring_service(
     repository: ResumeRepository = Depends(get_resume_repository),
+    cache: TieredScoreCache | None = Depends(get_score_cache),
+    engine: SparseScoringEngine | None = Depends(get_scoring_engine),
+    index: AbstractKeywordIndex = Depends(get_keyword_index),
+    score_cards: ScoreCardRepository = Depends(get_score_card_repository),
+    skills: SkillAutomaton | None = Depends(get_skill_matcher),
 ) -> ResumeScoringService:
-    return ResumeScoringService(repository=repository)
+    return ResumeScoringService(
+        repository=repository,
+        cache=cache,
+        engine=engine,
+        index=index,
+        score_cards=score_cards,
+        skills=skills,
+    )
+
+
+def get_resume_import_service(
+    repository: ResumeRepository = Depends(get_resume_repository),
+    scoring: ResumeScoringService = Depends(get_resume_scoring_service),
+    skills: SkillAutomaton | None = Depends(get_skill_matcher),
+) -> ResumeImportService:
+    return ResumeImportService(
+        repository, scoring=scoring, skills=skills, batch_size=get_settings().import_batch_size
+    )
+
+
+@lru_cache
+def get_document_extractor() -> ProcessPoolExtractor:
+    settings = get_settings()
+    skills = get_skill_matcher()
+    return ProcessPoolExtractor(
+        max_workers=settings.extraction_workers,
+        max_pending=settings.extraction_max_pending,
+        timeout_seconds=settings.extraction_timeout_seconds,
+        max_keywords=settings.extraction_max_keywords,
+        max_expanded_bytes=settings.extraction_max_expanded_bytes,
+        skill_automaton_path=skills.path if skills else None,
+    )
+
+
+def get_extraction_service(
+    repository: ResumeRepository = Depends(get_resume_repository),
+    storage: AbstractFileStorage = Depends(get_file_storage),
+    extractor: ProcessPoolExtractor = Depends(get_document_extractor),
+    skills: SkillAutomaton | None = Depends(get_skill_matcher),
+) -> ResumeExtractionService:
+    return ResumeExtractionService(
+        repository=repository, storage=storage, extractor=extractor, skills=skills
+    )
 
 
 async def get_user_repository(db: AsyncSession = Depends(get_db_session)) -> UserRepository:
     return UserRepository(db)
 
 
-def get_auth_service(repository: UserRepository = Depends(get_user_repository)) -> AuthService:
-    return AuthService(repository=repository)
+@lru_cache
+def get_password_hasher() -> ExecutorPasswordHasher:
+    settings = get_settings()
+    return ExecutorPasswordHasher(
+        rounds=settings.password_hash_rounds,
+        max_workers=settings.password_hash_workers,
+        max_pending=settings.password_hash_max_pending,
+    )
+
+
+def get_auth_service(
+    repository: UserRepository = Depends(get_user_repository),
+    hasher: ExecutorPasswordHasher = Depends(get_password_hasher),
+) -> AuthService:
+    return AuthService(repository=repository, hasher=hasher)
+
+
+@lru_cache
+def get_token_cache() -> VerifiedTokenCache:
+    settings = get_settings()
+    return VerifiedTokenCache(
+        max_entries=settings.token_cache_max_entries,
+        ttl_seconds=settings.token_cache_ttl_seconds,
+    )
+
+
+@lru_cache
+def get_user_cache() -> TTLLRUCache[int, User]:
+    settings = get_settings()
+    return TTLLRUCache(
+        max_entries=settings.user_cache_max_entries, ttl_seconds=settings.user_cache_ttl_seconds
+    )
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(_bearer),
+    tokens: VerifiedTokenCache = Depends(get_token_cache),
+    users: TTLLRUCache[int, User] = Depends(get_user_cache),
+    repository: UserRepository = Depends(get_user_repository),
+) -> User:
+    """Resolve the bearer token to an active user; warm requests touch neither crypto nor SQL."""
+    unauthorized = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    if credentials is None:
+        raise unauthorized
+    try:
+        user_id = int(tokens.subject(credentials.credentials))
+    except ValueError as exc:
+        raise unauthorized from exc
+    user = users.get(user_id)
+    if user is None:
+        user = await repository.get(user_id)
+        if user is None:
+            raise unauthorized
+        users.set(user_id, user)
+    if not user.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
+    return user
+
+
+@lru_cache
+def get_analytics_cache() -> RedisAnalyticsCache | None:
+    settings = get_settings()
+    if not settings.analytics_cache_enabled:
+        return None
+    return RedisAnalyticsCache(
+        get_redis_client(), retention_seconds=settings.analytics_cache_retention_seconds
+    )
+
+
+def get_analytics_service(
+    session: AsyncSession = Depends(get_db_session),
+    cache: RedisAnalyticsCache | None = Depends(get_analytics_cache),
+) -> AnalyticsService:
+    return AnalyticsService(session, cache=cache)
+
+
+@lru_cache
+def get_job_queue() -> AbstractJobQueue:
+    settings = get_settings()
+    if settings.job_queue_backend == "memory":
+        return InMemoryJobQueue()
+    return RedisJobQueue(get_redis_client(), retention_seconds=settings.job_retention_seconds)
+
+
+@asynccontextmanager
+async def scoring_unit_of_work() -> AsyncIterator[ResumeScoringService]:
+    """A scoring service on its own session, committed on success, for work outside requests."""
+    index = get_keyword_index()
+    async with session_factory()() as session:
+        yield ResumeScoringService(
+            ResumeRepository(session, index=index, storage=get_file_storage()),
+            cache=get_score_cache(),
+            engine=get_scoring_engine(),
+            index=index,
+            score_cards=ScoreCardRepository(session),
+            skills=get_skill_matcher(),
+        )
+        await session.commit()
 
 
-def get_analytics_service(session: AsyncSession = Depends(get_db_session)) -> AnalyticsService:
-    return AnalyticsService(session)
+def build_job_worker(queue: AbstractJobQueue, *, concurrency: int | None = None) -> JobWorker:
+    settings = get_settings()
+    handlers = ScoringJobHandlers(scoring_unit_of_work, analytics_cache=get_analytics_cache())
+    return JobWorker(
+        queue,
+        handlers.handlers(),
+        concurrency=concurrency or settings.job_worker_concurrency,
+        max_attempts=settings.job_max_attempts,
+        retry_initial_seconds=settings.job_retry_initial_seconds,
+        retry_max_seconds=settings.job_retry_max_seconds,
+    )
@@ -0,0 +1,37 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.api.dependencies import get_score_cache
+from app.core.metrics import (
+    DB_POOL_CHECKOUTS,
+    DB_POOL_CONNECTIONS,
+    DB_POOL_TIMEOUTS,
+    DB_POOL_WAIT_SECONDS,
+    REGISTRY,
+    SCORE_CACHE_LOOKUPS,
+)
+from app.infrastructure.db.pool import pool_stats
+from app.infrastructure.db.session import get_engine
+
+router = APIRouter()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Prometheus scrape target for the worker process that serves the request."""
+    stats = pool_stats(get_engine())
+    if stats is not None:
+        DB_POOL_CONNECTIONS.labels("checked_out").set(stats.checked_out)
+        DB_POOL_CONNECTIONS.labels("checked_in").set(stats.checked_in)
+        DB_POOL_CONNECTIONS.labels("overflow").set(stats.overflow)
+        DB_POOL_CHECKOUTS.set(stats.checkouts)
+        DB_POOL_TIMEOUTS.set(stats.timeouts)
+        DB_POOL_WAIT_SECONDS.set(stats.total_wait_seconds)
+    cache = get_score_cache()
+    if cache is not None:
+        SCORE_CACHE_LOOKUPS.labels("local_hit").set(cache.stats.local_hits)
+        SCORE_CACHE_LOOKUPS.labels("remote_hit").set(cache.stats.remote_hits)
+        SCORE_CACHE_LOOKUPS.labels("miss").set(cache.stats.misses)
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from typing import Iterable
+
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_FLIGHT, HTTP_REQUESTS_TOTAL
+
+_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """Reject oversized upload bodies before they are buffered.
+
+    Requests announcing a larger ``Content-Length`` are refused outright; streamed bodies are
+    counted as they arrive and aborted as soon as they cross the limit.
+    """
+
+    def __init__(self, app: ASGIApp, *, max_bytes: int, paths: Iterable[str]) -> None:
+        self.app = app
+        self._max_body_bytes = max_bytes + _MULTIPART_OVERHEAD_BYTES
+        self._paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self._paths:
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        declared = headers.get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > self._max_body_bytes:
+            response = JSONResponse(
+                {"detail": "Upload exceeds the maximum allowed size"},
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self._max_body_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail="Upload exceeds the maximum allowed size",
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+class RequestMetricsMiddleware:
+    """Record latency, status and concurrency of every HTTP request.
+
+    Requests are labelled with the matched route template rather than the raw path, so ids in
+    URLs do not create a new series each; unmatched paths share a single ``unmatched`` label.
+    """
+
+    def __init__(self, app: ASGIApp, *, excluded_paths: Iterable[str] = ()) -> None:
+        self.app = app
+        self._excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self._excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        status_code = 500
+
+        async def recording_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, recording_send)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or "unmatched"
+            HTTP_REQUEST_SECONDS.labels(scope["method"], template).observe(elapsed)
+            HTTP_REQUESTS_TOTAL.labels(scope["method"], template, str(status_code)).inc()
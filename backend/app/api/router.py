@@ -1,8 +1,27 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.api.v1.endpoints import analytics, auth, resumes
+from app.api.dependencies import get_current_user
+
+from app.api.v1.endpoints import analytics, auth, jobs, resumes, system
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(resumes.router, prefix="/resumes", tags=["resumes"])
-api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(
+    resumes.router,
+    prefix="/resumes",
+    tags=["resumes"],
+    dependencies=[Depends(get_current_user)],
+)
+api_router.include_router(
+    analytics.router,
+    prefix="/analytics",
+    tags=["analytics"],
+    dependencies=[Depends(get_current_user)],
+)
+api_router.include_router(
+    jobs.router,
+    prefix="/jobs",
+    tags=["jobs"],
+    dependencies=[Depends(get_current_user)],
+)
+api_router.include_router(system.router, prefix="/system", tags=["system"])
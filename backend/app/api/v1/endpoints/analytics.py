@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.api.dependencies import get_analytics_service
+from app.api.dependencies import get_analytics_service, get_current_user
 from app.application.services.analytics import AnalyticsService
+from app.domain.entities.user import User
 from app.schemas.analytics import AnalyticsSummary
 
 router = APIRouter()
@@ -11,5 +12,8 @@ router = APIRouter()
 async def get_summary(
     owner_id: int = Query(..., description="User identifier"),
     service: AnalyticsService = Depends(get_analytics_service),
+    current_user: User = Depends(get_current_user),
 ) -> AnalyticsSummary:
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your analytics")
     return await service.summary_for_owner(owner_id)
@@ -2,9 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_auth_service
+from app.application.interfaces.password_hasher import PasswordHasherBusyError
 from app.application.services.auth import AuthService
 from app.infrastructure.db.session import get_db_session
-from app.infrastructure.security.auth import decode_token
+from app.infrastructure.security.auth import REFRESH_TOKEN, decode_token
 from app.schemas.auth import LoginRequest, LoginResponse, RefreshRequest, TokenPair
 from app.schemas.user import UserCreate, UserRead
 
@@ -23,6 +24,8 @@ async def register_user(
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except PasswordHasherBusyError as exc:
+        raise _busy_error(exc) from exc
     await session.commit()
     return UserRead(id=user.id or 0, email=user.email, full_name=user.full_name, created_at=user.created_at)
 
@@ -31,11 +34,15 @@ async def register_user(
 async def login(
     payload: LoginRequest,
     service: AuthService = Depends(get_auth_service),
+    session: AsyncSession = Depends(get_db_session),
 ) -> LoginResponse:
     try:
         access_token, user = await service.authenticate(email=payload.email, password=payload.password)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
+    except PasswordHasherBusyError as exc:
+        raise _busy_error(exc) from exc
+    await session.commit()  # persists an upgraded password hash, if any
     refresh_token = await service.issue_refresh_token(user_id=str(user.id))
     user_read = UserRead(
         id=user.id or 0,
@@ -56,8 +63,16 @@ async def refresh_token(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
     subject = decoded.get("sub")
-    if subject is None:
+    if subject is None or decoded.get("type") != REFRESH_TOKEN:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
     access_token = await service.issue_access_token(user_id=subject)
     refresh_token = await service.issue_refresh_token(user_id=subject)
     return TokenPair(access_token=access_token, refresh_token=refresh_token)
+
+
+def _busy_error(exc: PasswordHasherBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(exc),
+        headers={"Retry-After": "1"},
+    )
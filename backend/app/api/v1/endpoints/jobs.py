@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel
+
+from app.api.dependencies import get_current_user, get_job_queue
+from app.application.interfaces.job_queue import AbstractJobQueue
+from app.application.services.scoring_jobs import BATCH_SCORE_JOB, RESCORE_JOB
+from app.domain.entities.job import Job
+from app.domain.entities.user import User
+from app.schemas.job import JobRead
+from app.schemas.resume import BatchScoreRequest, RescoreRequest
+
+router = APIRouter()
+
+
+@router.post("/score/batch", response_model=JobRead, status_code=status.HTTP_202_ACCEPTED)
+async def submit_batch_score_job(
+    payload: BatchScoreRequest,
+    queue: AbstractJobQueue = Depends(get_job_queue),
+    current_user: User = Depends(get_current_user),
+) -> JobRead:
+    """Queue ``/resumes/score/batch``; poll ``/jobs/{id}`` for its response body."""
+    if not payload.resumes and not payload.resume_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide at least one resume or resume id",
+        )
+    return await _submit(queue, BATCH_SCORE_JOB, payload, current_user)
+
+
+@router.post("/rescore", response_model=JobRead, status_code=status.HTTP_202_ACCEPTED)
+async def submit_rescore_job(
+    payload: RescoreRequest,
+    queue: AbstractJobQueue = Depends(get_job_queue),
+    current_user: User = Depends(get_current_user),
+) -> JobRead:
+    """Queue ``/resumes/rescore``; poll ``/jobs/{id}`` for its response body."""
+    return await _submit(queue, RESCORE_JOB, payload, current_user)
+
+
+@router.get("/{job_id}", response_model=JobRead)
+async def get_job(
+    job_id: str,
+    queue: AbstractJobQueue = Depends(get_job_queue),
+    current_user: User = Depends(get_current_user),
+) -> JobRead:
+    job = await queue.get(job_id)
+    if job is None or job.owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return JobRead.from_entity(job)
+
+
+async def _submit(
+    queue: AbstractJobQueue, kind: str, payload: BaseModel, current_user: User
+) -> JobRead:
+    job = Job(kind=kind, owner_id=current_user.id or 0, payload=payload.model_dump(mode="json"))
+    return JobRead.from_entity(await queue.submit(job))
@@ -1,23 +1,57 @@
+import base64
+import json
+from contextlib import aclosing
+from datetime import datetime
 from pathlib import Path
-from typing import Final
-from uuid import uuid4
+from typing import AsyncGenerator, AsyncIterator, Final
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_resume_repository, get_resume_scoring_service
+from app.api.dependencies import (
+    get_analytics_cache,
+    get_current_user,
+    get_extraction_service,
+    get_file_storage,
+    get_resume_import_service,
+    get_resume_repository,
+    get_resume_scoring_service,
+)
+from app.application.interfaces.analytics_cache import AbstractAnalyticsCache
+from app.application.interfaces.document_extractor import (
+    ExtractionError,
+    ExtractionQueueFullError,
+    ExtractionTimeoutError,
+)
+from app.application.interfaces.file_storage import AbstractFileStorage
+from app.application.services.bulk_import import ResumeImportService, split_lines
+from app.application.services.extraction import ResumeExtractionService
 from app.application.services.resume_scoring import ResumeScoringService
-from app.domain.entities.job_description import JobDescription
 from app.domain.entities.resume import Resume
+from app.domain.entities.score_card import ScoreCard
+from app.domain.entities.user import User
 from app.core.config import get_settings
 from app.infrastructure.db.session import get_db_session
 from app.infrastructure.repositories.resume_repository import ResumeRepository
+from app.infrastructure.storage.uploads import UploadTooLargeError
 from app.schemas.resume import (
-    JobDescriptionInput,
+    BatchScoreRequest,
+    BatchScoreResponse,
+    CandidateRankRequest,
+    CandidateRankResponse,
+    RescoreRequest,
+    RescoreResponse,
+    ResumeImportError,
+    ResumeImportResponse,
+    ResumeListItem,
+    ResumePage,
     ResumeRead,
     ResumeScoreRequest,
     ResumeScoreResponse,
     ScoreCardResponse,
+    ScoreStreamItem,
+    ScoreStreamRequest,
     ResumeUploadResponse,
 )
 
@@ -29,10 +63,17 @@ _ALLOWED_RESUME_TYPES: Final[set[str]] = {
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
 }
 _ALLOWED_SUFFIXES: Final[set[str]] = {".pdf", ".doc", ".docx"}
+_MAX_REPORTED_IMPORT_ERRORS: Final[int] = 1_000
+_LISTABLE_FIELDS: Final[tuple[str, ...]] = tuple(ResumeListItem.model_fields)
+_NDJSON: Final[str] = "application/x-ndjson"
+_EVENT_STREAM: Final[str] = "text/event-stream"
 
 
 @router.post("/upload", response_model=ResumeUploadResponse, status_code=status.HTTP_201_CREATED)
-async def upload_resume_file(file: UploadFile = File(...)) -> ResumeUploadResponse:
+async def upload_resume_file(
+    file: UploadFile = File(...),
+    storage: AbstractFileStorage = Depends(get_file_storage),
+) -> ResumeUploadResponse:
     if file.content_type not in _ALLOWED_RESUME_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -47,96 +88,350 @@ async def upload_resume_file(file: UploadFile = File(...)) -> ResumeUploadRespon
         )
 
     settings = get_settings()
-    target_dir = Path(settings.upload_dir)
-    target_dir.mkdir(parents=True, exist_ok=True)
-    target_path = target_dir / f"{uuid4().hex}{suffix}"
-
-    contents = await file.read()
-    target_path.write_bytes(contents)
-    await file.close()
+    try:
+        if file.size is not None and file.size > settings.max_upload_bytes:
+            raise UploadTooLargeError(
+                f"File exceeds the {settings.max_upload_bytes} byte upload limit"
+            )
+        await file.seek(0)
+        stored = await storage.put(
+            file.file,
+            suffix=suffix,
+            max_bytes=settings.max_upload_bytes,
+            chunk_size=settings.upload_chunk_bytes,
+        )
+    except UploadTooLargeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)
+        ) from exc
+    finally:
+        await file.close()
 
-    base_url = str(settings.public_base_url).rstrip("/")
-    file_url = f"{base_url}/uploads/{target_path.name}"
-    return ResumeUploadResponse(file_url=file_url)
+    return ResumeUploadResponse(
+        file_url=storage.public_url(stored.key), size_bytes=stored.size, sha256=stored.sha256
+    )
 
 
 @router.post("/score", response_model=ResumeScoreResponse, status_code=status.HTTP_201_CREATED)
 async def upload_and_score_resume(
     payload: ResumeScoreRequest,
     service: ResumeScoringService = Depends(get_resume_scoring_service),
+    extraction: ResumeExtractionService = Depends(get_extraction_service),
+    analytics_cache: AbstractAnalyticsCache | None = Depends(get_analytics_cache),
     session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
 ) -> ResumeScoreResponse:
-    resume_entity = _to_resume_entity(payload.resume)
-    job_entity = _to_job_description(payload.job_description) if payload.job_description else None
+    _require_owner(payload.resume.owner_id, current_user)
+    try:
+        resume_entity = await extraction.complete(payload.resume.to_entity())
+    except ExtractionError as exc:
+        raise _extraction_http_error(exc) from exc
+    job_entity = payload.job_description.to_entity() if payload.job_description else None
     stored_resume, score_card = await service.upload_and_score(
         resume=resume_entity, job_description=job_entity
     )
     await session.commit()
+    await _invalidate_analytics(analytics_cache, [stored_resume.owner_id])
     resume_read = _to_resume_read(stored_resume)
-    score_response = ScoreCardResponse(
-        resume_id=score_card.resume_id,
-        job_description_id=score_card.job_description_id,
-        ats_score=score_card.ats_score,
-        keyword_match=score_card.keyword_match,
-        formatting_score=score_card.formatting_score,
-        overall_score=score_card.overall_score,
-        recommendations=list(score_card.recommendations),
-    )
+    score_response = ScoreCardResponse.from_entity(score_card)
     return ResumeScoreResponse(resume=resume_read, score_card=score_response)
 
 
-@router.get("/", response_model=list[ResumeRead])
+@router.post("/score/batch", response_model=BatchScoreResponse)
+async def score_resume_batch(
+    payload: BatchScoreRequest,
+    service: ResumeScoringService = Depends(get_resume_scoring_service),
+    current_user: User = Depends(get_current_user),
+) -> BatchScoreResponse:
+    if not payload.resumes and not payload.resume_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide at least one resume or resume id",
+        )
+    try:
+        resumes, matrix = await service.score_batch(
+            resumes=[item.to_entity() for item in payload.resumes],
+            resume_ids=payload.resume_ids,
+            job_descriptions=[item.to_entity() for item in payload.job_descriptions],
+            owner_id=current_user.id or 0,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return BatchScoreResponse(
+        resume_ids=[resume.id or 0 for resume in resumes],
+        results=[[ScoreCardResponse.from_entity(card) for card in row] for row in matrix],
+    )
+
+
+@router.post(
+    "/score/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {_EVENT_STREAM: {}, _NDJSON: {}}}},
+)
+async def stream_resume_batch_scores(
+    payload: ScoreStreamRequest,
+    request: Request,
+    service: ResumeScoringService = Depends(get_resume_scoring_service),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream each ``ScoreStreamItem`` of a batch as soon as it is scored.
+
+    Server-sent ``score`` events end with a ``done`` event; ``Accept: application/x-ndjson``
+    gets one JSON item per line instead. Scoring stops when the client disconnects.
+    """
+    if not payload.resumes and not payload.resume_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide at least one resume or resume id",
+        )
+    settings = get_settings()
+    try:
+        rows = await service.stream_batch(
+            resumes=[item.to_entity() for item in payload.resumes],
+            resume_ids=payload.resume_ids,
+            job_descriptions=[item.to_entity() for item in payload.job_descriptions],
+            first_chunk=settings.score_stream_first_chunk,
+            max_chunk=settings.score_stream_max_chunk,
+            owner_id=current_user.id or 0,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    ndjson = _NDJSON in request.headers.get("accept", "")
+    return StreamingResponse(
+        _score_events(rows, ndjson=ndjson),
+        media_type=_NDJSON if ndjson else _EVENT_STREAM,
+        # Proxies must pass events through as they come rather than buffer the response.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/rescore", response_model=RescoreResponse)
+async def rescore_resumes(
+    payload: RescoreRequest,
+    service: ResumeScoringService = Depends(get_resume_scoring_service),
+    analytics_cache: AbstractAnalyticsCache | None = Depends(get_analytics_cache),
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+) -> RescoreResponse:
+    job_entity = payload.job_description.to_entity() if payload.job_description else None
+    try:
+        scored, reused = await service.rescore(
+            resume_ids=payload.resume_ids,
+            job_description=job_entity,
+            owner_id=current_user.id or 0,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    await session.commit()
+    reused_ids = set(reused)
+    await _invalidate_analytics(
+        analytics_cache, [resume.owner_id for resume, _ in scored if resume.id not in reused_ids]
+    )
+    return RescoreResponse(
+        results=[ScoreCardResponse.from_entity(card) for _, card in scored],
+        reused_resume_ids=reused,
+    )
+
+
+@router.post("/import", response_model=ResumeImportResponse)
+async def import_resumes(
+    request: Request,
+    skip_lines: int = Query(default=0, ge=0, description="checkpoint of an interrupted import"),
+    score: bool = Query(default=False, description="Score each imported resume"),
+    importer: ResumeImportService = Depends(get_resume_import_service),
+    analytics_cache: AbstractAnalyticsCache | None = Depends(get_analytics_cache),
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+) -> ResumeImportResponse:
+    """Import an NDJSON body of the caller's ``ResumeCreate`` records, batch by batch.
+
+    Records for another owner are reported as failed.
+    """
+    response = ResumeImportResponse(imported=0, scored=0, failed=0, checkpoint=skip_lines)
+    async for batch in importer.import_lines(
+        split_lines(request.stream()),
+        skip_lines=skip_lines,
+        score=score,
+        owner_id=current_user.id or 0,
+    ):
+        await session.commit()
+        await _invalidate_analytics(analytics_cache, [item.owner_id for item in batch.imported])
+        response.imported += len(batch.imported)
+        response.scored += batch.scored
+        response.failed += len(batch.errors)
+        response.checkpoint = batch.checkpoint
+        room = _MAX_REPORTED_IMPORT_ERRORS - len(response.errors)
+        response.errors += [
+            ResumeImportError(line=item.line, error=item.error) for item in batch.errors[:room]
+        ]
+    return response
+
+
+@router.post("/rank", response_model=CandidateRankResponse)
+async def rank_candidates(
+    payload: CandidateRankRequest,
+    service: ResumeScoringService = Depends(get_resume_scoring_service),
+    current_user: User = Depends(get_current_user),
+) -> CandidateRankResponse:
+    _require_owner(payload.owner_id, current_user)
+    try:
+        ranked = await service.rank_candidates(
+            owner_id=payload.owner_id,
+            job_description=payload.job_description.to_entity(),
+            limit=payload.limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return CandidateRankResponse(
+        results=[
+            ResumeScoreResponse(
+                resume=_to_resume_read(resume),
+                score_card=ScoreCardResponse.from_entity(score_card),
+            )
+            for resume, score_card in ranked
+        ]
+    )
+
+
+@router.get("/", response_model=ResumePage, response_model_exclude_unset=True)
 async def list_resumes(
     owner_id: int = Query(..., description="User identifier"),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
+    fields: str | None = Query(
+        default=None, description="Comma-separated resume fields to return; defaults to all"
+    ),
     repository: ResumeRepository = Depends(get_resume_repository),
-) -> list[ResumeRead]:
-    items = await repository.list_for_owner(owner_id=owner_id)
-    return [_to_resume_read(item) for item in items]
+    current_user: User = Depends(get_current_user),
+) -> ResumePage:
+    _require_owner(owner_id, current_user)
+    selected = _parse_fields(fields)
+    after = _decode_cursor(cursor) if cursor else None
+    # One extra row tells whether another page follows without a COUNT query.
+    items = await repository.list_for_owner(
+        owner_id, limit=limit + 1, after=after, include_text="parsed_text" in selected
+    )
+    page = items[:limit]
+    return ResumePage(
+        items=[
+            ResumeListItem(**{name: getattr(item, name) for name in selected}) for item in page
+        ],
+        next_cursor=_encode_cursor(page[-1]) if len(items) > limit else None,
+    )
 
 
 @router.get("/{resume_id}", response_model=ResumeRead)
 async def get_resume(
     resume_id: int,
     repository: ResumeRepository = Depends(get_resume_repository),
+    current_user: User = Depends(get_current_user),
 ) -> ResumeRead:
-    resume = await repository.get(resume_id)
+    resume = await repository.get(resume_id, owner_id=current_user.id or 0)
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
     return _to_resume_read(resume)
 
 
+@router.post("/{resume_id}/extract", response_model=ResumeRead)
+async def extract_resume(
+    resume_id: int,
+    extraction: ResumeExtractionService = Depends(get_extraction_service),
+    analytics_cache: AbstractAnalyticsCache | None = Depends(get_analytics_cache),
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+) -> ResumeRead:
+    try:
+        resume = await extraction.reextract(resume_id, owner_id=current_user.id or 0)
+    except ExtractionError as exc:
+        raise _extraction_http_error(exc) from exc
+    if not resume:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
+    await session.commit()
+    await _invalidate_analytics(analytics_cache, [resume.owner_id])
+    return _to_resume_read(resume)
+
+
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_resume(
     resume_id: int,
     repository: ResumeRepository = Depends(get_resume_repository),
+    storage: AbstractFileStorage = Depends(get_file_storage),
+    analytics_cache: AbstractAnalyticsCache | None = Depends(get_analytics_cache),
     session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
 ) -> None:
-    resume = await repository.get(resume_id)
+    resume = await repository.delete(resume_id, owner_id=current_user.id or 0)
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
-    await repository.delete(resume_id)
     await session.commit()
+    await _invalidate_analytics(analytics_cache, [resume.owner_id])
+    stored_key = storage.key_from_url(resume.file_url)
+    if stored_key is not None:
+        await storage.release(stored_key)
 
 
-def _to_resume_entity(payload) -> Resume:
-    resume = Resume(
-        owner_id=payload.owner_id,
-        file_url=str(payload.file_url),
-        parsed_text=payload.parsed_text,
-        extracted_skills=list(payload.extracted_skills),
-        extracted_keywords=list(payload.extracted_keywords),
-    )
-    return resume
+async def _score_events(
+    rows: AsyncGenerator[tuple[int, list[ScoreCard]], None], *, ndjson: bool
+) -> AsyncIterator[str]:
+    async with aclosing(rows):
+        async for resume_index, row in rows:
+            for job_index, score_card in enumerate(row):
+                item = ScoreStreamItem(
+                    resume_index=resume_index,
+                    job_index=job_index,
+                    score_card=ScoreCardResponse.from_entity(score_card),
+                ).model_dump_json()
+                yield f"{item}\n" if ndjson else f"event: score\ndata: {item}\n\n"
+    if not ndjson:
+        yield "event: done\ndata: {}\n\n"
 
 
-def _to_job_description(payload: JobDescriptionInput) -> JobDescription:
-    return JobDescription(
-        role_title=payload.role_title,
-        company_name=payload.company_name,
-        canonical_text=payload.canonical_text,
-        required_skills=list(payload.required_skills),
-        preferred_skills=list(payload.preferred_skills),
-    )
+def _require_owner(owner_id: int, current_user: User) -> None:
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your resumes")
+
+
+async def _invalidate_analytics(
+    cache: AbstractAnalyticsCache | None, owner_ids: list[int]
+) -> None:
+    if cache is not None:
+        await cache.invalidate(owner_ids)
+
+
+def _parse_fields(fields: str | None) -> list[str]:
+    if fields is None:
+        return list(_LISTABLE_FIELDS)
+    requested = {item.strip() for item in fields.split(",") if item.strip()}
+    unknown = requested.difference(_LISTABLE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return [name for name in _LISTABLE_FIELDS if name == "id" or name in requested]
+
+
+def _encode_cursor(resume: Resume) -> str:
+    payload = json.dumps([resume.created_at.isoformat(), resume.id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        created_at, resume_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(resume_id)
+    except (ValueError, TypeError) as exc:
+        detail = "Invalid cursor"
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail) from exc
+
+
+def _extraction_http_error(exc: ExtractionError) -> HTTPException:
+    if isinstance(exc, ExtractionQueueFullError):
+        return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
+    if isinstance(exc, ExtractionTimeoutError):
+        return HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(exc))
+    return HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
 
 
 def _to_resume_read(resume: Resume) -> ResumeRead:
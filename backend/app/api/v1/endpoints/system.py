@@ -0,0 +1,30 @@
+from fastapi import APIRouter, HTTPException, status
+
+from app.infrastructure.db.pool import pool_stats
+from app.infrastructure.db.session import get_engine
+from app.schemas.system import PoolStatsResponse
+
+router = APIRouter()
+
+
+@router.get("/pool", response_model=PoolStatsResponse)
+async def get_pool_stats() -> PoolStatsResponse:
+    """Connection pool usage of the worker process that serves the request."""
+    stats = pool_stats(get_engine())
+    if stats is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Pool is not instrumented"
+        )
+    return PoolStatsResponse(
+        size=stats.size,
+        checked_out=stats.checked_out,
+        checked_in=stats.checked_in,
+        overflow=stats.overflow,
+        checkouts=stats.checkouts,
+        timeouts=stats.timeouts,
+        total_wait_seconds=stats.total_wait_seconds,
+        max_wait_seconds=stats.max_wait_seconds,
+        average_wait_seconds=round(stats.total_wait_seconds / stats.checkouts, 6)
+        if stats.checkouts
+        else 0.0,
+    )
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Iterable
+
+from app.schemas.analytics import AnalyticsSummary
+
+
+class AbstractAnalyticsCache(ABC):
+    @abstractmethod
+    async def get_or_compute(
+        self, owner_id: int, compute: Callable[[], Awaitable[AnalyticsSummary]]
+    ) -> AnalyticsSummary:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, owner_ids: Iterable[int]) -> None:  # pragma: no cover
+        """Drop cached summaries; call after the transaction changing the owners commits."""
+        raise NotImplementedError
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+class ExtractionError(ValueError):
+    pass
+
+
+class ExtractionTimeoutError(ExtractionError):
+    pass
+
+
+class ExtractionQueueFullError(ExtractionError):
+    pass
+
+
+@dataclass(slots=True)
+class ExtractedDocument:
+    text: str
+    skills: list[str] = field(default_factory=list)
+    keywords: list[str] = field(default_factory=list)
+
+
+class AbstractDocumentExtractor(ABC):
+    @abstractmethod
+    async def extract(self, path: Path) -> ExtractedDocument:  # pragma: no cover
+        raise NotImplementedError
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+
+@dataclass(slots=True)
+class StoredFile:
+    key: str
+    size: int
+    sha256: str
+    # Resumes currently referencing the object; a fresh upload has none.
+    references: int
+
+
+class AbstractFileStorage(ABC):
+    """Content-addressed file store: identical bytes share one object and a reference count.
+
+    Storing bytes takes no reference. Each resume row referencing an object holds one, taken
+    with ``acquire`` when the row is created and dropped with ``release`` once it is deleted.
+    Objects are never deleted directly: an object without references is removed by
+    ``collect_unreferenced`` once a grace period has passed since it was last stored or
+    released, so a concurrent upload of the same bytes can still take a reference to it.
+    """
+
+    @abstractmethod
+    async def put(
+        self, source: BinaryIO, *, suffix: str, max_bytes: int, chunk_size: int
+    ) -> StoredFile:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    async def acquire(self, key: str, count: int = 1) -> int:  # pragma: no cover
+        """Add ``count`` references; returns the references held, 0 if the object is gone."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(self, key: str) -> int:  # pragma: no cover - interface method
+        """Drop one reference and restart the grace period; returns the references left."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def collect_unreferenced(
+        self, *, older_than_seconds: float
+    ) -> list[str]:  # pragma: no cover - interface method
+        """Delete objects without references last stored or released before the cut-off.
+
+        Returns the deleted keys.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def public_url(self, key: str) -> str:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    def key_from_url(self, url: str) -> str | None:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    def local_copy(self, key: str) -> AbstractAsyncContextManager[Path]:  # pragma: no cover
+        """Yield a local filesystem path holding the object's bytes for the duration."""
+        raise NotImplementedError
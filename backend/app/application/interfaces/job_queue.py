@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+
+from app.domain.entities.job import Job
+
+
+class AbstractJobQueue(ABC):
+    """Hands submitted jobs to workers and keeps each job's status and result for polling."""
+
+    @abstractmethod
+    async def submit(self, job: Job) -> Job:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Job | None:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim(self, timeout_seconds: float) -> Job | None:  # pragma: no cover
+        """Wait up to ``timeout_seconds`` for the next queued job and mark it running."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, job: Job) -> None:  # pragma: no cover - interface method
+        """Store the progress of a claimed job."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def finish(self, job: Job) -> None:  # pragma: no cover - interface method
+        """Store the final state of a claimed job and release it."""
+        raise NotImplementedError
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Mapping
+
+
+class AbstractKeywordIndex(ABC):
+    """Per-owner inverted indexes from keyword and skill terms to resume ids.
+
+    An owner's index is loaded from their stored terms on first use and kept up to date by
+    ``add`` and ``remove`` as their resumes change. Indexes may be evicted at any time.
+    """
+
+    @abstractmethod
+    def top_k(
+        self, owner_id: int, weights: Mapping[str, float], k: int
+    ) -> list[tuple[int, float]] | None:  # pragma: no cover - interface method
+        """The ``k`` best ``(resume_id, score)`` pairs, or ``None`` if the owner is not loaded.
+
+        A resume scores the summed weight of the query terms it contains; equal scores keep
+        the lower resume id first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(
+        self, owner_id: int, entries: Iterable[tuple[int, Iterable[str]]]
+    ) -> None:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(
+        self, owner_id: int, resume_id: int, terms: Iterable[str]
+    ) -> None:  # pragma: no cover - interface method
+        """Index or re-index one resume; ignored while the owner is not loaded."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, owner_id: int, resume_id: int) -> None:  # pragma: no cover
+        raise NotImplementedError
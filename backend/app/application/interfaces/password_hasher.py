@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+
+class PasswordHasherBusyError(RuntimeError):
+    pass
+
+
+class AbstractPasswordHasher(ABC):
+    @abstractmethod
+    async def hash(self, password: str) -> str:  # pragma: no cover
+        raise NotImplementedError
+
+    @abstractmethod
+    async def verify(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:  # pragma: no cover
+        """Return whether the password matches and, if the hash is outdated, a replacement."""
+        raise NotImplementedError
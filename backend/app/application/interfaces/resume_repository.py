@@ -1,22 +1,67 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from datetime import datetime
+from typing import Iterable, Sequence
 
 from app.domain.entities.resume import Resume
 
 
 class AbstractResumeRepository(ABC):
+    """Resume storage. Lookups given an ``owner_id`` treat other owners' resumes as missing."""
+
     @abstractmethod
     async def add(self, resume: Resume) -> Resume:  # pragma: no cover - interface method
         raise NotImplementedError
 
     @abstractmethod
-    async def get(self, resume_id: int) -> Resume | None:  # pragma: no cover - interface method
+    async def add_many(
+        self, resumes: Sequence[Resume]
+    ) -> list[Resume]:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(
+        self, resume_id: int, *, owner_id: int | None = None
+    ) -> Resume | None:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(
+        self, resume_ids: Sequence[int], *, owner_id: int | None = None
+    ) -> Iterable[Resume]:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_for_owner(
+        self,
+        owner_id: int,
+        *,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        include_text: bool = True,
+    ) -> list[Resume]:  # pragma: no cover - interface method
+        """Newest first; ``after`` is the ``(created_at, id)`` of the last resume already seen."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_terms_for_owner(
+        self, owner_id: int
+    ) -> Iterable[tuple[int, list[str]]]:  # pragma: no cover - interface method
         raise NotImplementedError
 
     @abstractmethod
-    async def list_for_owner(self, owner_id: int) -> Iterable[Resume]:  # pragma: no cover
+    async def update_extraction(
+        self,
+        resume_id: int,
+        *,
+        parsed_text: str,
+        extracted_skills: list[str],
+        extracted_keywords: list[str],
+    ) -> Resume | None:  # pragma: no cover - interface method
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, resume_id: int) -> None:  # pragma: no cover - interface method
+    async def delete(
+        self, resume_id: int, *, owner_id: int | None = None
+    ) -> Resume | None:  # pragma: no cover - interface method
+        """Delete the resume and return it as it was, or ``None`` if it did not exist."""
         raise NotImplementedError
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Mapping, Sequence
+
+from app.domain.entities.score_card import ScoreCard
+
+
+class AbstractScoreCache(ABC):
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> list[ScoreCard | None]:  # pragma: no cover
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, ScoreCard]) -> None:  # pragma: no cover
+        raise NotImplementedError
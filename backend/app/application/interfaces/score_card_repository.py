@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Mapping, Sequence
+
+from app.domain.entities.score_card import ScoreCard
+
+
+class AbstractScoreCardRepository(ABC):
+    @abstractmethod
+    async def add_many(
+        self, score_cards: Sequence[ScoreCard]
+    ) -> list[ScoreCard]:  # pragma: no cover - interface method
+        raise NotImplementedError
+
+    @abstractmethod
+    async def latest_matching(
+        self, fingerprints: Mapping[int, str]
+    ) -> dict[int, ScoreCard]:  # pragma: no cover - interface method
+        """Return the newest card per resume id whose fingerprint equals the one given."""
+        raise NotImplementedError
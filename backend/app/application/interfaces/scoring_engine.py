@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Sequence
+
+from app.domain.entities.resume import Resume
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from app.application.services.resume_scoring import JobFeatures
+
+
+class AbstractScoringEngine(ABC):
+    """Computes raw overlap counts for a whole batch of resumes at once.
+
+    ``overlap_counts`` returns two ``len(resumes) x len(job_features)`` matrices: the number of
+    job keywords present in each resume's normalized ``resume_keywords`` and the clipped term
+    overlap with each job text. Columns for a missing job description are zero.
+    """
+
+    min_batch_size: int = 1
+
+    @abstractmethod
+    def overlap_counts(
+        self,
+        resumes: Sequence[Resume],
+        resume_keywords: Sequence[set[str]],
+        job_features: Sequence[JobFeatures | None],
+    ) -> tuple[list[list[int]], list[list[int]]]:  # pragma: no cover - interface method
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractSkillMatcher(ABC):
+    """Finds known skills in free text and maps their aliases onto one canonical name."""
+
+    # Changes whenever the taxonomy does, so scores computed with another one are not reused.
+    version: str = ""
+
+    @abstractmethod
+    def find(self, text: str | None) -> list[str]:  # pragma: no cover - interface method
+        """Canonical names of every skill mentioned in ``text``, in order of first mention."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def canonicalize(self, term: str) -> str:  # pragma: no cover - interface method
+        """The canonical name when ``term`` is a known skill or alias, else ``term`` lowercased."""
+        raise NotImplementedError
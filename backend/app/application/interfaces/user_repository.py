@@ -8,6 +8,16 @@ class AbstractUserRepository(ABC):
     async def get_by_email(self, email: str) -> User | None:  # pragma: no cover
         raise NotImplementedError
 
+    @abstractmethod
+    async def get(self, user_id: int) -> User | None:  # pragma: no cover
+        raise NotImplementedError
+
     @abstractmethod
     async def add(self, user: User) -> User:  # pragma: no cover
         raise NotImplementedError
+
+    @abstractmethod
+    async def update_password(
+        self, user_id: int, hashed_password: str
+    ) -> None:  # pragma: no cover
+        raise NotImplementedError
@@ -1,67 +1,100 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import TableValuedAlias
 
+from app.application.interfaces.analytics_cache import AbstractAnalyticsCache
 from app.infrastructure.db import models
 from app.schemas.analytics import AnalyticsSummary, KeywordFrequency, ScoreTrendPoint
 
+TOP_KEYWORDS = 20
+
 
 class AnalyticsService:
-    def __init__(self, session: AsyncSession) -> None:
+    """Owner analytics computed with aggregate queries; row data never leaves the database."""
+
+    def __init__(self, session: AsyncSession, cache: AbstractAnalyticsCache | None = None) -> None:
         self._session = session
+        self._cache = cache
 
     async def summary_for_owner(self, owner_id: int) -> AnalyticsSummary:
-        resumes = await self._fetch_resumes(owner_id)
-        score_cards = await self._fetch_score_cards(owner_id)
-        total_resumes = len(resumes)
-        average_score = (
-            sum(card.overall_score for card in score_cards) / len(score_cards)
-            if score_cards
-            else 0.0
-        )
-        keyword_counter = Counter()
-        for resume in resumes:
-            keyword_counter.update(resume.extracted_keywords or [])
-        keywords = [KeywordFrequency(keyword=key, count=count) for key, count in keyword_counter.most_common(20)]
-        score_trends = self._build_score_trends(score_cards)
+        if self._cache is None:
+            return await self._compute_summary(owner_id)
+        return await self._cache.get_or_compute(owner_id, lambda: self._compute_summary(owner_id))
+
+    async def _compute_summary(self, owner_id: int) -> AnalyticsSummary:
+        total_resumes, average_score = await self._fetch_totals(owner_id)
         return AnalyticsSummary(
             total_resumes=total_resumes,
             average_score=round(average_score, 2),
-            keywords=keywords,
-            score_trends=score_trends,
+            keywords=await self._fetch_keywords(owner_id),
+            score_trends=await self._fetch_score_trends(owner_id),
+        )
+
+    async def _fetch_totals(self, owner_id: int) -> tuple[int, float]:
+        total = (
+            select(func.count(models.ResumeModel.id))
+            .where(models.ResumeModel.owner_id == owner_id)
+            .scalar_subquery()
+        )
+        average = (
+            select(func.avg(models.ScoreCardModel.overall_score))
+            .join(models.ResumeModel, models.ScoreCardModel.resume_id == models.ResumeModel.id)
+            .where(models.ResumeModel.owner_id == owner_id)
+            .scalar_subquery()
         )
+        row = (await self._session.execute(select(total, average))).one()
+        return int(row[0] or 0), float(row[1] or 0.0)
 
-    async def _fetch_resumes(self, owner_id: int) -> list[models.ResumeModel]:
+    async def _fetch_keywords(self, owner_id: int) -> list[KeywordFrequency]:
+        elements = self._json_elements(models.ResumeModel.extracted_keywords)
+        keyword = elements.c.value
         result = await self._session.execute(
-            select(models.ResumeModel).where(models.ResumeModel.owner_id == owner_id)
+            select(keyword, func.count().label("occurrences"))
+            .select_from(models.ResumeModel)
+            .join(elements, true())
+            .where(models.ResumeModel.owner_id == owner_id)
+            .group_by(keyword)
+            .order_by(func.count().desc(), keyword)
+            .limit(TOP_KEYWORDS)
         )
-        return list(result.scalars().all())
+        return [KeywordFrequency(keyword=row[0], count=row[1]) for row in result]
 
-    async def _fetch_score_cards(self, owner_id: int) -> list[models.ScoreCardModel]:
+    async def _fetch_score_trends(self, owner_id: int) -> list[ScoreTrendPoint]:
+        day = func.date(models.ScoreCardModel.generated_at)
         result = await self._session.execute(
-            select(models.ScoreCardModel)
+            select(
+                day.label("day"),
+                func.avg(models.ScoreCardModel.overall_score),
+                func.count(models.ScoreCardModel.id),
+            )
             .join(models.ResumeModel, models.ScoreCardModel.resume_id == models.ResumeModel.id)
             .where(models.ResumeModel.owner_id == owner_id)
+            .group_by(day)
+            .order_by(day)
         )
-        return list(result.scalars().all())
-
-    def _build_score_trends(self, score_cards: list[models.ScoreCardModel]) -> list[ScoreTrendPoint]:
-        buckets: defaultdict[str, list[models.ScoreCardModel]] = defaultdict(list)
-        for card in score_cards:
-            day = (card.generated_at or datetime.utcnow()).strftime("%Y-%m-%d")
-            buckets[day].append(card)
-        trend_points: list[ScoreTrendPoint] = []
-        for day, cards in sorted(buckets.items()):
-            average = sum(card.overall_score for card in cards) / len(cards)
-            trend_points.append(
-                ScoreTrendPoint(
-                    date=datetime.fromisoformat(day),
-                    average_score=round(average, 2),
-                    submissions=len(cards),
-                )
+        return [
+            ScoreTrendPoint(
+                date=_as_datetime(row[0]),
+                average_score=round(float(row[1]), 2),
+                submissions=row[2],
             )
-        return trend_points
+            for row in result
+        ]
+
+    def _json_elements(self, column: Any) -> TableValuedAlias:
+        """Expand a JSON array column into rows; both dialects treat it as an implicit LATERAL."""
+        if self._session.get_bind().dialect.name == "sqlite":
+            return func.json_each(column).table_valued("value")
+        return func.json_array_elements_text(column).table_valued("value")
+
+
+def _as_datetime(value: date | str) -> datetime:
+    # PostgreSQL returns a ``date``; SQLite's date() returns an ISO string.
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.combine(value, datetime.min.time())
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+
+from pydantic import ValidationError
+
+from app.application.interfaces.resume_repository import AbstractResumeRepository
+from app.application.interfaces.skill_matcher import AbstractSkillMatcher
+from app.application.services.resume_scoring import ResumeScoringService, tag_taxonomy_skills
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.schemas.resume import ResumeCreate
+
+MAX_RECORD_BYTES = 4 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class RecordError:
+    line: int
+    error: str
+
+
+@dataclass(slots=True)
+class ImportBatch:
+    """One flushed batch; ``checkpoint`` is the number of input lines it accounts for."""
+
+    checkpoint: int
+    imported: list[Resume] = field(default_factory=list)
+    scored: int = 0
+    errors: list[RecordError] = field(default_factory=list)
+
+
+async def split_lines(
+    chunks: AsyncIterable[bytes], *, max_line_bytes: int = MAX_RECORD_BYTES
+) -> AsyncIterator[bytes]:
+    """Yield newline-delimited lines from a byte stream without buffering more than one line.
+
+    Lines longer than ``max_line_bytes`` are yielded cut to ``max_line_bytes + 1`` bytes so the
+    consumer can reject them while the remainder is skipped.
+    """
+    buffer = bytearray()
+    overflow = False
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            if not overflow:
+                buffer += chunk[start:end]
+            yield bytes(buffer[: max_line_bytes + 1])
+            buffer.clear()
+            overflow = False
+            start = end + 1
+        if not overflow:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_bytes:
+                del buffer[max_line_bytes + 1 :]
+                overflow = True
+    if buffer:
+        yield bytes(buffer)
+
+
+class ResumeImportService:
+    """Import ``ResumeCreate`` NDJSON records in large batches.
+
+    :meth:`import_lines` yields after every flushed batch so the caller can commit and record
+    the batch's checkpoint; restarting with ``skip_lines`` set to the last committed checkpoint
+    resumes the import without duplicating rows. Invalid records are reported and skipped, as
+    are records for another owner when ``owner_id`` is given.
+    """
+
+    def __init__(
+        self,
+        repository: AbstractResumeRepository,
+        *,
+        scoring: ResumeScoringService | None = None,
+        skills: AbstractSkillMatcher | None = None,
+        batch_size: int,
+    ) -> None:
+        self._repository = repository
+        self._scoring = scoring
+        self._skills = skills
+        self._batch_size = batch_size
+
+    async def import_lines(
+        self,
+        lines: AsyncIterable[bytes],
+        *,
+        skip_lines: int = 0,
+        score: bool = False,
+        job_description: JobDescription | None = None,
+        owner_id: int | None = None,
+    ) -> AsyncIterator[ImportBatch]:
+        if score and self._scoring is None:
+            raise ValueError("Scoring is not available for this import")
+        pending: list[Resume] = []
+        errors: list[RecordError] = []
+        line_number = checkpoint = 0
+        async for raw in lines:
+            line_number += 1
+            if line_number <= skip_lines or not raw.strip():
+                continue
+            try:
+                pending.append(self._parse(raw, owner_id))
+            except ValueError as exc:
+                errors.append(RecordError(line=line_number, error=str(exc)))
+                continue
+            if len(pending) >= self._batch_size:
+                yield await self._flush(pending, errors, line_number, score, job_description)
+                pending, errors, checkpoint = [], [], line_number
+        if line_number > max(checkpoint, skip_lines):
+            yield await self._flush(pending, errors, line_number, score, job_description)
+
+    async def _flush(
+        self,
+        pending: list[Resume],
+        errors: list[RecordError],
+        checkpoint: int,
+        score: bool,
+        job_description: JobDescription | None,
+    ) -> ImportBatch:
+        imported = await self._repository.add_many(pending)
+        scored = 0
+        if score and imported and self._scoring is not None:
+            scored = len(
+                await self._scoring.score_stored(resumes=imported, job_description=job_description)
+            )
+        return ImportBatch(checkpoint=checkpoint, imported=imported, scored=scored, errors=errors)
+
+    def _parse(self, raw: bytes, owner_id: int | None) -> Resume:
+        if len(raw) > MAX_RECORD_BYTES:
+            raise ValueError(f"Record exceeds {MAX_RECORD_BYTES} bytes")
+        try:
+            record = ResumeCreate.model_validate_json(raw)
+        except ValidationError as exc:
+            raise ValueError(
+                "; ".join(
+                    f"{'.'.join(map(str, item['loc'])) or 'record'}: {item['msg']}"
+                    for item in exc.errors()
+                )
+            ) from None
+        if owner_id is not None and record.owner_id != owner_id:
+            raise ValueError("owner_id: not the importing user")
+        return tag_taxonomy_skills(record.to_entity(), self._skills)
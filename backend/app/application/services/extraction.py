@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from app.application.interfaces.document_extractor import (
+    AbstractDocumentExtractor,
+    ExtractedDocument,
+    ExtractionError,
+)
+from app.application.interfaces.file_storage import AbstractFileStorage
+from app.application.interfaces.resume_repository import AbstractResumeRepository
+from app.application.interfaces.skill_matcher import AbstractSkillMatcher
+from app.application.services.resume_scoring import tag_taxonomy_skills
+from app.domain.entities.resume import Resume
+
+
+class ResumeExtractionService:
+    def __init__(
+        self,
+        repository: AbstractResumeRepository,
+        storage: AbstractFileStorage,
+        extractor: AbstractDocumentExtractor,
+        skills: AbstractSkillMatcher | None = None,
+    ) -> None:
+        self._repository = repository
+        self._storage = storage
+        self._extractor = extractor
+        self._skills = skills
+
+    async def extract_file(self, file_url: str) -> ExtractedDocument:
+        key = self._storage.key_from_url(file_url)
+        if key is None:
+            raise ExtractionError("Only files uploaded to this service can be extracted")
+        try:
+            async with self._storage.local_copy(key) as path:
+                return await self._extractor.extract(path)
+        except FileNotFoundError as exc:
+            raise ExtractionError("Uploaded file no longer exists") from exc
+
+    async def complete(self, resume: Resume) -> Resume:
+        """Derive text, skills and keywords the client did not supply from the uploaded file.
+
+        Files stored elsewhere are left alone and the resume is scored without text, as before
+        extraction existed. Taxonomy skills are tagged here: for supplied text in this process,
+        for extracted text by the extraction worker.
+        """
+        if resume.parsed_text:
+            return tag_taxonomy_skills(resume, self._skills)
+        if self._storage.key_from_url(resume.file_url) is None:
+            return resume
+        extracted = await self.extract_file(resume.file_url)
+        resume.parsed_text = extracted.text
+        resume.extracted_keywords = resume.extracted_keywords or extracted.keywords
+        if not resume.extracted_skills:
+            resume.extracted_skills = extracted.skills
+            return resume
+        return tag_taxonomy_skills(resume, self._skills)
+
+    async def reextract(self, resume_id: int, *, owner_id: int | None = None) -> Resume | None:
+        """Re-derive a stored resume's text, skills and keywords and write them back."""
+        resume = await self._repository.get(resume_id, owner_id=owner_id)
+        if resume is None:
+            return None
+        extracted = await self.extract_file(resume.file_url)
+        return await self._repository.update_extraction(
+            resume_id,
+            parsed_text=extracted.text,
+            extracted_skills=extracted.skills,
+            extracted_keywords=extracted.keywords,
+        )
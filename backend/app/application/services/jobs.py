@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Mapping
+
+from loguru import logger
+from tenacity import (
+    AsyncRetrying,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.application.interfaces.job_queue import AbstractJobQueue
+from app.domain.entities.job import Job, JobStatus
+
+JobHandler = Callable[[Job], Awaitable[dict[str, Any]]]
+
+
+class JobWorker:
+    """Claims queued jobs and runs at most ``concurrency`` of them at a time.
+
+    A job is claimed only once a slot is free, so a busy worker leaves queued jobs to other
+    workers instead of hoarding them. Failures are retried with exponential back-off up to
+    ``max_attempts``; a ``ValueError`` means the input is invalid and fails the job at once.
+    """
+
+    def __init__(
+        self,
+        queue: AbstractJobQueue,
+        handlers: Mapping[str, JobHandler],
+        *,
+        concurrency: int,
+        max_attempts: int,
+        retry_initial_seconds: float,
+        retry_max_seconds: float,
+        poll_seconds: float = 1.0,
+    ) -> None:
+        self._queue = queue
+        self._handlers = handlers
+        self._slots = asyncio.Semaphore(concurrency)
+        self._max_attempts = max_attempts
+        self._retry_initial_seconds = retry_initial_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._poll_seconds = poll_seconds
+        self._running: set[asyncio.Task[Job]] = set()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Process jobs until ``stop`` is set, then wait for the jobs already started."""
+        try:
+            while not stop.is_set():
+                await self._slots.acquire()
+                try:
+                    job = await self._queue.claim(self._poll_seconds)
+                except Exception:
+                    self._slots.release()
+                    logger.exception("Claiming a job failed")
+                    await asyncio.sleep(self._poll_seconds)
+                    continue
+                if job is None:
+                    self._slots.release()
+                    continue
+                task = asyncio.create_task(self.execute(job))
+                self._running.add(task)
+                task.add_done_callback(self._finished)
+        finally:
+            if self._running:
+                await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def execute(self, job: Job) -> Job:
+        handler = self._handlers.get(job.kind)
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job kind: {job.kind}")
+            retrying = AsyncRetrying(
+                stop=stop_after_attempt(self._max_attempts),
+                wait=wait_exponential(
+                    multiplier=self._retry_initial_seconds, max=self._retry_max_seconds
+                ),
+                retry=retry_if_not_exception_type(ValueError),
+                reraise=True,
+            )
+            async for attempt in retrying:
+                with attempt:
+                    job.attempts += 1
+                    job.updated_at = datetime.utcnow()
+                    await self._queue.save(job)
+                    job.result = await handler(job)
+        except Exception as exc:
+            logger.warning("Job {} ({}) failed: {}", job.id, job.kind, exc)
+            job.status = JobStatus.FAILED
+            job.error = str(exc) or type(exc).__name__
+        else:
+            job.status = JobStatus.SUCCEEDED
+            job.error = None
+        job.updated_at = datetime.utcnow()
+        await self._queue.finish(job)
+        return job
+
+    def _finished(self, task: asyncio.Task[Job]) -> None:
+        self._running.discard(task)
+        self._slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            logger.opt(exception=task.exception()).error("Recording a job's outcome failed")
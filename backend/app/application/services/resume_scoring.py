@@ -1,21 +1,131 @@
 from __future__ import annotations
 
-from collections import Counter
-from typing import Iterable
+import asyncio
+import hashlib
+import heapq
+import time
+from dataclasses import dataclass
+from typing import AsyncGenerator, Iterable, Mapping, Sequence
 
+from app.application.interfaces.keyword_index import AbstractKeywordIndex
 from app.application.interfaces.resume_repository import AbstractResumeRepository
+from app.application.interfaces.score_card_repository import AbstractScoreCardRepository
+from app.application.interfaces.score_cache import AbstractScoreCache
+from app.application.interfaces.scoring_engine import AbstractScoringEngine
+from app.application.interfaces.skill_matcher import AbstractSkillMatcher
+from app.core.metrics import SCORING_STAGE_SECONDS
 from app.domain.entities.job_description import JobDescription
 from app.domain.entities.resume import Resume
 from app.domain.entities.score_card import ScoreCard
+from app.domain.terms import term_frequencies
 
 KEYWORD_WEIGHT = 0.5
 FORMATTING_WEIGHT = 0.2
 EXPERIENCE_WEIGHT = 0.3
 
+# Bump whenever the scoring formulas change so cached score cards are not served.
+SCORING_REVISION = 4
+
+_KEYWORD_STAGE = SCORING_STAGE_SECONDS.labels("keyword")
+_FORMATTING_STAGE = SCORING_STAGE_SECONDS.labels("formatting")
+_EXPERIENCE_STAGE = SCORING_STAGE_SECONDS.labels("experience")
+_RECOMMENDATIONS_STAGE = SCORING_STAGE_SECONDS.labels("recommendations")
+_OVERLAP_STAGE = SCORING_STAGE_SECONDS.labels("vectorized_overlap")
+
+
+def scoring_version(skills_version: str = "") -> str:
+    components = (
+        SCORING_REVISION,
+        KEYWORD_WEIGHT,
+        FORMATTING_WEIGHT,
+        EXPERIENCE_WEIGHT,
+        skills_version,
+    )
+    return hashlib.sha256(repr(components).encode()).hexdigest()[:12]
+
+
+def resume_fingerprint(resume: Resume) -> str:
+    digest = hashlib.sha256((resume.parsed_text or "").encode())
+    digest.update(b"\0" + "\x1f".join(resume.extracted_keywords or []).encode())
+    digest.update(b"\0" + "\x1f".join(resume.extracted_skills or []).encode())
+    return digest.hexdigest()
+
+
+def job_fingerprint(job_description: JobDescription | None) -> str:
+    if job_description is None:
+        return "none"
+    digest = hashlib.sha256((job_description.canonical_text or "").encode())
+    digest.update(b"\0" + "\x1f".join(job_description.required_skills).encode())
+    digest.update(b"\0" + "\x1f".join(job_description.preferred_skills).encode())
+    return digest.hexdigest()
+
+
+def tag_taxonomy_skills(resume: Resume, skills: AbstractSkillMatcher | None) -> Resume:
+    """Append the taxonomy skills the text mentions that ``extracted_skills`` does not list.
+
+    Runs once where a resume's text arrives; scoring and the keyword index then read the
+    stored skills rather than scanning the text again.
+    """
+    if skills is None or not resume.parsed_text:
+        return resume
+    known = {skills.canonicalize(item) for item in resume.extracted_skills}
+    found = [skill for skill in skills.find(resume.parsed_text) if skill not in known]
+    resume.extracted_skills = [*resume.extracted_skills, *found]
+    return resume
+
+
+def resume_term_frequencies(resume: Resume) -> Mapping[str, int]:
+    """Stored term frequencies, tokenizing the text only for resumes that predate them."""
+    if resume.term_frequencies is not None:
+        return resume.term_frequencies
+    return term_frequencies(resume.parsed_text)
+
+
+def score_fingerprint(
+    resume: Resume, job_description: JobDescription | None, *, version: str
+) -> str:
+    """Identify every input of a score card so a stored card can be reused verbatim."""
+    components = (version, resume_fingerprint(resume), job_fingerprint(job_description))
+    return hashlib.sha256(":".join(components).encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class JobFeatures:
+    """Job description terms derived once and reused for every resume it is scored against."""
+
+    job_description: JobDescription
+    keywords: set[str]
+    role_terms: Mapping[str, int]
+    role_term_total: int
+
+
+@dataclass(slots=True)
+class ResumeFeatures:
+    """Resume terms derived once and reused for every job description it is scored against."""
+
+    resume: Resume
+    keywords: set[str]
+    terms: Mapping[str, int]
+
 
 class ResumeScoringService:
-    def __init__(self, repository: AbstractResumeRepository) -> None:
+    def __init__(
+        self,
+        repository: AbstractResumeRepository,
+        cache: AbstractScoreCache | None = None,
+        engine: AbstractScoringEngine | None = None,
+        index: AbstractKeywordIndex | None = None,
+        score_cards: AbstractScoreCardRepository | None = None,
+        skills: AbstractSkillMatcher | None = None,
+    ) -> None:
         self._repository = repository
+        self._cache = cache
+        self._engine = engine
+        self._index = index
+        self._score_cards = score_cards
+        self._skills = skills
+        self._canonicalize = skills.canonicalize if skills else str.lower
+        self._skills_version = skills.version if skills else ""
 
     async def score_existing_resume(
         self, *, resume_id: int, job_description: JobDescription | None
@@ -23,34 +133,340 @@ class ResumeScoringService:
         resume = await self._repository.get(resume_id)
         if resume is None:
             raise ValueError("Resume not found")
-        return self._build_score_card(resume=resume, job_description=job_description)
+        [(_, score_card)], _ = await self._rescore([resume], job_description)
+        return score_card
 
     async def upload_and_score(
         self, *, resume: Resume, job_description: JobDescription | None
     ) -> tuple[Resume, ScoreCard]:
         stored = await self._repository.add(resume)
-        score_card = self._build_score_card(resume=stored, job_description=job_description)
+        [[score_card]] = await self._score_matrix([stored], [job_description])
+        [score_card] = await self._persist([stored], job_description, [score_card])
         return stored, score_card
 
+    async def rescore(
+        self,
+        *,
+        resume_ids: Sequence[int],
+        job_description: JobDescription | None,
+        owner_id: int | None = None,
+    ) -> tuple[list[tuple[Resume, ScoreCard]], list[int]]:
+        """Score stored resumes, reusing their latest stored card when no input has changed.
+
+        Returns each requested resume with its card, in request order, and the ids whose card
+        was reused. With ``owner_id``, other owners' resumes count as not found.
+        """
+        resumes = await self._fetch_resumes(resume_ids, owner_id)
+        return await self._rescore(resumes, job_description)
+
+    async def score_stored(
+        self, *, resumes: Sequence[Resume], job_description: JobDescription | None
+    ) -> list[ScoreCard]:
+        """Score and persist cards for resumes the caller has already stored and loaded."""
+        scored, _ = await self._rescore(resumes, job_description)
+        return [score_card for _, score_card in scored]
+
+    async def _rescore(
+        self, resumes: Sequence[Resume], job_description: JobDescription | None
+    ) -> tuple[list[tuple[Resume, ScoreCard]], list[int]]:
+        version = scoring_version(self._skills_version)
+        fingerprints = {
+            resume.id or 0: score_fingerprint(resume, job_description, version=version)
+            for resume in resumes
+        }
+        stored: dict[int, ScoreCard] = {}
+        if self._score_cards is not None:
+            stored = await self._score_cards.latest_matching(fingerprints)
+        unique = {resume.id or 0: resume for resume in resumes}
+        pending = [resume for resume_id, resume in unique.items() if resume_id not in stored]
+        matrix = await self._score_matrix(pending, [job_description])
+        fresh = await self._persist(pending, job_description, [row[0] for row in matrix])
+        scored = {**stored, **{card.resume_id: card for card in fresh}}
+        return [(resume, scored[resume.id or 0]) for resume in resumes], list(stored)
+
+    async def _persist(
+        self,
+        resumes: Sequence[Resume],
+        job_description: JobDescription | None,
+        score_cards: Sequence[ScoreCard],
+    ) -> list[ScoreCard]:
+        if self._score_cards is None or not score_cards:
+            return list(score_cards)
+        for resume, score_card in zip(resumes, score_cards):
+            score_card.fingerprint = score_fingerprint(
+                resume, job_description, version=scoring_version(self._skills_version)
+            )
+        return await self._score_cards.add_many(score_cards)
+
+    async def score_batch(
+        self,
+        *,
+        resumes: Sequence[Resume] = (),
+        resume_ids: Sequence[int] = (),
+        job_descriptions: Sequence[JobDescription],
+        owner_id: int | None = None,
+    ) -> tuple[list[Resume], list[list[ScoreCard]]]:
+        """Score every resume against every job description.
+
+        Inline ``resumes`` come first, followed by the stored ``resume_ids`` in request order;
+        with ``owner_id``, other owners' stored resumes count as not found. Returns the scored
+        resumes and the matrix where ``matrix[i][j]`` is resume ``i`` scored against job
+        description ``j``.
+        """
+        stored = await self._fetch_resumes(resume_ids, owner_id)
+        candidates = [*self._tag_inline(resumes), *stored]
+        return candidates, await self._score_matrix(candidates, job_descriptions)
+
+    async def stream_batch(
+        self,
+        *,
+        resumes: Sequence[Resume] = (),
+        resume_ids: Sequence[int] = (),
+        job_descriptions: Sequence[JobDescription],
+        first_chunk: int,
+        max_chunk: int,
+        owner_id: int | None = None,
+    ) -> AsyncGenerator[tuple[int, list[ScoreCard]], None]:
+        """Like ``score_batch``, but yield each resume's index and row as its chunk is scored.
+
+        Stored resumes are fetched here, so unknown ids raise before anything is streamed.
+        Chunks start at ``first_chunk`` rows and double up to ``max_chunk``. Nothing is scored
+        ahead of the consumer: a slow reader slows scoring down and one that stops iterating
+        stops it.
+        """
+        stored = await self._fetch_resumes(resume_ids, owner_id)
+        candidates = [*self._tag_inline(resumes), *stored]
+        return self._stream_matrix(candidates, job_descriptions, first_chunk, max_chunk)
+
+    def _tag_inline(self, resumes: Sequence[Resume]) -> list[Resume]:
+        # Inline resumes are never stored, so this request is where their text arrives.
+        return [tag_taxonomy_skills(resume, self._skills) for resume in resumes]
+
+    async def _stream_matrix(
+        self,
+        resumes: Sequence[Resume],
+        job_descriptions: Sequence[JobDescription],
+        first_chunk: int,
+        max_chunk: int,
+    ) -> AsyncGenerator[tuple[int, list[ScoreCard]], None]:
+        start, size = 0, max(1, first_chunk)
+        while start < len(resumes):
+            chunk = resumes[start : start + size]
+            for offset, row in enumerate(await self._score_matrix(chunk, job_descriptions)):
+                yield start + offset, row
+            start += len(chunk)
+            size = max(size, min(size * 2, max_chunk))
+            # Scoring never awaits, so yield to the loop to let a disconnect cancel the rest.
+            await asyncio.sleep(0)
+
+    async def rank_candidates(
+        self, *, owner_id: int, job_description: JobDescription, limit: int
+    ) -> list[tuple[Resume, ScoreCard]]:
+        """Return the owner's ``limit`` best resumes for a job, best first.
+
+        Candidates are ranked by how many job skills appear in their keywords or skills using
+        the owner's inverted index, so only the postings of the job's skills are read; just
+        the winners are loaded and fully scored.
+        """
+        keywords = self._collect_job_keywords(job_description)
+        if not keywords:
+            raise ValueError("Job description has no skills to rank by")
+        hits = await self._top_k(owner_id, keywords, limit)
+        found = {
+            item.id: item
+            for item in await self._repository.get_many(
+                [resume_id for resume_id, _ in hits], owner_id=owner_id
+            )
+        }
+        # Rows deleted by another worker may linger in this process's index until it expires.
+        resumes = [found[resume_id] for resume_id, _ in hits if resume_id in found]
+        matrix = await self._score_matrix(resumes, [job_description])
+        return [(resume, row[0]) for resume, row in zip(resumes, matrix)]
+
+    async def _top_k(
+        self, owner_id: int, keywords: set[str], limit: int
+    ) -> list[tuple[int, float]]:
+        weights = dict.fromkeys(keywords, 1.0)
+        hits = self._index.top_k(owner_id, weights, limit) if self._index else None
+        if hits is not None:
+            return hits
+        entries = await self._repository.list_terms_for_owner(owner_id)
+        if self._index is not None:
+            self._index.load(owner_id, entries)
+            return self._index.top_k(owner_id, weights, limit) or []
+        # Without an index, count the matches of every resume the owner has.
+        counts = ((len(keywords & self._normalize(terms)), -item) for item, terms in entries)
+        best = heapq.nlargest(limit, (count for count in counts if count[0]))
+        return [(-negated_id, float(matches)) for matches, negated_id in best]
+
+    async def _score_matrix(
+        self, resumes: Sequence[Resume], job_descriptions: Sequence[JobDescription | None]
+    ) -> list[list[ScoreCard]]:
+        """Score every pair, serving cached cards and computing only rows with a miss."""
+        width = len(job_descriptions)
+        keys: list[str] = []
+        cached: list[ScoreCard | None] = [None] * (len(resumes) * width)
+        if self._cache:
+            keys = self._cache_keys(resumes, job_descriptions)
+            cached = await self._cache.get_many(keys)
+        pending = [
+            row_index
+            for row_index in range(len(resumes))
+            if None in cached[row_index * width : (row_index + 1) * width]
+        ]
+        pending_resumes = [resumes[index] for index in pending]
+        fresh = dict(zip(pending, self._compute_matrix(pending_resumes, job_descriptions)))
+        computed: dict[str, ScoreCard] = {}
+        matrix: list[list[ScoreCard]] = []
+        for row_index, resume in enumerate(resumes):
+            row: list[ScoreCard] = []
+            for column, job_description in enumerate(job_descriptions):
+                hit = cached[row_index * width + column]
+                if hit is not None:
+                    row.append(self._from_cached(hit, resume, job_description))
+                    continue
+                score_card = fresh[row_index][column]
+                if keys:
+                    computed[keys[row_index * width + column]] = score_card
+                row.append(score_card)
+            matrix.append(row)
+        if self._cache and computed:
+            await self._cache.set_many(computed)
+        return matrix
+
+    def _compute_matrix(
+        self, resumes: Sequence[Resume], job_descriptions: Sequence[JobDescription | None]
+    ) -> list[list[ScoreCard]]:
+        if not resumes:
+            return []
+        job_features = [
+            self._job_features(item) if item is not None else None for item in job_descriptions
+        ]
+        if self._engine is not None and len(resumes) >= self._engine.min_batch_size:
+            return self._compute_vectorized(resumes, job_features)
+        return [
+            [self._score_features(resume_features, features) for features in job_features]
+            for resume_features in map(self._resume_features, resumes)
+        ]
+
+    def _compute_vectorized(
+        self, resumes: Sequence[Resume], job_features: Sequence[JobFeatures | None]
+    ) -> list[list[ScoreCard]]:
+        assert self._engine is not None
+        started = time.perf_counter()
+        keyword_overlap, term_overlap = self._engine.overlap_counts(
+            resumes, [self._resume_keywords(resume) for resume in resumes], job_features
+        )
+        _OVERLAP_STAGE.observe(time.perf_counter() - started)
+        matrix: list[list[ScoreCard]] = []
+        for row_index, resume in enumerate(resumes):
+            formatting_score = self._estimate_formatting_score(resume)
+            matrix.append(
+                [
+                    self._assemble_score_card(
+                        resume,
+                        features,
+                        keyword_score=self._keyword_score(
+                            keyword_overlap[row_index][column], features
+                        ),
+                        formatting_score=formatting_score,
+                        experience_score=self._experience_score(
+                            term_overlap[row_index][column], features
+                        ),
+                    )
+                    for column, features in enumerate(job_features)
+                ]
+            )
+        return matrix
+
+    def _cache_keys(
+        self, resumes: Sequence[Resume], job_descriptions: Sequence[JobDescription | None]
+    ) -> list[str]:
+        version = scoring_version(self._skills_version)
+        job_hashes = [job_fingerprint(item) for item in job_descriptions]
+        return [
+            f"score:{version}:{resume_hash}:{job_hash}"
+            for resume_hash in map(resume_fingerprint, resumes)
+            for job_hash in job_hashes
+        ]
+
+    def _from_cached(
+        self, score_card: ScoreCard, resume: Resume, job_description: JobDescription | None
+    ) -> ScoreCard:
+        return ScoreCard(
+            resume_id=resume.id or 0,
+            job_description_id=job_description.id if job_description else None,
+            ats_score=score_card.ats_score,
+            keyword_match=score_card.keyword_match,
+            formatting_score=score_card.formatting_score,
+            overall_score=score_card.overall_score,
+            recommendations=list(score_card.recommendations),
+        )
+
+    async def _fetch_resumes(
+        self, resume_ids: Sequence[int], owner_id: int | None
+    ) -> list[Resume]:
+        if not resume_ids:
+            return []
+        found = {
+            item.id: item
+            for item in await self._repository.get_many(resume_ids, owner_id=owner_id)
+        }
+        missing = [resume_id for resume_id in resume_ids if resume_id not in found]
+        if missing:
+            raise ValueError(f"Resumes not found: {', '.join(map(str, missing))}")
+        return [found[resume_id] for resume_id in resume_ids]
+
     def _build_score_card(
         self, *, resume: Resume, job_description: JobDescription | None
     ) -> ScoreCard:
-        keyword_score = self._calculate_keyword_score(resume, job_description)
-        formatting_score = self._estimate_formatting_score(resume)
-        experience_score = self._estimate_experience_alignment(resume, job_description)
+        job_features = self._job_features(job_description) if job_description else None
+        return self._score_features(self._resume_features(resume), job_features)
+
+    def _score_features(
+        self, resume_features: ResumeFeatures, job_features: JobFeatures | None
+    ) -> ScoreCard:
+        started = time.perf_counter()
+        keyword_score = self._calculate_keyword_score(resume_features, job_features)
+        keyword_done = time.perf_counter()
+        formatting_score = self._estimate_formatting_score(resume_features.resume)
+        formatting_done = time.perf_counter()
+        experience_score = self._estimate_experience_alignment(resume_features, job_features)
+        _KEYWORD_STAGE.observe(keyword_done - started)
+        _FORMATTING_STAGE.observe(formatting_done - keyword_done)
+        _EXPERIENCE_STAGE.observe(time.perf_counter() - formatting_done)
+        return self._assemble_score_card(
+            resume_features.resume,
+            job_features,
+            keyword_score=keyword_score,
+            formatting_score=formatting_score,
+            experience_score=experience_score,
+        )
+
+    def _assemble_score_card(
+        self,
+        resume: Resume,
+        job_features: JobFeatures | None,
+        *,
+        keyword_score: float,
+        formatting_score: float,
+        experience_score: float,
+    ) -> ScoreCard:
         overall = (
             keyword_score * KEYWORD_WEIGHT
             + formatting_score * FORMATTING_WEIGHT
             + experience_score * EXPERIENCE_WEIGHT
         )
+        started = time.perf_counter()
         recommendations = self._collect_recommendations(
             keyword_score=keyword_score,
             formatting_score=formatting_score,
             experience_score=experience_score,
         )
+        _RECOMMENDATIONS_STAGE.observe(time.perf_counter() - started)
         return ScoreCard(
             resume_id=resume.id or 0,
-            job_description_id=job_description.id if job_description else None,
+            job_description_id=job_features.job_description.id if job_features else None,
             ats_score=overall,
             keyword_match=keyword_score,
             formatting_score=formatting_score,
@@ -58,23 +474,49 @@ class ResumeScoringService:
             recommendations=recommendations,
         )
 
+    def _job_features(self, job_description: JobDescription) -> JobFeatures:
+        role_terms = term_frequencies(job_description.canonical_text)
+        return JobFeatures(
+            job_description=job_description,
+            keywords=self._collect_job_keywords(job_description),
+            role_terms=role_terms,
+            role_term_total=sum(role_terms.values()),
+        )
+
+    def _resume_features(self, resume: Resume) -> ResumeFeatures:
+        return ResumeFeatures(
+            resume=resume,
+            keywords=self._resume_keywords(resume),
+            terms=resume_term_frequencies(resume),
+        )
+
+    def _resume_keywords(self, resume: Resume) -> set[str]:
+        """Stored keywords and skills with aliases resolved, the same terms the index ranks by."""
+        return self._normalize(
+            [*(resume.extracted_keywords or []), *(resume.extracted_skills or [])]
+        )
+
+    def _normalize(self, terms: Iterable[str]) -> set[str]:
+        return {self._canonicalize(term.strip().lower()) for term in terms if term.strip()}
+
     def _calculate_keyword_score(
-        self, resume: Resume, job_description: JobDescription | None
+        self, resume_features: ResumeFeatures, job_features: JobFeatures | None
     ) -> float:
-        if not job_description:
+        overlap = len(resume_features.keywords & job_features.keywords) if job_features else 0
+        return self._keyword_score(overlap, job_features)
+
+    def _keyword_score(self, overlap: int, job_features: JobFeatures | None) -> float:
+        if not job_features:
             return 0.5
-        resume_keywords = set(map(str.lower, resume.extracted_keywords or []))
-        description_keywords = self._collect_job_keywords(job_description)
-        if not description_keywords:
+        if not job_features.keywords:
             return 0.6
-        overlap = resume_keywords & description_keywords
-        return round(len(overlap) / len(description_keywords), 4)
+        return round(overlap / len(job_features.keywords), 4)
 
     def _collect_job_keywords(self, job_description: JobDescription) -> set[str]:
         aggregated: Iterable[str] = (
             list(job_description.required_skills) + list(job_description.preferred_skills)
         )
-        return {item.lower() for item in aggregated if item}
+        return {self._canonicalize(item) for item in aggregated if item}
 
     def _estimate_formatting_score(self, resume: Resume) -> float:
         if not resume.parsed_text:
@@ -89,17 +531,23 @@ class ResumeScoringService:
         return 0.4
 
     def _estimate_experience_alignment(
-        self, resume: Resume, job_description: JobDescription | None
+        self, resume_features: ResumeFeatures, job_features: JobFeatures | None
     ) -> float:
-        if not job_description:
+        if not job_features:
+            return 0.5
+        resume_terms = resume_features.terms
+        overlap = sum(
+            min(resume_terms.get(token, 0), count)
+            for token, count in job_features.role_terms.items()
+        )
+        return self._experience_score(overlap, job_features)
+
+    def _experience_score(self, overlap: int, job_features: JobFeatures | None) -> float:
+        if not job_features:
             return 0.5
-        resume_terms = Counter(word.lower() for word in (resume.parsed_text or "").split())
-        role_terms = Counter(word.lower() for word in (job_description.canonical_text or "").split())
-        if not role_terms:
+        if not job_features.role_terms:
             return 0.55
-        overlap = sum(min(resume_terms[token], role_terms[token]) for token in role_terms)
-        max_possible = sum(role_terms.values())
-        return round(overlap / max_possible, 4)
+        return round(overlap / job_features.role_term_total, 4)
 
     def _collect_recommendations(
         self, *, keyword_score: float, formatting_score: float, experience_score: float
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any, AsyncContextManager, Callable
+
+from app.application.interfaces.analytics_cache import AbstractAnalyticsCache
+from app.application.services.jobs import JobHandler
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.job import Job
+from app.schemas.resume import (
+    BatchScoreRequest,
+    BatchScoreResponse,
+    RescoreRequest,
+    RescoreResponse,
+    ScoreCardResponse,
+)
+
+BATCH_SCORE_JOB = "batch_score"
+RESCORE_JOB = "rescore"
+
+ScoringUnitOfWork = Callable[[], AsyncContextManager[ResumeScoringService]]
+
+
+class ScoringJobHandlers:
+    """Runs the queued counterparts of ``/resumes/score/batch`` and ``/resumes/rescore``.
+
+    ``scoring`` yields a service bound to a fresh database session and commits when the block
+    exits cleanly, so every attempt of a retried job starts from a clean transaction.
+    Payloads are the endpoints' request bodies and results their response bodies. Stored
+    resumes are looked up as the job's owner, so other owners' resumes fail the job as not found.
+    """
+
+    def __init__(
+        self, scoring: ScoringUnitOfWork, analytics_cache: AbstractAnalyticsCache | None = None
+    ) -> None:
+        self._scoring = scoring
+        self._analytics_cache = analytics_cache
+
+    def handlers(self) -> dict[str, JobHandler]:
+        return {BATCH_SCORE_JOB: self.batch_score, RESCORE_JOB: self.rescore}
+
+    async def batch_score(self, job: Job) -> dict[str, Any]:
+        request = BatchScoreRequest.model_validate(job.payload)
+        async with self._scoring() as service:
+            resumes, matrix = await service.score_batch(
+                resumes=[item.to_entity() for item in request.resumes],
+                resume_ids=request.resume_ids,
+                job_descriptions=[item.to_entity() for item in request.job_descriptions],
+                owner_id=job.owner_id,
+            )
+        return BatchScoreResponse(
+            resume_ids=[resume.id or 0 for resume in resumes],
+            results=[[ScoreCardResponse.from_entity(card) for card in row] for row in matrix],
+        ).model_dump(mode="json")
+
+    async def rescore(self, job: Job) -> dict[str, Any]:
+        request = RescoreRequest.model_validate(job.payload)
+        job_description = request.job_description.to_entity() if request.job_description else None
+        async with self._scoring() as service:
+            scored, reused = await service.rescore(
+                resume_ids=request.resume_ids,
+                job_description=job_description,
+                owner_id=job.owner_id,
+            )
+        if self._analytics_cache is not None:
+            reused_ids = set(reused)
+            await self._analytics_cache.invalidate(
+                [resume.owner_id for resume, _ in scored if resume.id not in reused_ids]
+            )
+        return RescoreResponse(
+            results=[ScoreCardResponse.from_entity(card) for _, card in scored],
+            reused_resume_ids=reused,
+        ).model_dump(mode="json")
@@ -0,0 +1,48 @@
+"""Compile the skill taxonomy into the automaton file workers memory-map at startup.
+
+    python -m app.cli.compile_skills
+    python -m app.cli.compile_skills --taxonomy skills.json --output storage/skills.automaton
+
+Running it before the server starts means no worker has to compile the taxonomy itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from app.core.config import get_settings
+from app.infrastructure.skills.automaton import (
+    DEFAULT_TAXONOMY_PATH,
+    SkillAutomaton,
+    compile_taxonomy,
+    read_taxonomy,
+    write_compiled,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--taxonomy",
+        type=Path,
+        default=Path(settings.skill_taxonomy_path or DEFAULT_TAXONOMY_PATH),
+        help="JSON object mapping each canonical skill to its aliases",
+    )
+    parser.add_argument("--output", type=Path, default=Path(settings.skill_automaton_path))
+    args = parser.parse_args(argv)
+
+    compiled = compile_taxonomy(read_taxonomy(args.taxonomy))
+    write_compiled(args.output, compiled)
+    automaton = SkillAutomaton.open(args.output)
+    print(
+        json.dumps(
+            {"output": str(args.output), "skills": len(automaton), "bytes": len(compiled)}
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
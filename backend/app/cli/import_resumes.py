@@ -0,0 +1,121 @@
+"""Bulk-import NDJSON ``ResumeCreate`` records straight into the database.
+
+    python -m app.cli.import_resumes resumes.ndjson --checkpoint resumes.checkpoint --score
+
+The checkpoint file is rewritten after every committed batch; rerunning the same command
+after an interruption continues from the last committed line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from app.api.dependencies import (
+    get_analytics_cache,
+    get_file_storage,
+    get_keyword_index,
+    get_score_cache,
+    get_scoring_engine,
+    get_skill_matcher,
+)
+from app.application.services.bulk_import import ResumeImportService, split_lines
+from app.application.services.resume_scoring import ResumeScoringService
+from app.core.config import get_settings
+from app.infrastructure.db.session import dispose_engine, session_factory
+from app.infrastructure.repositories.resume_repository import ResumeRepository
+from app.infrastructure.repositories.score_card_repository import ScoreCardRepository
+
+_READ_CHUNK_BYTES = 1024 * 1024
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as handle:
+        while chunk := await asyncio.to_thread(handle.read, _READ_CHUNK_BYTES):
+            yield chunk
+
+
+def _load_checkpoint(checkpoint: Path, source: Path) -> int:
+    if not checkpoint.exists():
+        return 0
+    state = json.loads(checkpoint.read_text())
+    if state.get("source") != str(source):
+        raise SystemExit(f"{checkpoint} belongs to {state.get('source')}, not {source}")
+    return int(state["checkpoint"])
+
+
+def _save_checkpoint(checkpoint: Path, source: Path, line: int) -> None:
+    staging = checkpoint.with_name(f"{checkpoint.name}.tmp")
+    staging.write_text(json.dumps({"source": str(source), "checkpoint": line}))
+    os.replace(staging, checkpoint)
+
+
+async def run(
+    source: Path, *, checkpoint: Path | None, score: bool, batch_size: int
+) -> dict[str, int]:
+    source = source.resolve()
+    skip_lines = _load_checkpoint(checkpoint, source) if checkpoint else 0
+    totals = {"imported": 0, "scored": 0, "failed": 0, "checkpoint": skip_lines}
+    analytics_cache = get_analytics_cache()
+    async with session_factory()() as session:
+        repository = ResumeRepository(
+            session, index=get_keyword_index(), storage=get_file_storage()
+        )
+        skills = get_skill_matcher()
+        scoring = ResumeScoringService(
+            repository,
+            cache=get_score_cache(),
+            engine=get_scoring_engine(),
+            score_cards=ScoreCardRepository(session),
+            skills=skills,
+        )
+        importer = ResumeImportService(
+            repository, scoring=scoring, skills=skills, batch_size=batch_size
+        )
+        async for batch in importer.import_lines(
+            split_lines(_read_chunks(source)), skip_lines=skip_lines, score=score
+        ):
+            await session.commit()
+            if checkpoint:
+                _save_checkpoint(checkpoint, source, batch.checkpoint)
+            if analytics_cache is not None:
+                await analytics_cache.invalidate(item.owner_id for item in batch.imported)
+            for error in batch.errors:
+                print(f"line {error.line}: {error.error}", file=sys.stderr)
+            totals["imported"] += len(batch.imported)
+            totals["scored"] += batch.scored
+            totals["failed"] += len(batch.errors)
+            totals["checkpoint"] = batch.checkpoint
+            print(json.dumps(totals), file=sys.stderr)
+    return totals
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=Path, help="NDJSON file of ResumeCreate records")
+    parser.add_argument("--checkpoint", type=Path, help="file recording committed progress")
+    parser.add_argument("--score", action="store_true", help="score resumes as they import")
+    parser.add_argument("--batch-size", type=int, default=get_settings().import_batch_size)
+    args = parser.parse_args(argv)
+
+    async def _main() -> dict[str, int]:
+        try:
+            return await run(
+                args.source,
+                checkpoint=args.checkpoint,
+                score=args.score,
+                batch_size=args.batch_size,
+            )
+        finally:
+            await dispose_engine()
+
+    print(json.dumps(asyncio.run(_main())))
+
+
+if __name__ == "__main__":
+    main()
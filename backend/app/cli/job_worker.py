@@ -0,0 +1,131 @@
+"""Run scoring job workers against the Redis job queue.
+
+    python -m app.cli.job_worker --processes 2 --concurrency 4
+    python -m app.cli.job_worker --requeue-unfinished
+
+SIGINT or SIGTERM stops claiming new jobs and lets the running ones finish. With several
+processes, one that dies before it was asked to stop is started again. Jobs left claimed by a
+worker that was killed outright stay in the processing list; ``--requeue-unfinished`` puts them
+back and must only run while no worker is up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import signal
+import sys
+import time
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+from loguru import logger
+
+from app.api.dependencies import build_job_worker, get_job_queue, get_skill_matcher
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.infrastructure.db.session import dispose_engine
+from app.infrastructure.jobs.redis_queue import RedisJobQueue
+
+# A worker that dies sooner than this after starting is restarted after a pause, so a worker
+# failing at startup does not spin.
+_MIN_WORKER_SECONDS = 5.0
+
+
+def _redis_queue() -> RedisJobQueue:
+    queue = get_job_queue()
+    if not isinstance(queue, RedisJobQueue):
+        sys.exit("JOB_QUEUE_BACKEND=memory runs jobs inside the API process; use redis here")
+    return queue
+
+
+async def _serve(concurrency: int) -> None:
+    worker = build_job_worker(_redis_queue(), concurrency=concurrency)
+    get_skill_matcher()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    logger.info("Job worker started with {} slots", concurrency)
+    try:
+        await worker.run(stop)
+    finally:
+        await dispose_engine()
+    logger.info("Job worker stopped")
+
+
+def _run_process(concurrency: int) -> None:
+    setup_logging()
+    asyncio.run(_serve(concurrency))
+
+
+class _Supervisor:
+    """Keep ``count`` worker processes running until SIGINT or SIGTERM."""
+
+    def __init__(self, count: int, concurrency: int) -> None:
+        self._count = count
+        self._concurrency = concurrency
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: dict[int, tuple[BaseProcess, float]] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        for index in range(self._count):
+            self._start(index)
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGTERM, self._stop)
+        while self._processes:
+            wait([process.sentinel for process, _ in self._processes.values()])
+            self._reap()
+
+    def _start(self, index: int) -> None:
+        process = self._context.Process(
+            target=_run_process, args=(self._concurrency,), name=f"job-worker-{index}"
+        )
+        process.start()
+        self._processes[index] = (process, time.monotonic())
+
+    def _stop(self, signum: int, frame: FrameType | None) -> None:
+        self._stopping = True
+        # Children share the terminal's process group, so a Ctrl-C has reached them already.
+        if signum == signal.SIGTERM:
+            for process, _ in self._processes.values():
+                process.terminate()
+
+    def _reap(self) -> None:
+        for index, (process, started) in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            del self._processes[index]
+            if self._stopping:
+                continue
+            logger.warning("{} exited with status {}", process.name, process.exitcode)
+            if time.monotonic() - started < _MIN_WORKER_SECONDS:
+                time.sleep(1.0)
+            self._start(index)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=get_settings().job_worker_concurrency)
+    parser.add_argument("--requeue-unfinished", action="store_true")
+    args = parser.parse_args()
+
+    if args.requeue_unfinished:
+        moved = asyncio.run(_redis_queue().requeue_unfinished())
+        print(f"Requeued {moved} unfinished jobs")
+        return
+    if args.processes <= 1:
+        _run_process(args.concurrency)
+        return
+
+    _Supervisor(args.processes, args.concurrency).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Delete uploaded files that no resume references once their grace period has passed.
+
+    python -m app.cli.prune_uploads
+    python -m app.cli.prune_uploads --older-than 3600
+
+An upload takes no reference until a resume is created for it, and releasing the last
+reference leaves the file in place, so unused files would otherwise stay forever. The grace
+period leaves clients time to create the resume after uploading. Run it periodically, e.g.
+from cron.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+from app.api.dependencies import get_file_storage
+from app.core.config import get_settings
+
+
+def main(argv: list[str] | None = None) -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--older-than",
+        type=float,
+        default=settings.upload_orphan_grace_seconds,
+        help="seconds since an unreferenced file was last uploaded or released",
+    )
+    args = parser.parse_args(argv)
+
+    collected = asyncio.run(
+        get_file_storage().collect_unreferenced(older_than_seconds=args.older_than)
+    )
+    print(json.dumps({"deleted": len(collected), "keys": collected}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Serve the API from several uvicorn workers forked from one preloaded parent.
+
+    python -m app.cli.serve --workers 4 --host 0.0.0.0 --port 8000
+
+The parent binds the socket, imports the application and builds the read-only scoring data
+(the mapped skill automaton and the numeric libraries behind the sparse engine) before it
+forks. It then freezes the garbage collector, so those objects stay on pages every worker
+shares copy-on-write. Database pools, caches and executors are created lazily inside each
+worker after the fork.
+
+Signals to the parent:
+
+- SIGTERM or SIGINT stops every worker gracefully and exits.
+- SIGHUP reloads the skill taxonomy, forks a fresh set of workers and then stops the old ones
+  gracefully, so the socket keeps being served throughout. Workers run the parent's code, so
+  code changes still need a full restart.
+- SIGUSR1 logs each worker's memory: resident, proportional (PSS) and private (USS).
+
+Workers that exit on their own are replaced.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import os
+import signal
+import socket
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.infrastructure.db.session import dispose_engine, get_engine
+
+_HANDLED = {signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGUSR1, signal.SIGCHLD}
+# Workers dying sooner than this after being forked are restarted with a delay, so a worker
+# that cannot start (say, the database is down) is not forked in a tight loop.
+_MIN_WORKER_SECONDS = 5.0
+
+
+def preload_scoring_data() -> None:
+    """Build the scoring data that stays read-only for the lifetime of a worker."""
+    from app.api.dependencies import get_scoring_engine, get_skill_matcher
+
+    get_skill_matcher()
+    engine = get_scoring_engine()
+    if engine is not None:
+        engine.preload()
+
+
+async def create_tables() -> None:
+    from app.infrastructure.db import models  # noqa: F401 - registers the model metadata
+    from app.infrastructure.db.base import Base
+
+    async with get_engine().begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    await dispose_engine()
+
+
+def worker_memory(pid: int) -> dict[str, int]:
+    """Resident, proportional-share, shared and private bytes of ``pid`` (Linux only)."""
+    fields: dict[str, int] = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value, *_ = line.split()
+        fields[name.rstrip(":")] = int(value) * 1024
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "shared": fields["Shared_Clean"] + fields["Shared_Dirty"],
+        "private": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    return sock
+
+
+class PreforkServer:
+    def __init__(
+        self,
+        sock: socket.socket,
+        *,
+        workers: int,
+        graceful_timeout_seconds: int,
+        preload: bool = True,
+    ) -> None:
+        self._socket = sock
+        self._count = workers
+        self._graceful_timeout_seconds = graceful_timeout_seconds
+        self._preload = preload
+        self._workers: dict[int, float] = {}  # pid -> fork time
+        self._retiring: set[int] = set()
+
+    def run(self) -> None:
+        # Signals are taken synchronously from the mask, so there are no handler races.
+        signal.pthread_sigmask(signal.SIG_BLOCK, _HANDLED)
+        if get_settings().db_create_all:
+            # Once here, so workers starting together do not race to create the same tables.
+            asyncio.run(create_tables())
+        if self._preload:
+            from app.main import app  # noqa: F401
+
+            preload_scoring_data()
+            self._freeze()
+        for _ in range(self._count):
+            self._spawn()
+        logger.info("Serving with {} workers (preload={})", self._count, self._preload)
+        while True:
+            received = signal.sigtimedwait(_HANDLED, 1.0)
+            signum = received.si_signo if received is not None else None
+            if signum in (signal.SIGTERM, signal.SIGINT):
+                self._stop()
+                return
+            if signum == signal.SIGHUP:
+                self._reload()
+            elif signum == signal.SIGUSR1:
+                self._log_memory()
+            self._reap()
+
+    def _spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                # Out of the terminal's process group, a Ctrl-C reaches workers only as the
+                # parent's single SIGTERM; a second signal would make uvicorn exit at once.
+                os.setpgid(0, 0)
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, _HANDLED)
+                self._serve()
+            except BaseException:
+                logger.exception("Worker {} crashed", os.getpid())
+                os._exit(1)
+            os._exit(0)
+        self._workers[pid] = time.monotonic()
+        return pid
+
+    def _serve(self) -> None:
+        import uvicorn
+
+        from app.main import app
+
+        config = uvicorn.Config(app, timeout_graceful_shutdown=self._graceful_timeout_seconds)
+        uvicorn.Server(config).run(sockets=[self._socket])
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            if pid in self._retiring:
+                self._retiring.discard(pid)
+                continue
+            started = self._workers.pop(pid, None)
+            if started is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            logger.warning("Worker {} exited with status {}", pid, code)
+            if time.monotonic() - started < _MIN_WORKER_SECONDS:
+                time.sleep(1.0)
+            self._spawn()
+
+    def _reload(self) -> None:
+        from app.api.dependencies import get_skill_matcher
+
+        previous = list(self._workers)
+        if self._preload:
+            get_skill_matcher.cache_clear()
+            preload_scoring_data()
+            self._freeze()
+        for _ in range(self._count):
+            self._spawn()
+        for pid in previous:
+            del self._workers[pid]
+            self._retiring.add(pid)
+            self._signal(pid, signal.SIGTERM)
+        logger.info("Reloaded: {} workers replaced", len(previous))
+
+    def _stop(self) -> None:
+        self._retiring.update(self._workers)
+        self._workers.clear()
+        for pid in self._retiring:
+            self._signal(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self._graceful_timeout_seconds + 5
+        while self._retiring and time.monotonic() < deadline:
+            signal.sigtimedwait({signal.SIGCHLD}, 0.5)
+            self._reap()
+        for pid in self._retiring:
+            self._signal(pid, signal.SIGKILL)
+        logger.info("All workers stopped")
+
+    def _log_memory(self) -> None:
+        for pid in self._workers:
+            try:
+                memory = worker_memory(pid)
+            except OSError:
+                continue
+            logger.info(
+                "Worker {}: rss {:.1f} MiB, pss {:.1f} MiB, private {:.1f} MiB",
+                pid,
+                *(memory[name] / 2**20 for name in ("rss", "pss", "private")),
+            )
+
+    @staticmethod
+    def _signal(pid: int, signum: int) -> None:
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def _freeze() -> None:
+        # Untracked by the collector, preloaded objects are never written to by a collection,
+        # which would otherwise copy their pages into every worker.
+        gc.collect()
+        gc.freeze()
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--workers", type=int, default=settings.web_workers)
+    parser.add_argument(
+        "--graceful-timeout", type=int, default=settings.web_graceful_timeout_seconds
+    )
+    parser.add_argument(
+        "--no-preload",
+        dest="preload",
+        action="store_false",
+        help="let every worker import the app itself (for memory comparisons)",
+    )
+    args = parser.parse_args()
+    if args.workers > 1 and settings.job_queue_backend == "memory":
+        # Each worker would keep its own queue, so a job could not be polled from the others.
+        parser.error("JOB_QUEUE_BACKEND=memory needs a single worker; use the redis backend")
+
+    setup_logging()
+    if args.workers > 1 and settings.metrics_enabled:
+        logger.warning(
+            "Metrics are per worker and each scrape reaches one of {}; run one worker per "
+            "scrape target for complete metrics",
+            args.workers,
+        )
+    with bind_socket(args.host, args.port, args.backlog) as sock:
+        PreforkServer(
+            sock,
+            workers=max(1, args.workers),
+            graceful_timeout_seconds=args.graceful_timeout,
+            preload=args.preload,
+        ).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import List
+from typing import List, Literal
 
 from pydantic import AnyHttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,14 +16,45 @@ class Settings(BaseSettings):
     refresh_token_expire_minutes: int = 60 * 24 * 7
     algorithm: str = "HS256"
 
+    # Full SQLAlchemy async URL; overrides the postgres_* settings below when set, e.g.
+    # ``sqlite+aiosqlite:///./ats.db`` to run without a PostgreSQL server.
+    database_url: str | None = None
     postgres_host: str = "localhost"
     postgres_port: int = 5432
     postgres_user: str = "postgres"
     postgres_password: str = "postgres"
     postgres_db: str = "ats"
 
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 10.0
+    db_pool_recycle_seconds: int = 30 * 60
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+    db_pool_warmup_connections: int = 2
+    # Deployments migrate with ``alembic upgrade head``; enable for throwaway SQLite databases.
+    db_create_all: bool = False
+
     redis_url: str = "redis://localhost:6379/0"
 
+    score_cache_enabled: bool = True
+    score_cache_redis_enabled: bool = True
+    score_cache_max_entries: int = 10_000
+    score_cache_ttl_seconds: int = 60 * 60
+
+    analytics_cache_enabled: bool = True
+    analytics_cache_retention_seconds: int = 24 * 60 * 60
+
+    scoring_engine: Literal["python", "sparse"] = "sparse"
+    sparse_engine_min_batch: int = 256
+    # Streamed scoring starts with small chunks for a fast first result, then doubles them up
+    # to the size where the sparse engine pays off.
+    score_stream_first_chunk: int = 8
+    score_stream_max_chunk: int = 256
+
+    keyword_index_max_owners: int = 1_000
+    keyword_index_ttl_seconds: int = 5 * 60
+
     cors_allowed_origins: List[AnyHttpUrl] = [
         AnyHttpUrl("http://localhost:5173"),
         AnyHttpUrl("http://localhost:3000"),
@@ -32,9 +63,58 @@ class Settings(BaseSettings):
 
     public_base_url: AnyHttpUrl = AnyHttpUrl("http://localhost:8000")
     upload_dir: str = "storage/uploads"
+    # Staging and reference counts; kept out of the served upload_dir, on the same filesystem.
+    upload_state_dir: str = "storage/upload-state"
+    upload_orphan_grace_seconds: int = 24 * 60 * 60
+    max_upload_bytes: int = 10 * 1024 * 1024
+    upload_chunk_bytes: int = 64 * 1024
+
+    storage_backend: Literal["local", "s3"] = "local"
+    s3_bucket: str = "ats-uploads"
+    s3_endpoint_url: str | None = None
+    s3_public_base_url: str | None = None
+
+    import_batch_size: int = 1_000
+
+    extraction_workers: int = 2
+    extraction_max_pending: int = 16
+    extraction_timeout_seconds: float = 20.0
+    extraction_max_keywords: int = 40
+    # Decompressed bytes one document may expand to; guards workers against zip bombs.
+    extraction_max_expanded_bytes: int = 32 * 1024 * 1024
+
+    # Canonical skill -> aliases JSON; the packaged taxonomy when unset. The compiled automaton
+    # is rebuilt at startup whenever it no longer matches the taxonomy.
+    skill_matching_enabled: bool = True
+    skill_taxonomy_path: str | None = None
+    skill_automaton_path: str = "storage/skills.automaton"
+
+    # "memory" runs jobs inside the API process, for tests and single-process development.
+    job_queue_backend: Literal["redis", "memory"] = "redis"
+    job_worker_concurrency: int = 4
+    job_max_attempts: int = 3
+    job_retry_initial_seconds: float = 0.5
+    job_retry_max_seconds: float = 30.0
+    job_retention_seconds: int = 24 * 60 * 60
+
+    password_hash_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 8
+    token_cache_max_entries: int = 10_000
+    token_cache_ttl_seconds: float = 300.0
+    user_cache_max_entries: int = 10_000
+    user_cache_ttl_seconds: float = 30.0
 
     enable_docs: bool = True
 
+    # ``app.cli.serve`` forks this many API workers from one preloaded parent. Database pools,
+    # caches and executors are per worker, so size them for a single worker.
+    web_workers: int = 1
+    web_graceful_timeout_seconds: int = 30
+
+    metrics_enabled: bool = True
+    metrics_loop_lag_interval_seconds: float = 0.5
+
     openai_api_key: str | None = None
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
@@ -0,0 +1,256 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Instruments are plain counters guarded by nothing but the GIL: observations happen on the
+event loop, cost a bisect and two additions, and are cheap enough to leave on in production.
+Each worker process keeps its own registry, so scrape every worker individually.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import math
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Generic, Iterable, Sequence, TypeVar
+
+C = TypeVar("C")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FINE_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("_upper_bounds", "counts", "sum")
+
+    def __init__(self, upper_bounds: Sequence[float]) -> None:
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._upper_bounds, value)] += 1
+        self.sum += value
+
+
+M = TypeVar("M", _CounterChild, _GaugeChild, _HistogramChild)
+
+
+class _Metric(Generic[M]):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], M] = {}
+
+    def labels(self, *values: str) -> M:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _new_child(self) -> M:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+    def _label_text(self, values: tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for values, child in sorted(self._children.items()):
+            yield from self._render_child(values, child)
+
+    def _render_child(
+        self, values: tuple[str, ...], child: M
+    ) -> Iterable[str]:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+
+class Counter(_Metric[_CounterChild]):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def _render_child(self, values: tuple[str, ...], child: _CounterChild) -> Iterable[str]:
+        yield f"{self.name}{self._label_text(values)} {_number(child.value)}"
+
+
+class Gauge(_Metric[_GaugeChild]):
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def _render_child(self, values: tuple[str, ...], child: _GaugeChild) -> Iterable[str]:
+        yield f"{self.name}{self._label_text(values)} {_number(child.value)}"
+
+
+class Histogram(_Metric[_HistogramChild]):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def _render_child(self, values: tuple[str, ...], child: _HistogramChild) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), child.counts):
+            cumulative += count
+            le = f'le="{_number(bound)}"'
+            yield f"{self.name}_bucket{self._label_text(values, le)} {cumulative}"
+        yield f"{self.name}_sum{self._label_text(values)} {_number(child.sum)}"
+        yield f"{self.name}_count{self._label_text(values)} {cumulative}"
+
+
+MT = TypeVar("MT", bound=_Metric[Any])
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric[Any]] = {}
+
+    def register(self, metric: MT) -> MT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "Request latency by route template.", ("method", "route")
+)
+HTTP_REQUESTS_TOTAL = REGISTRY.counter(
+    "http_requests_total", "Completed requests.", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight", "Requests currently being served."
+).labels()
+EVENT_LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "event_loop_lag_seconds", "Delay between a timer's due time and when it actually ran."
+).labels()
+SCORING_STAGE_SECONDS = REGISTRY.histogram(
+    "scoring_stage_duration_seconds",
+    "Time spent in each stage of building a score card.",
+    ("stage",),
+    FINE_BUCKETS,
+)
+REPOSITORY_CALL_SECONDS = REGISTRY.histogram(
+    "repository_call_duration_seconds",
+    "Repository method latency, including the database round trip.",
+    ("repository", "method"),
+)
+DB_POOL_CONNECTIONS = REGISTRY.gauge(
+    "db_pool_connections", "Connections held by the pool, by state.", ("state",)
+)
+DB_POOL_CHECKOUTS = REGISTRY.gauge("db_pool_checkouts", "Connections handed out.").labels()
+DB_POOL_TIMEOUTS = REGISTRY.gauge("db_pool_timeouts", "Checkouts that timed out.").labels()
+DB_POOL_WAIT_SECONDS = REGISTRY.gauge(
+    "db_pool_wait_seconds", "Total time spent waiting for a connection."
+).labels()
+SCORE_CACHE_LOOKUPS = REGISTRY.gauge(
+    "score_cache_lookups", "Score card cache lookups by tier hit or miss.", ("result",)
+)
+
+
+def timed_methods(histogram: Histogram, label: str) -> Callable[[type[C]], type[C]]:
+    """Class decorator timing every public coroutine method under ``(label, method)``."""
+
+    def decorate(cls: type[C]) -> type[C]:
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.iscoroutinefunction(method):
+                continue
+            setattr(cls, name, _timed(method, histogram.labels(label, name)))
+        return cls
+
+    return decorate
+
+
+def _timed(method: Callable[..., Any], child: _HistogramChild) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            child.observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+async def monitor_event_loop_lag(interval_seconds: float) -> None:
+    """Sleep in a loop and record how late each wake-up is; runs until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        due = loop.time() + interval_seconds
+        await asyncio.sleep(interval_seconds)
+        EVENT_LOOP_LAG_SECONDS.observe(max(loop.time() - due, 0.0))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
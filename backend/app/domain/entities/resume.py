@@ -12,6 +12,8 @@ class Resume:
     parsed_text: str | None = None
     extracted_skills: List[str] = field(default_factory=list)
     extracted_keywords: List[str] = field(default_factory=list)
+    # Normalized token counts of parsed_text, computed once at ingest; None until then.
+    term_frequencies: dict[str, int] | None = None
     id: int | None = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
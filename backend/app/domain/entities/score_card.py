@@ -14,4 +14,5 @@ class ScoreCard:
     overall_score: float
     recommendations: list[str] = field(default_factory=list)
     id: int | None = None
+    fingerprint: str | None = None
     generated_at: datetime = field(default_factory=datetime.utcnow)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import string
+from collections import Counter
+
+# Leading/trailing punctuation is noise ("python," or "(sql)"), but a trailing + or # is part
+# of names such as C++ and C#.
+_EDGE_PUNCTUATION = string.punctuation.replace("+", "").replace("#", "")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Lowercase whitespace-separated tokens with surrounding punctuation stripped."""
+    if not text:
+        return []
+    tokens = (token.strip(_EDGE_PUNCTUATION) for token in text.lower().split())
+    return [token for token in tokens if token]
+
+
+def term_frequencies(text: str | None) -> dict[str, int]:
+    return dict(Counter(tokenize(text)))
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from app.application.interfaces.analytics_cache import AbstractAnalyticsCache
+from app.schemas.analytics import AnalyticsSummary
+
+_REDIS_RETRY_SECONDS = 30.0
+_POLL_SECONDS = 0.05
+
+
+class RedisAnalyticsCache(AbstractAnalyticsCache):
+    """Per-owner analytics summaries in Redis, invalidated by writes rather than by age.
+
+    Each owner has a generation counter that :meth:`invalidate` increments; summaries are
+    stored under the generation that was current when their computation started, so a
+    summary computed from data that a concurrent write has since changed is never served.
+    ``retention_seconds`` only garbage-collects entries of superseded generations.
+
+    Recomputes are collapsed twice: concurrent callers in this process await a single task,
+    and across processes the first caller takes a short Redis lock while the others poll
+    for its result, computing themselves only if it has not appeared within ``wait_seconds``.
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        *,
+        retention_seconds: int,
+        lock_seconds: float = 30.0,
+        wait_seconds: float = 5.0,
+    ) -> None:
+        self._redis = redis
+        self._retention_seconds = retention_seconds
+        self._lock_seconds = lock_seconds
+        self._wait_seconds = wait_seconds
+        self._inflight: dict[Hashable, asyncio.Task[AnalyticsSummary]] = {}
+        self._redis_retry_at = 0.0
+
+    async def get_or_compute(
+        self, owner_id: int, compute: Callable[[], Awaitable[AnalyticsSummary]]
+    ) -> AnalyticsSummary:
+        if not self._redis_available():
+            return await self._single_flight((owner_id, None), compute)
+        try:
+            generation = int(await self._redis.get(_generation_key(owner_id)) or 0)
+            payload = await self._redis.get(_summary_key(owner_id, generation))
+        except RedisError as exc:
+            self._mark_redis_failed(exc)
+            return await self._single_flight((owner_id, None), compute)
+        if payload is not None:
+            return AnalyticsSummary.model_validate_json(payload)
+        return await self._single_flight(
+            (owner_id, generation), lambda: self._fill(owner_id, generation, compute)
+        )
+
+    async def invalidate(self, owner_ids: Iterable[int]) -> None:
+        owners = set(owner_ids)
+        if not owners or self._redis is None:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for owner_id in owners:
+                    pipe.incr(_generation_key(owner_id))
+                await pipe.execute()
+        except RedisError as exc:
+            # Summaries of these owners may now be stale until the next write or until
+            # their retention lapses.
+            self._mark_redis_failed(exc)
+
+    async def _fill(
+        self,
+        owner_id: int,
+        generation: int,
+        compute: Callable[[], Awaitable[AnalyticsSummary]],
+    ) -> AnalyticsSummary:
+        key = _summary_key(owner_id, generation)
+        lock_key = f"{key}:lock"
+        try:
+            locked = await self._redis.set(lock_key, b"1", ex=self._lock_seconds, nx=True)
+            if not locked:
+                deadline = time.monotonic() + self._wait_seconds
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(_POLL_SECONDS)
+                    payload = await self._redis.get(key)
+                    if payload is not None:
+                        return AnalyticsSummary.model_validate_json(payload)
+        except RedisError as exc:
+            self._mark_redis_failed(exc)
+            return await compute()
+        summary = await compute()
+        try:
+            await self._redis.set(key, summary.model_dump_json(), ex=self._retention_seconds)
+            if locked:
+                await self._redis.delete(lock_key)
+        except RedisError as exc:
+            self._mark_redis_failed(exc)
+        return summary
+
+    async def _single_flight(
+        self, key: Hashable, factory: Callable[[], Awaitable[AnalyticsSummary]]
+    ) -> AnalyticsSummary:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled waiter must not cancel the computation the other waiters share.
+        return await asyncio.shield(task)
+
+    def _redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _mark_redis_failed(self, exc: RedisError) -> None:
+        logger.warning("Analytics cache Redis unavailable: {}", exc)
+        self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+
+
+def _generation_key(owner_id: int) -> str:
+    return f"analytics:generation:{owner_id}"
+
+
+def _summary_key(owner_id: int, generation: int) -> str:
+    return f"analytics:summary:{owner_id}:{generation}"
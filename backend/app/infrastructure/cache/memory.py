@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLLRUCache(Generic[K, V]):
+    """Bounded least-recently-used mapping whose entries also expire after ``ttl_seconds``."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """Store ``value``; ``ttl_seconds`` overrides the default lifetime for this entry."""
+        lifetime = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (self._clock() + lifetime, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class InMemoryRedis:
+    """Single-process stand-in for the subset of ``redis.asyncio.Redis`` the app relies on."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._values: dict[str, tuple[float | None, bytes]] = {}
+
+    async def get(self, name: str) -> bytes | None:
+        return self._read(name)
+
+    async def mget(self, keys: Iterable[str]) -> list[bytes | None]:
+        return [self._read(key) for key in keys]
+
+    async def set(
+        self, name: str, value: Any, ex: float | None = None, nx: bool = False
+    ) -> bool | None:
+        if nx and self._read(name) is not None:
+            return None
+        expires_at = self._clock() + ex if ex is not None else None
+        self._values[name] = (expires_at, _encode(value))
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(self._values.pop(name, None) is not None for name in names)
+
+    async def incr(self, name: str, amount: int = 1) -> int:
+        current = int(self._read(name) or 0) + amount
+        expires_at = self._values[name][0] if name in self._values else None
+        self._values[name] = (expires_at, _encode(current))
+        return current
+
+    def pipeline(self, transaction: bool = True) -> InMemoryPipeline:
+        return InMemoryPipeline(self)
+
+    async def aclose(self) -> None:
+        self._values.clear()
+
+    def _read(self, name: str) -> bytes | None:
+        entry = self._values.get(name)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._values[name]
+            return None
+        return value
+
+
+class InMemoryPipeline:
+    def __init__(self, client: InMemoryRedis) -> None:
+        self._client = client
+        self._commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, command: str) -> Callable[..., InMemoryPipeline]:
+        def queue(*args: Any, **kwargs: Any) -> InMemoryPipeline:
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        return [
+            await getattr(self._client, command)(*args, **kwargs)
+            for command, args, kwargs in commands
+        ]
+
+    async def __aenter__(self) -> InMemoryPipeline:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._commands.clear()
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+
+
+@lru_cache
+def get_redis_client() -> Redis:
+    client: Redis = Redis.from_url(get_settings().redis_url)
+    return client
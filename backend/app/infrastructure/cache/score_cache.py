@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from app.application.interfaces.score_cache import AbstractScoreCache
+from app.domain.entities.score_card import ScoreCard
+from app.infrastructure.cache.memory import TTLLRUCache
+
+_REDIS_RETRY_SECONDS = 30.0
+
+
+@dataclass(slots=True)
+class CacheStats:
+    local_hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.local_hits + self.remote_hits + self.misses
+        return (self.local_hits + self.remote_hits) / lookups if lookups else 0.0
+
+
+class TieredScoreCache(AbstractScoreCache):
+    """Score cards cached in a per-process LRU backed by a Redis tier shared across workers.
+
+    Redis errors are treated as misses and the remote tier is skipped for a short back-off
+    period so an unavailable Redis never adds a connection timeout to every request.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: int,
+        redis: Any | None = None,
+    ) -> None:
+        self._local: TTLLRUCache[str, ScoreCard] = TTLLRUCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._redis_retry_at = 0.0
+        self.stats = CacheStats()
+
+    async def get_many(self, keys: Sequence[str]) -> list[ScoreCard | None]:
+        results = [self._local.get(key) for key in keys]
+        self.stats.local_hits += sum(item is not None for item in results)
+        pending = [index for index, item in enumerate(results) if item is None]
+        redis = self._remote()
+        if pending and redis is not None:
+            try:
+                payloads = await redis.mget([keys[index] for index in pending])
+            except RedisError as exc:
+                self._mark_redis_failed(exc)
+            else:
+                for index, payload in zip(pending, payloads):
+                    if payload is None:
+                        continue
+                    card = _deserialize(payload)
+                    self._local.set(keys[index], card)
+                    results[index] = card
+                    self.stats.remote_hits += 1
+        self.stats.misses += sum(item is None for item in results)
+        return results
+
+    async def set_many(self, items: Mapping[str, ScoreCard]) -> None:
+        if not items:
+            return
+        for key, card in items.items():
+            self._local.set(key, card)
+        redis = self._remote()
+        if redis is None:
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, card in items.items():
+                    pipe.set(key, _serialize(card), ex=self._ttl_seconds)
+                await pipe.execute()
+        except RedisError as exc:
+            self._mark_redis_failed(exc)
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+    def _remote(self) -> Any | None:
+        """The Redis tier, or ``None`` when there is none or it is backing off after an error."""
+        if self._redis is None or time.monotonic() < self._redis_retry_at:
+            return None
+        return self._redis
+
+    def _mark_redis_failed(self, exc: RedisError) -> None:
+        logger.warning("Score cache Redis tier unavailable: {}", exc)
+        self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+
+
+def _serialize(card: ScoreCard) -> str:
+    return json.dumps(
+        {
+            "ats_score": card.ats_score,
+            "keyword_match": card.keyword_match,
+            "formatting_score": card.formatting_score,
+            "overall_score": card.overall_score,
+            "recommendations": list(card.recommendations),
+        }
+    )
+
+
+def _deserialize(payload: bytes | str) -> ScoreCard:
+    data = json.loads(payload)
+    return ScoreCard(resume_id=0, job_description_id=None, **data)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.db.base import Base
@@ -10,6 +10,7 @@ from app.infrastructure.db.base import Base
 
 class ResumeModel(Base):
     __tablename__ = "resumes"
+    __table_args__ = (Index("ix_resumes_owner_id_created_at_id", "owner_id", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     owner_id: Mapped[int] = mapped_column(index=True)
@@ -17,6 +18,7 @@ class ResumeModel(Base):
     parsed_text: Mapped[str | None] = mapped_column(Text(), nullable=True)
     extracted_skills: Mapped[list[str]] = mapped_column(JSON, default=list)
     extracted_keywords: Mapped[list[str]] = mapped_column(JSON, default=list)
+    term_frequencies: Mapped[dict[str, int] | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
@@ -43,7 +45,9 @@ class ScoreCardModel(Base):
     __tablename__ = "score_cards"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    resume_id: Mapped[int] = mapped_column(ForeignKey("resumes.id", ondelete="CASCADE"))
+    resume_id: Mapped[int] = mapped_column(
+        ForeignKey("resumes.id", ondelete="CASCADE"), index=True
+    )
     job_description_id: Mapped[int | None] = mapped_column(
         ForeignKey("job_descriptions.id", ondelete="SET NULL"), nullable=True
     )
@@ -52,7 +56,10 @@ class ScoreCardModel(Base):
     formatting_score: Mapped[float] = mapped_column()
     overall_score: Mapped[float] = mapped_column()
     recommendations: Mapped[list[str]] = mapped_column(JSON, default=list)
-    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    generated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow, index=True
+    )
 
     resume: Mapped[ResumeModel] = relationship(back_populates="score_cards")
     job_description: Mapped[JobDescriptionModel] = relationship(back_populates="score_cards")
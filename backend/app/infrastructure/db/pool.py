@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from loguru import logger
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass(slots=True)
+class PoolStats:
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait and how often they time out.
+
+    Wait time covers queueing for a free connection and, when the pool grows, opening a new
+    one; a rising maximum with ``checked_out`` pinned at ``size + overflow`` means the pool
+    is too small for the worker's concurrency.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self._timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self._checkouts += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            checked_in=self.checkedin(),
+            overflow=max(self.overflow(), 0),
+            checkouts=self._checkouts,
+            timeouts=self._timeouts,
+            total_wait_seconds=round(self._total_wait, 6),
+            max_wait_seconds=round(self._max_wait, 6),
+        )
+
+
+def pool_stats(engine: AsyncEngine) -> PoolStats | None:
+    pool = engine.sync_engine.pool
+    return pool.stats() if isinstance(pool, InstrumentedQueuePool) else None
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> int:
+    """Open ``connections`` pooled connections up front so early requests skip the handshake."""
+    if connections <= 0:
+        return 0
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)), return_exceptions=True
+    )
+    opened = [item for item in results if not isinstance(item, BaseException)]
+    for connection in opened:
+        await connection.close()
+    failures = [item for item in results if isinstance(item, BaseException)]
+    if failures:
+        logger.warning(
+            "Pool warmup opened {}/{} connections: {}", len(opened), connections, failures[0]
+        )
+    return len(opened)
@@ -1,21 +1,95 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.infrastructure.db.pool import InstrumentedQueuePool
+
+
+def database_url(settings: Settings) -> str:
+    if settings.database_url:
+        return settings.database_url
+    return (
+        f"postgresql+asyncpg://{settings.postgres_user}:{settings.postgres_password}"
+        f"@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_db}"
+        f"?prepared_statement_cache_size={settings.db_statement_cache_size}"
+    )
+
+
+def build_engine(settings: Settings) -> AsyncEngine:
+    url = make_url(database_url(settings))
+    options: dict[str, Any] = {}
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # Every connection to an in-memory database is a separate, empty database, so keep
+        # SQLAlchemy's single shared connection instead of a queue pool.
+        return create_async_engine(url, echo=settings.debug)
+    if url.get_driver_name() == "asyncpg":
+        # asyncpg's own cache; both must be 0 behind a transaction-pooling PgBouncer.
+        options["connect_args"] = {"statement_cache_size": settings.db_statement_cache_size}
+    engine = create_async_engine(
+        url,
+        echo=settings.debug,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        **options,
+    )
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", _configure_sqlite)
+    return engine
+
+
+def _configure_sqlite(dbapi_connection: Any, _: Any) -> None:
+    # WAL lets readers proceed during a write; writers wait for the lock instead of failing.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+# Built on first use rather than at import, so importing the app opens nothing; the app's
+# startup hook builds it before the first request.
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_engine() -> AsyncEngine:
+    global _engine, _session_factory
+    if _engine is None:
+        _engine = build_engine(get_settings())
+        _session_factory = async_sessionmaker(
+            _engine, expire_on_commit=False, class_=AsyncSession
+        )
+    return _engine
+
+
+def session_factory() -> async_sessionmaker[AsyncSession]:
+    get_engine()
+    assert _session_factory is not None
+    return _session_factory
 
-_settings = get_settings()
-_DATABASE_URL = (
-    f"postgresql+asyncpg://{_settings.postgres_user}:{_settings.postgres_password}"
-    f"@{_settings.postgres_host}:{_settings.postgres_port}/{_settings.postgres_db}"
-)
 
-engine = create_async_engine(_DATABASE_URL, echo=_settings.debug, future=True)
-SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+async def dispose_engine() -> None:
+    """Close the pool; the next ``get_engine`` call builds a fresh engine."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = _session_factory = None
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with SessionLocal() as session:
+    async with session_factory()() as session:
         yield session
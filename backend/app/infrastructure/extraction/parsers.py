@@ -0,0 +1,242 @@
+"""Resume text, skill and keyword extraction.
+
+Everything here runs inside extraction worker processes, so the module only imports the
+standard library at load time. ``pypdf`` is used for PDFs when it is installed; otherwise a
+small content-stream reader handles the common text-only PDFs produced by word processors.
+"""
+
+from __future__ import annotations
+
+import re
+import signal
+import zipfile
+import zlib
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from xml.etree import ElementTree
+
+from app.application.interfaces.document_extractor import (
+    ExtractedDocument,
+    ExtractionError,
+    ExtractionTimeoutError,
+)
+from app.infrastructure.skills.automaton import SkillAutomaton
+
+# Default cap on the bytes a document may expand to once decompressed.
+MAX_EXPANDED_BYTES = 32 * 1024 * 1024
+_WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PDF_STREAM = re.compile(rb"<<(.*?)>>\s*stream\r?\n(.*?)\r?\nendstream", re.S)
+_PDF_TEXT_OPERATOR = re.compile(
+    rb"\[(.*?)\]\s*TJ|\((.*?)(?<!\\)\)\s*(?:Tj|'|\")|(T\*|Td|TD|ET)", re.S
+)
+_PDF_STRING = re.compile(rb"\((.*?)(?<!\\)\)", re.S)
+_PDF_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+_DOC_UTF16_RUN = re.compile(rb"(?:[\x20-\x7e\r\n\t]\x00){4,}")
+_TOKEN = re.compile(r"[a-z][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+_SKILLS_HEADING = re.compile(
+    r"^\s*(?:technical\s+|core\s+|key\s+)?skills?(?:\s*(?:&|and)\s*\w+)?\s*(?::\s*(.*))?$", re.I
+)
+_SKILL_SEPARATORS = re.compile(r"[,;|•·]")
+_STOPWORDS = frozenset(
+    """
+    a about above after again all also am an and any are as at be because been before being
+    below between both but by can could did do does doing down during each etc few for from
+    further had has have having he her here hers him his how i if in into is it its itself just
+    me more most my no nor not now of off on once only or other our ours out over own same she
+    should so some such than that the their theirs them then there these they this those
+    through to too under until up very was we were what when where which while who whom why
+    will with within would you your yours using used use work worked working responsible
+    including various years year months month team teams
+    """.split()
+)
+
+# Set once per worker process by ``init_worker_skills``, the pool's initializer.
+_skill_automaton: SkillAutomaton | None = None
+
+
+def init_worker_skills(path: str) -> None:
+    global _skill_automaton
+    _skill_automaton = SkillAutomaton.open(Path(path))
+
+
+def extract_text(path: Path, *, max_expanded_bytes: int = MAX_EXPANDED_BYTES) -> str:
+    """Plain text of a resume; compressed content beyond ``max_expanded_bytes`` is rejected."""
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        return _pdf_text(path, max_expanded_bytes)
+    if suffix == ".docx":
+        return _docx_text(path, max_expanded_bytes)
+    if suffix == ".doc":
+        return _doc_text(path)
+    raise ExtractionError(f"Unsupported file type: {suffix or 'unknown'}")
+
+
+def extract_skills(text: str) -> list[str]:
+    """Collect entries listed under a "Skills" heading, either inline or on following lines."""
+    skills: dict[str, None] = {}
+    lines = text.splitlines()
+    for position, line in enumerate(lines):
+        match = _SKILLS_HEADING.match(line)
+        if match is None:
+            continue
+        section = [match.group(1) or ""]
+        for following in lines[position + 1 :]:
+            if not following.strip() or following.rstrip().endswith(":"):
+                break
+            section.append(following)
+        for entry in _SKILL_SEPARATORS.split("\n".join(section).replace("\n", ",")):
+            cleaned = entry.strip(" \t-*:.")
+            if cleaned and len(cleaned.split()) <= 4:
+                skills.setdefault(cleaned, None)
+    return list(skills)
+
+
+def with_taxonomy_skills(text: str, listed: list[str]) -> list[str]:
+    """Append taxonomy skills mentioned anywhere in the text that the listed ones miss."""
+    if _skill_automaton is None:
+        return listed
+    known = {_skill_automaton.canonicalize(item) for item in listed}
+    return listed + [skill for skill in _skill_automaton.find(text) if skill not in known]
+
+
+def extract_keywords(text: str, *, limit: int) -> list[str]:
+    counts = Counter(
+        token
+        for token in _TOKEN.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS and not token.isdigit()
+    )
+    return [token for token, _ in counts.most_common(limit)]
+
+
+def extract_document(
+    path: Path, *, max_keywords: int, max_expanded_bytes: int = MAX_EXPANDED_BYTES
+) -> ExtractedDocument:
+    text = extract_text(path, max_expanded_bytes=max_expanded_bytes)
+    return ExtractedDocument(
+        text=text,
+        skills=with_taxonomy_skills(text, extract_skills(text)),
+        keywords=extract_keywords(text, limit=max_keywords),
+    )
+
+
+def extract_document_with_timeout(
+    path: str,
+    *,
+    timeout_seconds: float,
+    max_keywords: int,
+    max_expanded_bytes: int = MAX_EXPANDED_BYTES,
+) -> ExtractedDocument:
+    """Worker-process entry point; a SIGALRM timer aborts parsing that overruns its budget."""
+
+    def _expire(signum: int, frame: FrameType | None) -> None:
+        raise ExtractionTimeoutError(f"Extraction exceeded {timeout_seconds:g}s")
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    try:
+        return extract_document(
+            Path(path), max_keywords=max_keywords, max_expanded_bytes=max_expanded_bytes
+        )
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _pdf_text(path: Path, max_expanded_bytes: int) -> str:
+    try:
+        from pypdf import PdfReader  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return _pdf_text_fallback(path.read_bytes(), max_expanded_bytes)
+    try:
+        reader = PdfReader(str(path))
+        pages = [(page.extract_text() or "").strip() for page in reader.pages]
+    except ExtractionError:
+        raise
+    except Exception as exc:
+        # pypdf reports damaged files with whatever error the broken structure leads it to.
+        raise ExtractionError("File is not a readable PDF document") from exc
+    return "\n\n".join(pages).strip()
+
+
+def _pdf_text_fallback(data: bytes, max_expanded_bytes: int = MAX_EXPANDED_BYTES) -> str:
+    if not data.startswith(b"%PDF"):
+        raise ExtractionError("File is not a PDF document")
+    lines: list[bytes] = []
+    current: list[bytes] = []
+    budget = max_expanded_bytes
+    for dictionary, stream in _PDF_STREAM.findall(data):
+        if b"/FlateDecode" in dictionary:
+            decompressor = zlib.decompressobj()
+            try:
+                stream = decompressor.decompress(stream, budget + 1)
+            except zlib.error:
+                continue
+            budget -= len(stream)
+            if budget < 0:
+                raise ExtractionError(f"PDF content expands beyond {max_expanded_bytes} bytes")
+        elif b"/Filter" in dictionary:
+            continue
+        for array, single, breaker in _PDF_TEXT_OPERATOR.findall(stream):
+            if breaker:
+                if current:
+                    lines.append(b"".join(current))
+                    current = []
+                continue
+            if single:
+                current.append(_pdf_unescape(single))
+            else:
+                current.extend(_pdf_unescape(item) for item in _PDF_STRING.findall(array))
+        if current:
+            lines.append(b"".join(current))
+            current = []
+    return "\n".join(line.decode("latin-1").strip() for line in lines if line.strip())
+
+
+def _pdf_unescape(value: bytes) -> bytes:
+    output = bytearray()
+    index = 0
+    while index < len(value):
+        byte = value[index : index + 1]
+        if byte == b"\\" and index + 1 < len(value):
+            following = value[index + 1 : index + 2]
+            octal = re.match(rb"[0-7]{1,3}", value[index + 1 : index + 4])
+            if octal:
+                output.append(int(octal.group(), 8) & 0xFF)
+                index += 1 + len(octal.group())
+                continue
+            output += _PDF_ESCAPES.get(following, following)
+            index += 2
+            continue
+        output += byte
+        index += 1
+    return bytes(output)
+
+
+def _docx_text(path: Path, max_expanded_bytes: int) -> str:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            member = archive.getinfo("word/document.xml")
+            # Reads stop at the declared size, so checking it bounds what is decompressed.
+            if member.file_size > max_expanded_bytes:
+                raise ExtractionError(
+                    f"Word document expands beyond {max_expanded_bytes} bytes"
+                )
+            root = ElementTree.fromstring(archive.read(member))
+    except (zipfile.BadZipFile, zlib.error, KeyError, ElementTree.ParseError) as exc:
+        raise ExtractionError("File is not a valid Word document") from exc
+    paragraphs = [
+        "".join(
+            node.text or ("\t" if node.tag == f"{_WORD_NAMESPACE}tab" else "")
+            for node in paragraph.iter()
+            if node.tag in (f"{_WORD_NAMESPACE}t", f"{_WORD_NAMESPACE}tab")
+        )
+        for paragraph in root.iter(f"{_WORD_NAMESPACE}p")
+    ]
+    return "\n".join(paragraphs).strip()
+
+
+def _doc_text(path: Path) -> str:
+    runs = _DOC_UTF16_RUN.findall(path.read_bytes())
+    text = "\n".join(run.decode("utf-16-le") for run in runs)
+    return text.replace("\r", "\n").strip()
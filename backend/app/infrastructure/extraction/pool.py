@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from app.application.interfaces.document_extractor import (
+    AbstractDocumentExtractor,
+    ExtractedDocument,
+    ExtractionQueueFullError,
+    ExtractionTimeoutError,
+)
+from app.infrastructure.extraction.parsers import (
+    MAX_EXPANDED_BYTES,
+    extract_document_with_timeout,
+    init_worker_skills,
+)
+
+# Extra time the event loop waits beyond the in-worker alarm before giving up on a result.
+_TIMEOUT_GRACE_SECONDS = 2.0
+
+
+class ProcessPoolExtractor(AbstractDocumentExtractor):
+    """Runs document parsing in a bounded pool of worker processes.
+
+    At most ``max_pending`` files may be running or queued; further requests fail fast with
+    :class:`ExtractionQueueFullError` instead of piling up behind a slow batch. Each file gets
+    ``timeout_seconds`` of wall time, enforced by an alarm inside the worker so an overrunning
+    parse frees its process instead of occupying it indefinitely. Compressed content may expand
+    to at most ``max_expanded_bytes``, so a small upload cannot exhaust a worker's memory. A file
+    counts as pending until its worker is done with it, even after the caller has given up
+    waiting.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        max_pending: int,
+        timeout_seconds: float,
+        max_keywords: int,
+        max_expanded_bytes: int = MAX_EXPANDED_BYTES,
+        skill_automaton_path: Path | None = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._timeout_seconds = timeout_seconds
+        self._max_keywords = max_keywords
+        self._max_expanded_bytes = max_expanded_bytes
+        self._skill_automaton_path = skill_automaton_path
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def extract(self, path: Path) -> ExtractedDocument:
+        with self._pending_lock:
+            if self._pending >= self._max_pending:
+                raise ExtractionQueueFullError("Extraction queue is full, retry shortly")
+            self._pending += 1
+        job = partial(
+            extract_document_with_timeout,
+            str(path),
+            timeout_seconds=self._timeout_seconds,
+            max_keywords=self._max_keywords,
+            max_expanded_bytes=self._max_expanded_bytes,
+        )
+        try:
+            future = self._get_executor().submit(job)
+        except BaseException:
+            self._release()
+            raise
+        # Runs in the executor's thread once the worker finishes, or at once if it is cancelled
+        # while still queued; a timed-out parse that is already running keeps its slot.
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=self._timeout_seconds + _TIMEOUT_GRACE_SECONDS,
+            )
+        except asyncio.TimeoutError as exc:
+            raise ExtractionTimeoutError(
+                f"Extraction exceeded {self._timeout_seconds:g}s"
+            ) from exc
+
+    def _release(self, _: Future[ExtractedDocument] | None = None) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers import only the parser module rather than inheriting a copy of
+            # the event loop, open sockets and thread state of the API process.
+            context = multiprocessing.get_context("spawn")
+            path = self._skill_automaton_path
+            if path is None:
+                self._executor = ProcessPoolExecutor(self._max_workers, mp_context=context)
+            else:
+                # Each worker maps the compiled skill taxonomy once, when it starts.
+                self._executor = ProcessPoolExecutor(
+                    self._max_workers,
+                    mp_context=context,
+                    initializer=init_worker_skills,
+                    initargs=(str(path),),
+                )
+        return self._executor
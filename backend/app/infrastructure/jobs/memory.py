@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+from datetime import datetime
+
+from app.application.interfaces.job_queue import AbstractJobQueue
+from app.domain.entities.job import Job, JobStatus
+
+
+class InMemoryJobQueue(AbstractJobQueue):
+    """Single-process stand-in for the Redis queue, for tests and local development.
+
+    Workers must run in the same process and event loop as the submitters, and jobs do not
+    survive a restart. Stored jobs are copies, so callers never see a worker's in-flight edits.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, Job] = {}
+        self._queued: asyncio.Queue[str] = asyncio.Queue()
+
+    async def submit(self, job: Job) -> Job:
+        self._jobs[job.id] = copy.deepcopy(job)
+        self._queued.put_nowait(job.id)
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        job = self._jobs.get(job_id)
+        return copy.deepcopy(job) if job is not None else None
+
+    async def claim(self, timeout_seconds: float) -> Job | None:
+        try:
+            job_id = await asyncio.wait_for(self._queued.get(), timeout_seconds)
+        except asyncio.TimeoutError:
+            return None
+        job = self._jobs[job_id]
+        job.status = JobStatus.RUNNING
+        job.updated_at = datetime.utcnow()
+        return copy.deepcopy(job)
+
+    async def save(self, job: Job) -> None:
+        self._jobs[job.id] = copy.deepcopy(job)
+
+    async def finish(self, job: Job) -> None:
+        self._jobs[job.id] = copy.deepcopy(job)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any
+
+from app.application.interfaces.job_queue import AbstractJobQueue
+from app.domain.entities.job import Job, JobStatus
+
+
+class RedisJobQueue(AbstractJobQueue):
+    """Jobs kept in Redis so API processes and worker processes on any host share them.
+
+    Queued ids wait in a list. Claiming moves an id atomically onto a processing list and
+    ``finish`` removes it from there, so jobs whose worker died mid-run stay on the processing
+    list for ``requeue_unfinished`` rather than being lost. Job records expire
+    ``retention_seconds`` after their last update.
+    """
+
+    def __init__(self, redis: Any, *, prefix: str = "ats:jobs", retention_seconds: int) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._queued_key = f"{prefix}:queued"
+        self._processing_key = f"{prefix}:processing"
+        self._retention_seconds = retention_seconds
+
+    async def submit(self, job: Job) -> Job:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(job.id), _serialize(job), ex=self._retention_seconds)
+            pipe.lpush(self._queued_key, job.id)
+            await pipe.execute()
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        payload = await self._redis.get(self._key(job_id))
+        return _deserialize(payload) if payload is not None else None
+
+    async def claim(self, timeout_seconds: float) -> Job | None:
+        job_id = await self._redis.blmove(
+            self._queued_key, self._processing_key, timeout_seconds, src="RIGHT", dest="LEFT"
+        )
+        if job_id is None:
+            return None
+        job = await self.get(job_id.decode() if isinstance(job_id, bytes) else job_id)
+        if job is None:  # the record expired while the job was queued
+            await self._redis.lrem(self._processing_key, 1, job_id)
+            return None
+        job.status = JobStatus.RUNNING
+        job.updated_at = datetime.utcnow()
+        await self.save(job)
+        return job
+
+    async def save(self, job: Job) -> None:
+        await self._redis.set(self._key(job.id), _serialize(job), ex=self._retention_seconds)
+
+    async def finish(self, job: Job) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(job.id), _serialize(job), ex=self._retention_seconds)
+            pipe.lrem(self._processing_key, 1, job.id)
+            await pipe.execute()
+
+    async def requeue_unfinished(self) -> int:
+        """Put claimed but unfinished jobs back at the head of the queue.
+
+        Only run this while no worker is running, or jobs still in progress run twice.
+        """
+        moved = 0
+        while await self._redis.lmove(
+            self._processing_key, self._queued_key, src="LEFT", dest="RIGHT"
+        ):
+            moved += 1
+        return moved
+
+    def _key(self, job_id: str) -> str:
+        return f"{self._prefix}:job:{job_id}"
+
+
+def _serialize(job: Job) -> str:
+    data = asdict(job)
+    data["status"] = job.status.value
+    data["created_at"] = job.created_at.isoformat()
+    data["updated_at"] = job.updated_at.isoformat()
+    return json.dumps(data)
+
+
+def _deserialize(payload: bytes | str) -> Job:
+    data = json.loads(payload)
+    data["status"] = JobStatus(data["status"])
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+    return Job(**data)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Sequence
+
+from app.application.interfaces.resume_repository import AbstractResumeRepository
+from app.domain.entities.resume import Resume
+
+
+class InMemoryResumeRepository(AbstractResumeRepository):
+    """Dict-backed repository for benchmarks, tests and scoring without a database."""
+
+    def __init__(self) -> None:
+        self.items: dict[int, Resume] = {}
+
+    async def add(self, resume: Resume) -> Resume:
+        resume.id = len(self.items) + 1
+        self.items[resume.id] = resume
+        return resume
+
+    async def add_many(self, resumes: Sequence[Resume]) -> list[Resume]:
+        return [await self.add(resume) for resume in resumes]
+
+    async def get(self, resume_id: int, *, owner_id: int | None = None) -> Resume | None:
+        resume = self.items.get(resume_id)
+        return resume if resume is not None and _owned(resume, owner_id) else None
+
+    async def get_many(
+        self, resume_ids: Sequence[int], *, owner_id: int | None = None
+    ) -> Iterable[Resume]:
+        found = (self.items.get(item) for item in set(resume_ids))
+        return [item for item in found if item is not None and _owned(item, owner_id)]
+
+    async def list_for_owner(
+        self,
+        owner_id: int,
+        *,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        include_text: bool = True,
+    ) -> list[Resume]:
+        items = sorted(
+            (item for item in self.items.values() if item.owner_id == owner_id),
+            key=lambda item: (item.created_at, item.id or 0),
+            reverse=True,
+        )
+        if after is not None:
+            items = [item for item in items if (item.created_at, item.id or 0) < after]
+        return items[:limit]
+
+    async def list_terms_for_owner(self, owner_id: int) -> Iterable[tuple[int, list[str]]]:
+        return [
+            (item.id or 0, [*item.extracted_keywords, *item.extracted_skills])
+            for item in self.items.values()
+            if item.owner_id == owner_id
+        ]
+
+    async def update_extraction(
+        self,
+        resume_id: int,
+        *,
+        parsed_text: str,
+        extracted_skills: list[str],
+        extracted_keywords: list[str],
+    ) -> Resume | None:
+        resume = self.items.get(resume_id)
+        if resume is not None:
+            resume.parsed_text = parsed_text
+            resume.extracted_skills = extracted_skills
+            resume.extracted_keywords = extracted_keywords
+        return resume
+
+    async def delete(self, resume_id: int, *, owner_id: int | None = None) -> Resume | None:
+        if await self.get(resume_id, owner_id=owner_id) is None:
+            return None
+        return self.items.pop(resume_id)
+
+
+def _owned(resume: Resume, owner_id: int | None) -> bool:
+    return owner_id is None or resume.owner_id == owner_id
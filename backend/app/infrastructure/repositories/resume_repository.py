@@ -1,63 +1,264 @@
 from __future__ import annotations
 
-from typing import Iterable
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Iterable, Sequence, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Delete,
+    Select,
+    delete,
+    event,
+    insert,
+    inspect,
+    literal,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.util import await_only
 
+from app.application.interfaces.file_storage import AbstractFileStorage
+from app.application.interfaces.keyword_index import AbstractKeywordIndex
 from app.application.interfaces.resume_repository import AbstractResumeRepository
+from app.core.metrics import REPOSITORY_CALL_SECONDS, timed_methods
 from app.domain.entities.resume import Resume
+from app.domain.terms import term_frequencies
 from app.infrastructure.db import models
 
+# Session.info key holding keyword index updates that wait for the transaction to commit.
+_PENDING_INDEX_UPDATES = "pending_keyword_index_updates"
+# Session.info key holding file references taken in the open transaction.
+_ACQUIRED_REFERENCES = "acquired_file_references"
 
+_Filterable = TypeVar("_Filterable", Select[Any], Delete)
+
+
+@timed_methods(REPOSITORY_CALL_SECONDS, "resume")
 class ResumeRepository(AbstractResumeRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    """Resume rows; each row holds one reference to its file when ``storage`` stores it.
+
+    The reference is taken when the row is inserted and given back if the insert rolls back. A
+    deleted row's reference is released by the caller once the delete has committed, so a
+    rollback cannot lose a file still in use.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        index: AbstractKeywordIndex | None = None,
+        storage: AbstractFileStorage | None = None,
+    ) -> None:
         self._session = session
+        self._index = index
+        self._storage = storage
 
     async def add(self, resume: Resume) -> Resume:
-        db_obj = models.ResumeModel(
-            owner_id=resume.owner_id,
-            file_url=resume.file_url,
-            parsed_text=resume.parsed_text,
-            extracted_skills=resume.extracted_skills,
-            extracted_keywords=resume.extracted_keywords,
-        )
-        self._session.add(db_obj)
-        await self._session.flush()
-        await self._session.refresh(db_obj)
-        return self._to_entity(db_obj)
+        [stored] = await self.add_many([resume])
+        return stored
 
-    async def get(self, resume_id: int) -> Resume | None:
+    async def add_many(self, resumes: Sequence[Resume]) -> list[Resume]:
+        """Insert with multi-row ``INSERT ... RETURNING``; server values need no extra SELECT."""
+        if not resumes:
+            return []
+        result = await self._session.scalars(
+            insert(models.ResumeModel).returning(models.ResumeModel),
+            [
+                {
+                    "owner_id": resume.owner_id,
+                    "file_url": resume.file_url,
+                    "parsed_text": resume.parsed_text,
+                    "extracted_skills": resume.extracted_skills,
+                    "extracted_keywords": resume.extracted_keywords,
+                    "term_frequencies": _term_frequencies(resume),
+                    "created_at": resume.created_at,
+                    "updated_at": resume.updated_at,
+                }
+                for resume in resumes
+            ],
+        )
+        stored = [self._to_entity(item) for item in sorted(result.all(), key=lambda row: row.id)]
+        if self._storage is not None:
+            keys = Counter(map(self._storage.key_from_url, (item.file_url for item in stored)))
+            for key, count in keys.items():
+                if key is not None:
+                    await self._storage.acquire(key, count)
+                    self._release_on_rollback(self._storage, key, count)
+        if self._index is not None:
+            for item in stored:
+                terms = [*item.extracted_keywords, *item.extracted_skills]
+                self._after_commit(self._index.add, item.owner_id, item.id or 0, terms)
+        return stored
+
+    async def get(self, resume_id: int, *, owner_id: int | None = None) -> Resume | None:
         result = await self._session.execute(
-            select(models.ResumeModel).where(models.ResumeModel.id == resume_id)
+            _owned_by(select(models.ResumeModel), owner_id).where(
+                models.ResumeModel.id == resume_id
+            )
         )
         db_obj = result.scalar_one_or_none()
         if not db_obj:
             return None
         return self._to_entity(db_obj)
 
-    async def list_for_owner(self, owner_id: int) -> Iterable[Resume]:
+    async def get_many(
+        self, resume_ids: Sequence[int], *, owner_id: int | None = None
+    ) -> Iterable[Resume]:
+        if not resume_ids:
+            return []
         result = await self._session.execute(
-            select(models.ResumeModel).where(models.ResumeModel.owner_id == owner_id)
+            _owned_by(select(models.ResumeModel), owner_id).where(
+                models.ResumeModel.id.in_(set(resume_ids))
+            )
         )
         return [self._to_entity(item) for item in result.scalars().all()]
 
-    async def delete(self, resume_id: int) -> None:
+    async def list_for_owner(
+        self,
+        owner_id: int,
+        *,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        include_text: bool = True,
+    ) -> list[Resume]:
+        statement = (
+            select(models.ResumeModel)
+            .where(models.ResumeModel.owner_id == owner_id)
+            .order_by(models.ResumeModel.created_at.desc(), models.ResumeModel.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            statement = statement.where(
+                tuple_(models.ResumeModel.created_at, models.ResumeModel.id)
+                < tuple_(*map(literal, after))
+            )
+        # Term frequencies only feed scoring; listings never need them.
+        statement = statement.options(defer(models.ResumeModel.term_frequencies))
+        if not include_text:
+            statement = statement.options(defer(models.ResumeModel.parsed_text))
+        result = await self._session.execute(statement)
+        return [self._to_entity(item) for item in result.scalars().all()]
+
+    async def list_terms_for_owner(self, owner_id: int) -> Iterable[tuple[int, list[str]]]:
         result = await self._session.execute(
-            select(models.ResumeModel).where(models.ResumeModel.id == resume_id)
+            select(
+                models.ResumeModel.id,
+                models.ResumeModel.extracted_keywords,
+                models.ResumeModel.extracted_skills,
+            ).where(models.ResumeModel.owner_id == owner_id)
         )
-        db_obj = result.scalar_one_or_none()
-        if db_obj is not None:
-            await self._session.delete(db_obj)
+        return [
+            (row.id, [*(row.extracted_keywords or []), *(row.extracted_skills or [])])
+            for row in result
+        ]
+
+    async def update_extraction(
+        self,
+        resume_id: int,
+        *,
+        parsed_text: str,
+        extracted_skills: list[str],
+        extracted_keywords: list[str],
+    ) -> Resume | None:
+        db_obj = await self._session.scalar(
+            update(models.ResumeModel)
+            .where(models.ResumeModel.id == resume_id)
+            .values(
+                parsed_text=parsed_text,
+                extracted_skills=extracted_skills,
+                extracted_keywords=extracted_keywords,
+                term_frequencies=term_frequencies(parsed_text),
+            )
+            .returning(models.ResumeModel)
+        )
+        if db_obj is None:
+            return None
+        if self._index is not None:
+            terms = [*extracted_keywords, *extracted_skills]
+            self._after_commit(self._index.add, db_obj.owner_id, db_obj.id, terms)
+        return self._to_entity(db_obj)
+
+    async def delete(self, resume_id: int, *, owner_id: int | None = None) -> Resume | None:
+        db_obj = await self._session.scalar(
+            _owned_by(delete(models.ResumeModel), owner_id)
+            .where(models.ResumeModel.id == resume_id)
+            .returning(models.ResumeModel)
+        )
+        if db_obj is None:
+            return None
+        if self._index is not None:
+            self._after_commit(self._index.remove, db_obj.owner_id, resume_id)
+        return self._to_entity(db_obj)
+
+    def _after_commit(self, apply: Callable[..., None], *args: object) -> None:
+        """Queue a keyword index update for when the transaction commits; a rollback drops it."""
+        session = self._session.sync_session
+        pending = session.info.get(_PENDING_INDEX_UPDATES)
+        if pending is None:
+            pending = session.info[_PENDING_INDEX_UPDATES] = []
+            event.listen(session, "after_commit", _apply_index_updates)
+            event.listen(session, "after_rollback", _discard_index_updates)
+        pending.append((apply, args))
+
+    def _release_on_rollback(self, storage: AbstractFileStorage, key: str, count: int) -> None:
+        """Remember references taken in this transaction so that a rollback releases them."""
+        session = self._session.sync_session
+        acquired = session.info.get(_ACQUIRED_REFERENCES)
+        if acquired is None:
+            acquired = session.info[_ACQUIRED_REFERENCES] = []
+            event.listen(session, "after_commit", _keep_references)
+            event.listen(session, "after_rollback", _release_references)
+        acquired.append((storage, key, count))
 
     def _to_entity(self, db_obj: models.ResumeModel) -> Resume:
+        # Deferred columns must not be touched: a lazy load is not possible under asyncio.
+        deferred = inspect(db_obj).unloaded
         return Resume(
             id=db_obj.id,
             owner_id=db_obj.owner_id,
             file_url=db_obj.file_url,
-            parsed_text=db_obj.parsed_text,
+            parsed_text=None if "parsed_text" in deferred else db_obj.parsed_text,
             extracted_skills=list(db_obj.extracted_skills or []),
             extracted_keywords=list(db_obj.extracted_keywords or []),
+            term_frequencies=None if "term_frequencies" in deferred else db_obj.term_frequencies,
             created_at=db_obj.created_at,
             updated_at=db_obj.updated_at,
         )
+
+
+def _owned_by(statement: _Filterable, owner_id: int | None) -> _Filterable:
+    if owner_id is None:
+        return statement
+    return statement.where(models.ResumeModel.owner_id == owner_id)
+
+
+def _term_frequencies(resume: Resume) -> dict[str, int] | None:
+    if resume.term_frequencies is not None:
+        return resume.term_frequencies
+    return term_frequencies(resume.parsed_text) if resume.parsed_text else None
+
+
+def _apply_index_updates(session: Session) -> None:
+    pending = session.info[_PENDING_INDEX_UPDATES]
+    updates, pending[:] = list(pending), []
+    for apply, args in updates:
+        apply(*args)
+
+
+def _discard_index_updates(session: Session) -> None:
+    session.info[_PENDING_INDEX_UPDATES].clear()
+
+
+def _keep_references(session: Session) -> None:
+    session.info[_ACQUIRED_REFERENCES].clear()
+
+
+def _release_references(session: Session) -> None:
+    acquired = session.info[_ACQUIRED_REFERENCES]
+    references, acquired[:] = list(acquired), []
+    for storage, key, count in references:
+        for _ in range(count):
+            # Session events run synchronously inside the AsyncSession's greenlet.
+            await_only(storage.release(key))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.interfaces.score_card_repository import AbstractScoreCardRepository
+from app.core.metrics import REPOSITORY_CALL_SECONDS, timed_methods
+from app.domain.entities.score_card import ScoreCard
+from app.infrastructure.db import models
+
+
+@timed_methods(REPOSITORY_CALL_SECONDS, "score_card")
+class ScoreCardRepository(AbstractScoreCardRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add_many(self, score_cards: Sequence[ScoreCard]) -> list[ScoreCard]:
+        """Insert all cards with a single multi-row ``INSERT ... RETURNING`` statement."""
+        if not score_cards:
+            return []
+        result = await self._session.scalars(
+            insert(models.ScoreCardModel).returning(models.ScoreCardModel),
+            [
+                {
+                    "resume_id": card.resume_id,
+                    "job_description_id": card.job_description_id,
+                    "ats_score": card.ats_score,
+                    "keyword_match": card.keyword_match,
+                    "formatting_score": card.formatting_score,
+                    "overall_score": card.overall_score,
+                    "recommendations": list(card.recommendations),
+                    "fingerprint": card.fingerprint,
+                    "generated_at": card.generated_at,
+                }
+                for card in score_cards
+            ],
+        )
+        # Identity values are assigned in VALUES order; RETURNING order itself is unspecified.
+        return [self._to_entity(item) for item in sorted(result.all(), key=lambda row: row.id)]
+
+    async def latest_matching(self, fingerprints: Mapping[int, str]) -> dict[int, ScoreCard]:
+        if not fingerprints:
+            return {}
+        result = await self._session.execute(
+            select(models.ScoreCardModel)
+            .where(
+                models.ScoreCardModel.resume_id.in_(list(fingerprints)),
+                models.ScoreCardModel.fingerprint.in_(set(fingerprints.values())),
+            )
+            .order_by(models.ScoreCardModel.generated_at, models.ScoreCardModel.id)
+        )
+        return {
+            item.resume_id: self._to_entity(item)
+            for item in result.scalars().all()
+            if fingerprints[item.resume_id] == item.fingerprint
+        }
+
+    def _to_entity(self, db_obj: models.ScoreCardModel) -> ScoreCard:
+        return ScoreCard(
+            id=db_obj.id,
+            resume_id=db_obj.resume_id,
+            job_description_id=db_obj.job_description_id,
+            ats_score=db_obj.ats_score,
+            keyword_match=db_obj.keyword_match,
+            formatting_score=db_obj.formatting_score,
+            overall_score=db_obj.overall_score,
+            recommendations=list(db_obj.recommendations or []),
+            fingerprint=db_obj.fingerprint,
+            generated_at=db_obj.generated_at,
+        )
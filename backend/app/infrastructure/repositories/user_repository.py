@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.interfaces.user_repository import AbstractUserRepository
+from app.core.metrics import REPOSITORY_CALL_SECONDS, timed_methods
 from app.domain.entities.user import User
 from app.infrastructure.db import models
 
 
+@timed_methods(REPOSITORY_CALL_SECONDS, "user")
 class UserRepository(AbstractUserRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -21,17 +23,31 @@ class UserRepository(AbstractUserRepository):
             return None
         return self._to_entity(instance)
 
+    async def get(self, user_id: int) -> User | None:
+        instance = await self._session.get(models.UserModel, user_id)
+        if instance is None:
+            return None
+        return self._to_entity(instance)
+
     async def add(self, user: User) -> User:
-        model = models.UserModel(
-            email=user.email,
-            hashed_password=user.hashed_password,
-            full_name=user.full_name,
-            is_active=user.is_active,
+        result = await self._session.scalars(
+            insert(models.UserModel)
+            .values(
+                email=user.email,
+                hashed_password=user.hashed_password,
+                full_name=user.full_name,
+                is_active=user.is_active,
+            )
+            .returning(models.UserModel)
+        )
+        return self._to_entity(result.one())
+
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        await self._session.execute(
+            update(models.UserModel)
+            .where(models.UserModel.id == user_id)
+            .values(hashed_password=hashed_password)
         )
-        self._session.add(model)
-        await self._session.flush()
-        await self._session.refresh(model)
-        return self._to_entity(model)
 
     def _to_entity(self, instance: models.UserModel) -> User:
         return User(
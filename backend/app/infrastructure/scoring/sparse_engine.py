@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
+
+from app.application.interfaces.scoring_engine import AbstractScoringEngine
+from app.application.services.resume_scoring import JobFeatures, resume_term_frequencies
+from app.domain.entities.resume import Resume
+
+if TYPE_CHECKING:  # pragma: no cover - numpy, scipy and scikit-learn load on first use
+    from scipy import sparse
+
+
+class SparseScoringEngine(AbstractScoringEngine):
+    """Vectorized overlap counts over a sparse resume-by-term matrix.
+
+    The resumes' stored term frequencies (the same counts the per-resume scorer uses) are
+    stacked into a CSR count matrix alongside a binary keyword matrix. Each job description then
+    costs one column gather: keyword overlap is a row sum over the job's keyword columns and
+    clipped term overlap is a row sum after clipping each stored count to the job's count for
+    that term. Everything stays integral, so ratios derived from the counts match the
+    per-resume implementation bit for bit.
+
+    numpy, scipy and scikit-learn take about a second to import, so they are imported by the
+    first vectorized batch rather than when the application starts.
+    """
+
+    def __init__(self, *, min_batch_size: int = 256) -> None:
+        self.min_batch_size = min_batch_size
+
+    def preload(self) -> None:
+        """Import the numeric libraries now, e.g. in a parent process before it forks workers."""
+        import numpy  # noqa: F401
+        from scipy import sparse  # noqa: F401
+        from sklearn.feature_extraction import DictVectorizer, text  # noqa: F401
+
+    def overlap_counts(
+        self,
+        resumes: Sequence[Resume],
+        resume_keywords: Sequence[set[str]],
+        job_features: Sequence[JobFeatures | None],
+    ) -> tuple[list[list[int]], list[list[int]]]:
+        import numpy as np
+
+        terms, term_index = _term_matrix(resume_term_frequencies(resume) for resume in resumes)
+        keywords, keyword_index = _keyword_matrix(resume_keywords)
+        keyword_overlap = np.zeros((len(resumes), len(job_features)), dtype=np.int64)
+        term_overlap = np.zeros_like(keyword_overlap)
+        for column, features in enumerate(job_features):
+            if features is None:
+                continue
+            keyword_columns = [
+                keyword_index[item] for item in features.keywords if item in keyword_index
+            ]
+            if keyword_columns:
+                keyword_overlap[:, column] = keywords[:, keyword_columns].sum(axis=1).A1
+            matched = [
+                (term_index[token], count)
+                for token, count in features.role_terms.items()
+                if token in term_index
+            ]
+            if matched:
+                columns, limits = zip(*matched)
+                selected = terms[:, list(columns)]
+                selected.data = np.minimum(selected.data, np.asarray(limits)[selected.indices])
+                term_overlap[:, column] = selected.sum(axis=1).A1
+        return keyword_overlap.tolist(), term_overlap.tolist()
+
+
+def _term_matrix(
+    documents: Iterable[Mapping[str, int]],
+) -> tuple[sparse.csr_matrix, dict[str, int]]:
+    import numpy as np
+    from scipy import sparse
+    from sklearn.feature_extraction import DictVectorizer
+
+    vectorizer = DictVectorizer(dtype=np.int64, sort=False)
+    matrix = vectorizer.fit_transform(documents)
+    return sparse.csr_matrix(matrix), dict(vectorizer.vocabulary_)
+
+
+def _keyword_matrix(
+    documents: Sequence[set[str]],
+) -> tuple[sparse.csr_matrix, dict[str, int]]:
+    import numpy as np
+    from scipy import sparse
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    # The keyword sets are already normalized, so each one is its own list of features.
+    vectorizer = CountVectorizer(analyzer=list, binary=True, dtype=np.int64)
+    try:
+        matrix = vectorizer.fit_transform(documents)
+    except ValueError:  # every document was empty
+        return sparse.csr_matrix((len(documents), 0), dtype=np.int64), {}
+    return matrix.tocsr(), dict(vectorizer.vocabulary_)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Mapping
+
+from app.application.interfaces.keyword_index import AbstractKeywordIndex
+from app.infrastructure.cache.memory import TTLLRUCache
+
+
+def normalize_terms(
+    terms: Iterable[str], canonicalize: Callable[[str], str] | None = None
+) -> frozenset[str]:
+    normalized = (item.strip().lower() for item in terms)
+    if canonicalize is not None:
+        normalized = (canonicalize(item) for item in normalized if item)
+    return frozenset(term for term in normalized if term)
+
+
+@dataclass(slots=True)
+class RankedCandidates:
+    hits: list[tuple[int, float]] = field(default_factory=list)
+    postings_scanned: int = 0
+    documents_scored: int = 0
+
+
+class KeywordIndex:
+    """Inverted index from normalized keyword/skill terms to resume ids.
+
+    ``top_k`` ranks documents by the summed weight of the query terms they contain using
+    MaxScore pruning: query terms are visited from the highest weight down, and once the
+    summed weight of the terms not yet visited cannot beat the current k-th best score, the
+    remaining (typically largest) posting lists are never scanned, only probed for the
+    candidates already found. Equal scores at the cut-off keep the candidate found first.
+    ``canonicalize`` maps indexed and queried terms alike, e.g. skill aliases to one name.
+    """
+
+    def __init__(self, canonicalize: Callable[[str], str] | None = None) -> None:
+        self._canonicalize = canonicalize
+        self._postings: dict[str, set[int]] = {}
+        self._documents: dict[int, frozenset[str]] = {}
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[tuple[int, Iterable[str]]],
+        canonicalize: Callable[[str], str] | None = None,
+    ) -> KeywordIndex:
+        index = cls(canonicalize)
+        for resume_id, terms in entries:
+            index.add(resume_id, terms)
+        return index
+
+    def add(self, resume_id: int, terms: Iterable[str]) -> None:
+        self.remove(resume_id)
+        normalized = normalize_terms(terms, self._canonicalize)
+        self._documents[resume_id] = normalized
+        for term in normalized:
+            self._postings.setdefault(term, set()).add(resume_id)
+
+    def remove(self, resume_id: int) -> None:
+        for term in self._documents.pop(resume_id, frozenset()):
+            postings = self._postings[term]
+            postings.discard(resume_id)
+            if not postings:
+                del self._postings[term]
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, resume_id: object) -> bool:
+        return resume_id in self._documents
+
+    def top_k(self, weights: Mapping[str, float], k: int) -> RankedCandidates:
+        result = RankedCandidates()
+        query: dict[str, float] = {}
+        for term, weight in weights.items():
+            for normalized in normalize_terms([term], self._canonicalize):
+                if weight > 0 and normalized in self._postings:
+                    query[normalized] = max(weight, query.get(normalized, 0.0))
+        if k <= 0 or not query:
+            return result
+        # Highest weight first; among equal weights the longest postings go last so they are
+        # the ones pruning skips.
+        ordered = sorted(query.items(), key=lambda item: (-item[1], len(self._postings[item[0]])))
+        postings = [self._postings[term] for term, _ in ordered]
+        remaining = [0.0] * (len(ordered) + 1)
+        for position in range(len(ordered) - 1, -1, -1):
+            remaining[position] = remaining[position + 1] + ordered[position][1]
+
+        # Ties go to the lower resume id, so a bound equal to the k-th score can still win and
+        # only a strictly lower one prunes.
+        heap: list[tuple[float, int]] = []
+        seen: set[int] = set()
+        for position, (_, weight) in enumerate(ordered):
+            if len(heap) == k and remaining[position] < heap[0][0]:
+                break
+            result.postings_scanned += 1
+            for resume_id in postings[position]:
+                if resume_id in seen:
+                    continue
+                seen.add(resume_id)
+                result.documents_scored += 1
+                score = weight
+                for probe in range(position + 1, len(ordered)):
+                    if len(heap) == k and (score + remaining[probe], -resume_id) < heap[0]:
+                        break
+                    if resume_id in postings[probe]:
+                        score += ordered[probe][1]
+                if len(heap) < k:
+                    heapq.heappush(heap, (score, -resume_id))
+                elif (score, -resume_id) > heap[0]:
+                    heapq.heapreplace(heap, (score, -resume_id))
+        result.hits = [(-negated_id, score) for score, negated_id in sorted(heap, reverse=True)]
+        return result
+
+
+class KeywordIndexRegistry(AbstractKeywordIndex):
+    """Per-owner keyword indexes kept in a bounded TTL/LRU map.
+
+    An owner's index is built from the database on first use and then updated incrementally
+    by writes in this process. The TTL bounds how long writes made by other worker processes
+    can stay invisible before the index is rebuilt.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_owners: int,
+        ttl_seconds: float,
+        canonicalize: Callable[[str], str] | None = None,
+    ) -> None:
+        self._canonicalize = canonicalize
+        self._indexes: TTLLRUCache[int, KeywordIndex] = TTLLRUCache(
+            max_entries=max_owners, ttl_seconds=ttl_seconds
+        )
+
+    def get(self, owner_id: int) -> KeywordIndex | None:
+        return self._indexes.get(owner_id)
+
+    def top_k(
+        self, owner_id: int, weights: Mapping[str, float], k: int
+    ) -> list[tuple[int, float]] | None:
+        index = self._indexes.get(owner_id)
+        return index.top_k(weights, k).hits if index is not None else None
+
+    def load(self, owner_id: int, entries: Iterable[tuple[int, Iterable[str]]]) -> None:
+        self._indexes.set(owner_id, KeywordIndex.from_entries(entries, self._canonicalize))
+
+    def add(self, owner_id: int, resume_id: int, terms: Iterable[str]) -> None:
+        index = self._indexes.get(owner_id)
+        if index is not None:
+            index.add(resume_id, terms)
+
+    def remove(self, owner_id: int, resume_id: int) -> None:
+        index = self._indexes.get(owner_id)
+        if index is not None:
+            index.remove(resume_id)
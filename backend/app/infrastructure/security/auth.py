@@ -1,29 +1,34 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Callable
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.core.config import get_settings
+from app.infrastructure.cache.memory import TTLLRUCache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 _settings = get_settings()
 
+# Values of the ``type`` claim; each kind of token is only accepted where that kind is expected.
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
 
+def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
+    expires_delta = expires_delta or timedelta(minutes=_settings.access_token_expire_minutes)
+    return _create_token(subject, ACCESS_TOKEN, expires_delta)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
 
+def create_refresh_token(subject: str, expires_delta: timedelta | None = None) -> str:
+    expires_delta = expires_delta or timedelta(minutes=_settings.refresh_token_expire_minutes)
+    return _create_token(subject, REFRESH_TOKEN, expires_delta)
 
-def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
-    expire = datetime.now(timezone.utc) + (
-        expires_delta or timedelta(minutes=_settings.access_token_expire_minutes)
-    )
-    payload = {"exp": expire, "sub": subject}
+
+def _create_token(subject: str, token_type: str, expires_delta: timedelta) -> str:
+    expire = datetime.now(timezone.utc) + expires_delta
+    payload = {"exp": expire, "sub": subject, "type": token_type}
     return jwt.encode(payload, _settings.secret_key, algorithm=_settings.algorithm)
 
 
@@ -32,3 +37,37 @@ def decode_token(token: str) -> dict[str, str]:
         return jwt.decode(token, _settings.secret_key, algorithms=[_settings.algorithm])
     except JWTError as exc:  # pragma: no cover - defensive guard
         raise ValueError("Invalid token") from exc
+
+
+class VerifiedTokenCache:
+    """Remembers the subject of access tokens whose signature and expiry were already checked.
+
+    Entries never outlive the token's own ``exp`` claim, so an expired token is decoded again
+    and rejected instead of being served from the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._entries: TTLLRUCache[str, str] = TTLLRUCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+
+    def subject(self, token: str) -> str:
+        subject = self._entries.get(token)
+        if subject is not None:
+            return subject
+        payload = decode_token(token)
+        subject = payload.get("sub")
+        if subject is None or payload.get("type") != ACCESS_TOKEN:
+            raise ValueError("Invalid token")
+        remaining = float(payload.get("exp", 0)) - self._clock()
+        if remaining > 0:
+            self._entries.set(token, subject, min(remaining, self._ttl_seconds))
+        return subject
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, TypeVar
+
+from passlib.context import CryptContext
+
+from app.application.interfaces.password_hasher import (
+    AbstractPasswordHasher,
+    PasswordHasherBusyError,
+)
+
+T = TypeVar("T")
+
+
+class ExecutorPasswordHasher(AbstractPasswordHasher):
+    """Runs bcrypt in a small thread pool so hashing never blocks the event loop.
+
+    bcrypt releases the GIL while it works, so threads give real parallelism; ``max_workers``
+    caps how many cores a login burst may occupy. At most ``max_pending`` jobs may be running
+    or queued, since each waiting request usually holds a database connection; further calls
+    fail fast with :class:`PasswordHasherBusyError`. Hashes with fewer than ``rounds`` are
+    reported as needing an update on successful verify.
+    """
+
+    def __init__(self, *, rounds: int, max_workers: int, max_pending: int) -> None:
+        self._context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        self._context.update(bcrypt__min_rounds=rounds)
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._pending = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def hash(self, password: str) -> str:
+        return await self._run(partial(self._context.hash, password))
+
+    async def verify(self, password: str, hashed_password: str) -> tuple[bool, str | None]:
+        return await self._run(partial(self._context.verify_and_update, password, hashed_password))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, job: Callable[[], T]) -> T:
+        if self._pending >= self._max_pending:
+            raise PasswordHasherBusyError("Too many concurrent sign-ins, retry shortly")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="password-hasher"
+            )
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        finally:
+            self._pending -= 1
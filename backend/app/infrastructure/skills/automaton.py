@@ -0,0 +1,251 @@
+"""Skill taxonomy compiled into a token-level Aho-Corasick automaton.
+
+The taxonomy maps each canonical skill name to its aliases. Compiling it produces one binary
+file: a JSON header (token vocabulary, skill names and the alias lookup) followed by flat int32
+arrays holding the goto edges, failure links and per-state outputs. ``SkillAutomaton.open``
+memory-maps that file, so every worker on a host shares one copy of the arrays through the
+page cache and startup costs a header parse rather than a rebuild.
+
+Patterns are token sequences, so matches always fall on word boundaries and multi-word skills
+such as "machine learning" match across any whitespace. A text is scanned once however many
+skills the taxonomy holds. Only the standard library is imported because extraction worker
+processes load this module too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import deque
+from pathlib import Path
+from typing import Final, Mapping, Sequence
+
+from app.application.interfaces.skill_matcher import AbstractSkillMatcher
+from app.domain.terms import tokenize
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).with_name("taxonomy.json")
+
+_MAGIC = b"ATSSKL01"
+_PREFIX = struct.Struct("<8sI")
+# Final keeps the literal type that memoryview.cast needs to know the items are ints.
+_INT: Final = "i"
+
+
+class TaxonomyError(ValueError):
+    pass
+
+
+def read_taxonomy(path: Path) -> dict[str, list[str]]:
+    taxonomy = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(taxonomy, dict) or not all(
+        isinstance(aliases, list) for aliases in taxonomy.values()
+    ):
+        raise TaxonomyError(f"{path} must map each skill name to a list of aliases")
+    return taxonomy
+
+
+def taxonomy_digest(taxonomy: Mapping[str, Sequence[str]]) -> str:
+    encoded = json.dumps(taxonomy, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(_MAGIC + encoded).hexdigest()
+
+
+def compile_taxonomy(taxonomy: Mapping[str, Sequence[str]]) -> bytes:
+    """Build the automaton for ``taxonomy`` and serialize it."""
+    skills: list[str] = []
+    aliases: dict[str, int] = {}
+    goto: list[dict[str, int]] = [{}]
+    outputs: list[set[int]] = [set()]
+    for name, names in taxonomy.items():
+        canonical = " ".join(tokenize(name))
+        if not canonical:
+            raise TaxonomyError(f"Skill name {name!r} contains no words")
+        skill_id = len(skills)
+        skills.append(canonical)
+        for pattern in (name, *names):
+            tokens = tokenize(pattern)
+            phrase = " ".join(tokens)
+            if not tokens:
+                raise TaxonomyError(f"Alias {pattern!r} of {name!r} contains no words")
+            if aliases.setdefault(phrase, skill_id) != skill_id:
+                raise TaxonomyError(
+                    f"{pattern!r} is listed under both {skills[aliases[phrase]]!r} and {name!r}"
+                )
+            state = 0
+            for token in tokens:
+                following = goto[state].get(token)
+                if following is None:
+                    following = goto[state][token] = len(goto)
+                    goto.append({})
+                    outputs.append(set())
+                state = following
+            outputs[state].add(skill_id)
+
+    # Breadth first, so a state's failure target and its outputs are final before it is used.
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for token, following in goto[state].items():
+            queue.append(following)
+            fallback = fail[state]
+            while fallback and token not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[following] = goto[fallback].get(token, 0)
+            outputs[following] |= outputs[fail[following]]
+
+    vocabulary = sorted({token for edges in goto for token in edges})
+    token_ids = {token: token_id for token_id, token in enumerate(vocabulary)}
+    edge_offsets, edge_tokens, edge_targets = array(_INT, [0]), array(_INT), array(_INT)
+    for edges in goto:
+        for token_id, target in sorted((token_ids[token], state) for token, state in edges.items()):
+            edge_tokens.append(token_id)
+            edge_targets.append(target)
+        edge_offsets.append(len(edge_tokens))
+    output_offsets, output_skills = array(_INT, [0]), array(_INT)
+    for found in outputs:
+        output_skills.extend(sorted(found))
+        output_offsets.append(len(output_skills))
+    sections = (
+        edge_offsets, edge_tokens, edge_targets, array(_INT, fail), output_offsets, output_skills
+    )
+    header = json.dumps(
+        {
+            "digest": taxonomy_digest(taxonomy),
+            "byteorder": sys.byteorder,
+            "tokens": vocabulary,
+            "skills": skills,
+            "aliases": aliases,
+            "lengths": [len(section) for section in sections],
+        },
+        separators=(",", ":"),
+    ).encode()
+    # Pad so the arrays start on an int32 boundary and can be viewed in place.
+    header += b" " * (-(_PREFIX.size + len(header)) % array(_INT).itemsize)
+    return b"".join(
+        [_PREFIX.pack(_MAGIC, len(header)), header, *(section.tobytes() for section in sections)]
+    )
+
+
+class SkillAutomaton(AbstractSkillMatcher):
+    """Matcher over a compiled taxonomy held in ``bytes`` or a read-only memory map."""
+
+    def __init__(self, buffer: bytes | mmap.mmap, *, path: Path | None = None) -> None:
+        magic, header_size = _PREFIX.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise TaxonomyError("Not a compiled skill taxonomy")
+        header = json.loads(bytes(buffer[_PREFIX.size : _PREFIX.size + header_size]))
+        if header["byteorder"] != sys.byteorder:
+            raise TaxonomyError("Compiled taxonomy uses a different byte order")
+        self.path = path
+        self.digest: str = header["digest"]
+        self.version = self.digest[:12]
+        self._buffer = buffer
+        self._token_ids = {token: token_id for token_id, token in enumerate(header["tokens"])}
+        self._skills: list[str] = header["skills"]
+        self._aliases: dict[str, int] = header["aliases"]
+        view = memoryview(buffer)[_PREFIX.size + header_size :].cast(_INT)
+        sections: list[memoryview] = []
+        start = 0
+        for length in header["lengths"]:
+            sections.append(view[start : start + length])
+            start += length
+        (
+            self._edge_offsets,
+            self._edge_tokens,
+            self._edge_targets,
+            self._fail,
+            self._output_offsets,
+            self._output_skills,
+        ) = sections
+
+    @classmethod
+    def open(cls, path: Path) -> SkillAutomaton:
+        with path.open("rb") as handle:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path=path)
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy: Mapping[str, Sequence[str]]) -> SkillAutomaton:
+        return cls(compile_taxonomy(taxonomy))
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def find(self, text: str | None) -> list[str]:
+        return self.find_tokens(tokenize(text))
+
+    def find_tokens(self, tokens: Sequence[str]) -> list[str]:
+        token_ids = self._token_ids
+        edge_offsets, edge_tokens, edge_targets = (
+            self._edge_offsets,
+            self._edge_tokens,
+            self._edge_targets,
+        )
+        fail, output_offsets, output_skills = self._fail, self._output_offsets, self._output_skills
+        found: dict[int, None] = {}
+        state = 0
+        for token in tokens:
+            token_id = token_ids.get(token)
+            if token_id is None:
+                # No pattern contains this token, so every partial match ends here.
+                state = 0
+                continue
+            while True:
+                end = edge_offsets[state + 1]
+                position = bisect_left(edge_tokens, token_id, edge_offsets[state], end)
+                if position < end and edge_tokens[position] == token_id:
+                    state = edge_targets[position]
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            for position in range(output_offsets[state], output_offsets[state + 1]):
+                found.setdefault(output_skills[position], None)
+        return [self._skills[skill_id] for skill_id in found]
+
+    def canonicalize(self, term: str) -> str:
+        skill_id = self._aliases.get(" ".join(tokenize(term)))
+        return self._skills[skill_id] if skill_id is not None else term.strip().lower()
+
+
+def load_skill_automaton(
+    compiled_path: Path, taxonomy_path: Path = DEFAULT_TAXONOMY_PATH
+) -> SkillAutomaton:
+    """Map the compiled taxonomy, compiling it first when it is missing or out of date.
+
+    The file is replaced atomically, so processes starting at the same time see either the old
+    or the new file. Where it cannot be written the automaton is kept in memory instead.
+    """
+    taxonomy = read_taxonomy(taxonomy_path)
+    try:
+        automaton = SkillAutomaton.open(compiled_path)
+        if automaton.digest == taxonomy_digest(taxonomy):
+            return automaton
+    except (OSError, ValueError, KeyError, struct.error):
+        pass
+    compiled = compile_taxonomy(taxonomy)
+    try:
+        write_compiled(compiled_path, compiled)
+    except OSError:
+        return SkillAutomaton(compiled)
+    return SkillAutomaton.open(compiled_path)
+
+
+def write_compiled(path: Path, compiled: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, staging = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(compiled)
+        os.chmod(staging, 0o644)
+        os.replace(staging, path)
+    except BaseException:
+        os.unlink(staging)
+        raise
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import errno
+import fcntl
+import os
+import shutil
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import BinaryIO
+from uuid import uuid4
+
+from starlette.concurrency import run_in_threadpool
+
+from app.application.interfaces.file_storage import AbstractFileStorage, StoredFile
+from app.infrastructure.storage.uploads import copy_upload, key_from_url, sharded_key
+
+
+class LocalFileStorage(AbstractFileStorage):
+    """Content-addressed files under ``root`` in a two-level sharded layout.
+
+    Only the files themselves live under ``root``, which may be served as is. Uploads are
+    streamed into ``state_dir/staging`` while hashed, then moved into place or discarded when
+    the content already exists. Reference counts live in ``state_dir/refs`` and are updated
+    under an exclusive file lock so concurrent worker processes agree on them; a count file's
+    modification time records when the file was last uploaded or released.
+    """
+
+    def __init__(self, root: Path, *, state_dir: Path, public_base_url: str) -> None:
+        self._root = root
+        self._staging = state_dir / "staging"
+        self._refs = state_dir / "refs"
+        self._url_prefix = f"{public_base_url.rstrip('/')}/uploads/"
+
+    async def put(
+        self, source: BinaryIO, *, suffix: str, max_bytes: int, chunk_size: int
+    ) -> StoredFile:
+        return await run_in_threadpool(self._put, source, suffix, max_bytes, chunk_size)
+
+    async def acquire(self, key: str, count: int = 1) -> int:
+        return await run_in_threadpool(self._acquire, key, count)
+
+    async def release(self, key: str) -> int:
+        return await run_in_threadpool(self._release, key)
+
+    async def collect_unreferenced(self, *, older_than_seconds: float) -> list[str]:
+        return await run_in_threadpool(self._collect_unreferenced, older_than_seconds)
+
+    def public_url(self, key: str) -> str:
+        return f"{self._url_prefix}{key}"
+
+    def key_from_url(self, url: str) -> str | None:
+        return key_from_url(url, self._url_prefix)
+
+    @asynccontextmanager
+    async def local_copy(self, key: str) -> AsyncIterator[Path]:
+        path = self._root / key
+        if not path.is_file():
+            raise FileNotFoundError(key)
+        yield path
+
+    def _put(self, source: BinaryIO, suffix: str, max_bytes: int, chunk_size: int) -> StoredFile:
+        self._staging.mkdir(parents=True, exist_ok=True)
+        staged = copy_upload(
+            source, self._staging / uuid4().hex, max_bytes=max_bytes, chunk_size=chunk_size
+        )
+        key = sharded_key(staged.sha256, suffix)
+        target = self._root / key
+        with self._locked():
+            if target.exists():
+                staged.path.unlink()
+                references = self._read_references(key)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                _move(staged.path, target)
+                references = 0
+            self._write_references(key, references)  # restarts the grace period
+        return StoredFile(key=key, size=staged.size, sha256=staged.sha256, references=references)
+
+    def _acquire(self, key: str, count: int) -> int:
+        with self._locked():
+            if not (self._root / key).exists():
+                return 0
+            references = self._read_references(key) + count
+            self._write_references(key, references)
+        return references
+
+    def _release(self, key: str) -> int:
+        with self._locked():
+            if not (self._root / key).exists():
+                return 0
+            references = max(self._read_references(key) - 1, 0)
+            self._write_references(key, references)
+        return references
+
+    def _collect_unreferenced(self, older_than_seconds: float) -> list[str]:
+        cutoff = time.time() - older_than_seconds
+        collected: list[str] = []
+        with self._locked():
+            for path in self._refs.rglob("*"):
+                if not path.is_file() or path.parent == self._refs:
+                    continue
+                key = path.relative_to(self._refs).as_posix()
+                if path.stat().st_mtime < cutoff and self._read_references(key) == 0:
+                    (self._root / key).unlink(missing_ok=True)
+                    path.unlink()
+                    collected.append(key)
+        return collected
+
+    def _read_references(self, key: str) -> int:
+        try:
+            return int((self._refs / key).read_text())
+        except (FileNotFoundError, ValueError):
+            # Files stored before reference counting are assumed to be in use.
+            return 1 if (self._root / key).exists() else 0
+
+    def _write_references(self, key: str, references: int) -> None:
+        path = self._refs / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._staging / uuid4().hex
+        temporary.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(str(references))
+        os.replace(temporary, path)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self._refs.mkdir(parents=True, exist_ok=True)
+        with (self._refs / ".lock").open("a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _move(source: Path, target: Path) -> None:
+    """Rename ``source`` to ``target``, copying first when they are on different filesystems."""
+    try:
+        os.replace(source, target)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        temporary = target.with_name(f".{target.name}.{uuid4().hex}")
+        shutil.copyfile(source, temporary)
+        os.replace(temporary, target)
+        source.unlink()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import io
+import shutil
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from starlette.concurrency import run_in_threadpool
+
+from app.application.interfaces.file_storage import AbstractFileStorage, StoredFile
+from app.infrastructure.storage.uploads import copy_upload, key_from_url, sharded_key
+
+_MISSING_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+
+
+class S3FileStorage(AbstractFileStorage):
+    """Content-addressed objects in an S3-compatible bucket.
+
+    ``client`` is a boto3-style S3 client (or :class:`InMemoryS3Client`). Uploads are staged in
+    a local temporary file while hashed; the reference count is kept in object metadata, and
+    the object's last-modified time records when it was last uploaded or released. S3 has no
+    atomic increment, so counts are best effort under concurrent writers.
+    """
+
+    def __init__(self, client: Any, *, bucket: str, public_base_url: str) -> None:
+        self._client = client
+        self._bucket = bucket
+        self._url_prefix = f"{public_base_url.rstrip('/')}/"
+
+    async def put(
+        self, source: BinaryIO, *, suffix: str, max_bytes: int, chunk_size: int
+    ) -> StoredFile:
+        return await run_in_threadpool(self._put, source, suffix, max_bytes, chunk_size)
+
+    async def acquire(self, key: str, count: int = 1) -> int:
+        return await run_in_threadpool(self._acquire, key, count)
+
+    async def release(self, key: str) -> int:
+        return await run_in_threadpool(self._release, key)
+
+    async def collect_unreferenced(self, *, older_than_seconds: float) -> list[str]:
+        return await run_in_threadpool(self._collect_unreferenced, older_than_seconds)
+
+    def public_url(self, key: str) -> str:
+        return f"{self._url_prefix}{key}"
+
+    def key_from_url(self, url: str) -> str | None:
+        return key_from_url(url, self._url_prefix)
+
+    @asynccontextmanager
+    async def local_copy(self, key: str) -> AsyncIterator[Path]:
+        with tempfile.TemporaryDirectory() as download_dir:
+            path = Path(download_dir) / Path(key).name
+            await run_in_threadpool(self._download, key, path)
+            yield path
+
+    def _download(self, key: str, path: Path) -> None:
+        try:
+            response = self._client.get_object(Bucket=self._bucket, Key=key)
+        except Exception as exc:
+            if _error_code(exc) in _MISSING_CODES:
+                raise FileNotFoundError(key) from exc
+            raise
+        with path.open("wb") as handle:
+            shutil.copyfileobj(response["Body"], handle)
+
+    def _put(self, source: BinaryIO, suffix: str, max_bytes: int, chunk_size: int) -> StoredFile:
+        with tempfile.TemporaryDirectory() as staging_dir:
+            staged = copy_upload(
+                source, Path(staging_dir) / "upload", max_bytes=max_bytes, chunk_size=chunk_size
+            )
+            key = sharded_key(staged.sha256, suffix)
+            metadata = self._metadata(key)
+            if metadata is not None:
+                references = _references(metadata)
+                self._set_references(key, metadata, references)  # restarts the grace period
+            else:
+                references = 0
+                with staged.path.open("rb") as handle:
+                    self._client.put_object(
+                        Bucket=self._bucket,
+                        Key=key,
+                        Body=handle,
+                        Metadata={"references": "0", "sha256": staged.sha256},
+                    )
+        return StoredFile(key=key, size=staged.size, sha256=staged.sha256, references=references)
+
+    def _acquire(self, key: str, count: int) -> int:
+        metadata = self._metadata(key)
+        if metadata is None:
+            return 0
+        references = _references(metadata) + count
+        self._set_references(key, metadata, references)
+        return references
+
+    def _release(self, key: str) -> int:
+        metadata = self._metadata(key)
+        if metadata is None:
+            return 0
+        references = max(_references(metadata) - 1, 0)
+        self._set_references(key, metadata, references)
+        return references
+
+    def _collect_unreferenced(self, older_than_seconds: float) -> list[str]:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=older_than_seconds)
+        collected: list[str] = []
+        token: str | None = None
+        while True:
+            page = self._client.list_objects_v2(
+                Bucket=self._bucket, **({"ContinuationToken": token} if token else {})
+            )
+            for item in page.get("Contents", []):
+                if item["LastModified"] >= cutoff:
+                    continue
+                metadata = self._metadata(item["Key"])
+                if metadata is not None and _references(metadata) == 0:
+                    self._client.delete_object(Bucket=self._bucket, Key=item["Key"])
+                    collected.append(item["Key"])
+            if not page.get("IsTruncated"):
+                break
+            token = page["NextContinuationToken"]
+        return collected
+
+    def _metadata(self, key: str) -> dict[str, str] | None:
+        try:
+            head = self._client.head_object(Bucket=self._bucket, Key=key)
+        except Exception as exc:
+            if _error_code(exc) in _MISSING_CODES:
+                return None
+            raise
+        return dict(head.get("Metadata", {}))
+
+    def _set_references(self, key: str, metadata: dict[str, str], references: int) -> None:
+        self._client.copy_object(
+            Bucket=self._bucket,
+            Key=key,
+            CopySource={"Bucket": self._bucket, "Key": key},
+            Metadata={**metadata, "references": str(references)},
+            MetadataDirective="REPLACE",
+        )
+
+
+class InMemoryS3Error(Exception):
+    def __init__(self, code: str) -> None:
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class InMemoryS3Client:
+    """Stand-in for the handful of boto3 S3 client calls :class:`S3FileStorage` makes."""
+
+    def __init__(self) -> None:
+        self.objects: dict[tuple[str, str], tuple[bytes, dict[str, str]]] = {}
+        self.modified: dict[tuple[str, str], datetime] = {}
+
+    def put_object(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        Body: BinaryIO | bytes,
+        Metadata: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        data = Body if isinstance(Body, bytes) else Body.read()
+        self.objects[(Bucket, Key)] = (data, dict(Metadata or {}))
+        self.modified[(Bucket, Key)] = datetime.now(timezone.utc)
+        return {}
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        data, metadata = self._object(Bucket, Key)
+        return {"ContentLength": len(data), "Metadata": dict(metadata)}
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        data, metadata = self._object(Bucket, Key)
+        return {"Body": io.BytesIO(data), "ContentLength": len(data), "Metadata": dict(metadata)}
+
+    def copy_object(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        CopySource: dict[str, str],
+        Metadata: dict[str, str] | None = None,
+        MetadataDirective: str = "COPY",
+    ) -> dict[str, Any]:
+        data, metadata = self._object(CopySource["Bucket"], CopySource["Key"])
+        if MetadataDirective == "REPLACE":
+            metadata = dict(Metadata or {})
+        self.objects[(Bucket, Key)] = (data, metadata)
+        self.modified[(Bucket, Key)] = datetime.now(timezone.utc)
+        return {}
+
+    def delete_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self.objects.pop((Bucket, Key), None)
+        self.modified.pop((Bucket, Key), None)
+        return {}
+
+    def list_objects_v2(
+        self, *, Bucket: str, ContinuationToken: str | None = None
+    ) -> dict[str, Any]:
+        contents = [
+            {"Key": key, "LastModified": self.modified[(bucket, key)]}
+            for bucket, key in sorted(self.objects)
+            if bucket == Bucket
+        ]
+        return {"Contents": contents, "IsTruncated": False}
+
+    def _object(self, bucket: str, key: str) -> tuple[bytes, dict[str, str]]:
+        try:
+            return self.objects[(bucket, key)]
+        except KeyError:
+            raise InMemoryS3Error("404") from None
+
+
+def _references(metadata: dict[str, str]) -> int:
+    return int(metadata.get("references", "1"))
+
+
+def _error_code(exc: Exception) -> str | None:
+    response = getattr(exc, "response", None)
+    if not isinstance(response, dict):
+        return None
+    return str(response.get("Error", {}).get("Code"))
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+_SHARDED_KEY = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}\.[a-z0-9]{1,8}$")
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class StoredUpload:
+    path: Path
+    size: int
+    sha256: str
+
+
+def copy_upload(source: BinaryIO, target: Path, *, max_bytes: int, chunk_size: int) -> StoredUpload:
+    """Copy ``source`` to ``target`` in fixed-size chunks, hashing and counting in the same pass.
+
+    The partially written file is removed if the limit is exceeded or the copy fails.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with target.open("wb") as handle:
+            while chunk := source.read(chunk_size):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(f"File exceeds the {max_bytes} byte upload limit")
+                digest.update(chunk)
+                handle.write(chunk)
+    except BaseException:
+        target.unlink(missing_ok=True)
+        raise
+    return StoredUpload(path=target, size=size, sha256=digest.hexdigest())
+
+
+def sharded_key(sha256: str, suffix: str) -> str:
+    """Two-level fan-out (``ab/cd/abcd...``) keeps every directory small."""
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}{suffix}"
+
+
+def key_from_url(url: str, prefix: str) -> str | None:
+    if not url.startswith(prefix):
+        return None
+    key = url[len(prefix) :]
+    return key if _SHARDED_KEY.match(key) else None
@@ -1,15 +1,28 @@
+import asyncio
+import contextlib
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from app.api import metrics
+from app.api.dependencies import (
+    build_job_worker,
+    get_document_extractor,
+    get_job_queue,
+    get_password_hasher,
+    get_skill_matcher,
+)
+from app.api.middleware import RequestMetricsMiddleware, UploadSizeLimitMiddleware
 from app.api.router import api_router
 from app.core.config import get_settings
 from app.core.logging import setup_logging
+from app.core.metrics import monitor_event_loop_lag
 from app.infrastructure.db import models  # noqa: F401 - ensure model metadata is registered
 from app.infrastructure.db.base import Base
-from app.infrastructure.db.session import engine
+from app.infrastructure.db.pool import warm_pool
+from app.infrastructure.db.session import dispose_engine, get_engine
 
 
 def create_app() -> FastAPI:
@@ -32,17 +45,73 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(
+        UploadSizeLimitMiddleware,
+        max_bytes=settings.max_upload_bytes,
+        paths=[f"{settings.api_v1_prefix}/resumes/upload"],
+    )
+    if settings.metrics_enabled:
+        app.add_middleware(RequestMetricsMiddleware, excluded_paths=["/metrics"])
+        app.include_router(metrics.router)
     app.include_router(api_router, prefix=settings.api_v1_prefix)
-    app.mount("/uploads", StaticFiles(directory=upload_path), name="uploads")
+    if settings.storage_backend == "local":
+        app.mount("/uploads", StaticFiles(directory=upload_path), name="uploads")
+
+    @app.on_event("startup")
+    async def connect_database() -> None:
+        engine = get_engine()
+        if settings.db_create_all:
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+        await warm_pool(engine, min(settings.db_pool_warmup_connections, settings.db_pool_size))
+
+    @app.on_event("startup")
+    async def load_skill_taxonomy() -> None:
+        # Compile or map the automaton before traffic, and before extraction workers spawn.
+        get_skill_matcher()
+
+    @app.on_event("startup")
+    async def start_loop_lag_monitor() -> None:
+        if settings.metrics_enabled:
+            app.state.loop_lag_monitor = asyncio.create_task(
+                monitor_event_loop_lag(settings.metrics_loop_lag_interval_seconds)
+            )
 
     @app.on_event("startup")
-    async def create_database_tables() -> None:
-        async with engine.begin() as connection:
-            await connection.run_sync(Base.metadata.create_all)
+    async def start_in_process_job_worker() -> None:
+        # The Redis queue is served by ``app.cli.job_worker``; the in-memory one only from here.
+        if settings.job_queue_backend == "memory":
+            app.state.job_worker_stop = asyncio.Event()
+            app.state.job_worker = asyncio.create_task(
+                build_job_worker(get_job_queue()).run(app.state.job_worker_stop)
+            )
+
+    @app.on_event("shutdown")
+    async def stop_in_process_job_worker() -> None:
+        worker = getattr(app.state, "job_worker", None)
+        if worker is not None:
+            app.state.job_worker_stop.set()
+            await worker
+
+    @app.on_event("shutdown")
+    async def stop_loop_lag_monitor() -> None:
+        monitor = getattr(app.state, "loop_lag_monitor", None)
+        if monitor is not None:
+            monitor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await monitor
 
     @app.on_event("shutdown")
     async def close_database_connections() -> None:
-        await engine.dispose()
+        await dispose_engine()
+
+    @app.on_event("shutdown")
+    async def stop_extraction_workers() -> None:
+        get_document_extractor().shutdown()
+
+    @app.on_event("shutdown")
+    async def stop_password_hasher() -> None:
+        get_password_hasher().shutdown()
 
     return app
 
@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+from app.domain.entities.job import Job, JobStatus
+
+
+class JobRead(BaseModel):
+    id: str
+    kind: str
+    status: JobStatus
+    attempts: int
+    result: Dict[str, Any] | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_entity(cls, job: Job) -> "JobRead":
+        return cls(
+            id=job.id,
+            kind=job.kind,
+            status=job.status,
+            attempts=job.attempts,
+            result=job.result,
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
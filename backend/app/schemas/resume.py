@@ -3,6 +3,10 @@ from typing import List
 
 from pydantic import AnyHttpUrl, BaseModel, Field
 
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.domain.entities.score_card import ScoreCard
+
 
 class JobDescriptionInput(BaseModel):
     role_title: str = Field(..., max_length=255)
@@ -11,6 +15,15 @@ class JobDescriptionInput(BaseModel):
     required_skills: List[str] = Field(default_factory=list)
     preferred_skills: List[str] = Field(default_factory=list)
 
+    def to_entity(self) -> JobDescription:
+        return JobDescription(
+            role_title=self.role_title,
+            company_name=self.company_name,
+            canonical_text=self.canonical_text,
+            required_skills=list(self.required_skills),
+            preferred_skills=list(self.preferred_skills),
+        )
+
 
 class ResumeCreate(BaseModel):
     owner_id: int
@@ -19,6 +32,15 @@ class ResumeCreate(BaseModel):
     extracted_skills: List[str] = Field(default_factory=list)
     extracted_keywords: List[str] = Field(default_factory=list)
 
+    def to_entity(self) -> Resume:
+        return Resume(
+            owner_id=self.owner_id,
+            file_url=str(self.file_url),
+            parsed_text=self.parsed_text,
+            extracted_skills=list(self.extracted_skills),
+            extracted_keywords=list(self.extracted_keywords),
+        )
+
 
 class ResumeRead(ResumeCreate):
     id: int
@@ -26,6 +48,24 @@ class ResumeRead(ResumeCreate):
     updated_at: datetime
 
 
+class ResumeListItem(BaseModel):
+    """A resume restricted to the requested ``fields``; fields not requested are omitted."""
+
+    id: int
+    owner_id: int | None = None
+    file_url: AnyHttpUrl | None = None
+    parsed_text: str | None = None
+    extracted_skills: List[str] | None = None
+    extracted_keywords: List[str] | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class ResumePage(BaseModel):
+    items: List[ResumeListItem]
+    next_cursor: str | None = None
+
+
 class ScoreCardResponse(BaseModel):
     resume_id: int
     job_description_id: int | None
@@ -35,6 +75,18 @@ class ScoreCardResponse(BaseModel):
     overall_score: float
     recommendations: List[str]
 
+    @classmethod
+    def from_entity(cls, score_card: ScoreCard) -> "ScoreCardResponse":
+        return cls(
+            resume_id=score_card.resume_id,
+            job_description_id=score_card.job_description_id,
+            ats_score=score_card.ats_score,
+            keyword_match=score_card.keyword_match,
+            formatting_score=score_card.formatting_score,
+            overall_score=score_card.overall_score,
+            recommendations=list(score_card.recommendations),
+        )
+
 
 class ResumeScoreRequest(BaseModel):
     resume: ResumeCreate
@@ -48,3 +100,61 @@ class ResumeScoreResponse(BaseModel):
 
 class ResumeUploadResponse(BaseModel):
     file_url: AnyHttpUrl
+    size_bytes: int
+    sha256: str
+
+
+class BatchScoreRequest(BaseModel):
+    resumes: List[ResumeCreate] = Field(default_factory=list, max_length=500)
+    resume_ids: List[int] = Field(default_factory=list, max_length=500)
+    job_descriptions: List[JobDescriptionInput] = Field(..., min_length=1, max_length=20)
+
+
+class ScoreStreamRequest(BatchScoreRequest):
+    resume_ids: List[int] = Field(default_factory=list, max_length=10_000)
+
+
+class ScoreStreamItem(BaseModel):
+    """One streamed card: ``resume_index`` follows inline resumes, then ``resume_ids``."""
+
+    resume_index: int
+    job_index: int
+    score_card: ScoreCardResponse
+
+
+class BatchScoreResponse(BaseModel):
+    resume_ids: List[int]
+    results: List[List[ScoreCardResponse]]
+
+
+class CandidateRankRequest(BaseModel):
+    owner_id: int
+    job_description: JobDescriptionInput
+    limit: int = Field(default=50, ge=1, le=500)
+
+
+class CandidateRankResponse(BaseModel):
+    results: List[ResumeScoreResponse]
+
+
+class RescoreRequest(BaseModel):
+    resume_ids: List[int] = Field(..., min_length=1, max_length=500)
+    job_description: JobDescriptionInput | None = None
+
+
+class RescoreResponse(BaseModel):
+    results: List[ScoreCardResponse]
+    reused_resume_ids: List[int]
+
+
+class ResumeImportError(BaseModel):
+    line: int
+    error: str
+
+
+class ResumeImportResponse(BaseModel):
+    imported: int
+    scored: int
+    failed: int
+    checkpoint: int = Field(..., description="Input lines committed; pass as skip_lines to resume")
+    errors: List[ResumeImportError] = Field(default_factory=list)
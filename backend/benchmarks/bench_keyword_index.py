@@ -0,0 +1,56 @@
+"""Compare MaxScore top-k ranking with scoring every resume.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_keyword_index --resumes 1000000 --limit 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from app.infrastructure.search.keyword_index import KeywordIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=200_000)
+    parser.add_argument("--skills", type=int, default=2_000)
+    parser.add_argument("--job-skills", type=int, default=12)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    # Zipf-like skill popularity so a few skills have very long posting lists.
+    skills = [f"skill{index}" for index in range(args.skills)]
+    popularity = [1 / (rank + 1) for rank in range(args.skills)]
+    documents = [
+        (resume_id, set(rng.choices(skills, weights=popularity, k=15)))
+        for resume_id in range(args.resumes)
+    ]
+    started = time.perf_counter()
+    index = KeywordIndex.from_entries(documents)
+    print(f"index build: {time.perf_counter() - started:8.3f}s for {len(index):,} resumes")
+
+    weights = dict.fromkeys(rng.sample(skills[:200], args.job_skills), 1.0)
+
+    started = time.perf_counter()
+    ranked = index.top_k(weights, args.limit)
+    pruned = time.perf_counter() - started
+    print(
+        f"top-k:       {pruned:8.3f}s  postings scanned {ranked.postings_scanned}/{len(weights)}"
+        f"  documents scored {ranked.documents_scored:,}"
+    )
+
+    started = time.perf_counter()
+    exhaustive = sorted(
+        (len(weights.keys() & terms) for _, terms in documents), reverse=True
+    )[: args.limit]
+    print(f"exhaustive:  {time.perf_counter() - started:8.3f}s")
+    assert [score for _, score in ranked.hits] == exhaustive
+
+
+if __name__ == "__main__":
+    main()
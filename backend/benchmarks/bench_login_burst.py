@@ -0,0 +1,128 @@
+"""Measure read latency on the same worker while a burst of logins is hashing passwords.
+
+Compares bcrypt run inline on the event loop with :class:`ExecutorPasswordHasher`. Run from
+``backend/``::
+
+    python -m benchmarks.bench_login_burst --logins 32 --rounds 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.api.dependencies import (
+    get_analytics_cache,
+    get_current_user,
+    get_password_hasher,
+    get_score_cache,
+)
+from app.api.v1.endpoints import auth, resumes
+from app.application.interfaces.password_hasher import AbstractPasswordHasher
+from app.domain.entities.user import User
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.session import get_db_session
+from app.infrastructure.security.hasher import ExecutorPasswordHasher
+
+CREDENTIALS = {"email": "bench@example.com", "password": "secret-password"}
+
+
+class InlinePasswordHasher(AbstractPasswordHasher):
+    """The previous behaviour: bcrypt called directly inside the request handler."""
+
+    def __init__(self, *, rounds: int) -> None:
+        self._context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+    async def hash(self, password: str) -> str:
+        return self._context.hash(password)
+
+    async def verify(self, password: str, hashed_password: str) -> tuple[bool, str | None]:
+        return self._context.verify_and_update(password, hashed_password)
+
+
+async def run(
+    hasher: AbstractPasswordHasher, *, logins: int, probes: int
+) -> tuple[list[float], int]:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}", poolclass=NullPool
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+        async def session_override():
+            async with sessions() as session:
+                yield session
+
+        app = FastAPI()
+        app.include_router(resumes.router, prefix="/resumes")
+        app.include_router(auth.router, prefix="/auth")
+        app.dependency_overrides[get_db_session] = session_override
+        app.dependency_overrides[get_password_hasher] = lambda: hasher
+        app.dependency_overrides[get_score_cache] = lambda: None
+        app.dependency_overrides[get_analytics_cache] = lambda: None
+        # The probe measures the event loop during the burst, not token verification.
+        app.dependency_overrides[get_current_user] = lambda: User(
+            id=1, email=CREDENTIALS["email"], hashed_password=""
+        )
+
+        async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+            await client.post("/auth/register", json=CREDENTIALS)
+            resume = {"owner_id": 1, "file_url": "http://elsewhere/r.pdf", "parsed_text": "python"}
+            scored = await client.post("/resumes/score", json={"resume": resume})
+            path = f"/resumes/{scored.json()['resume']['id']}"
+
+            async def probe() -> list[float]:
+                latencies = []
+                for _ in range(probes):
+                    started = time.perf_counter()
+                    await client.get(path)
+                    latencies.append(time.perf_counter() - started)
+                    await asyncio.sleep(0.005)
+                return latencies
+
+            burst = [client.post("/auth/login", json=CREDENTIALS) for _ in range(logins)]
+            latencies, *logged_in = await asyncio.gather(probe(), *burst)
+        await engine.dispose()
+    return latencies, sum(response.status_code == 503 for response in logged_in)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--probes", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-pending", type=int, default=64)
+    args = parser.parse_args()
+
+    hashers: dict[str, AbstractPasswordHasher] = {
+        "inline": InlinePasswordHasher(rounds=args.rounds),
+        "executor": ExecutorPasswordHasher(
+            rounds=args.rounds, max_workers=args.workers, max_pending=args.max_pending
+        ),
+    }
+    for name, hasher in hashers.items():
+        latencies, rejected = asyncio.run(run(hasher, logins=args.logins, probes=args.probes))
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(
+            f"{name:>8}: p50 {statistics.median(latencies) * 1000:8.1f} ms  "
+            f"p99 {p99 * 1000:8.1f} ms  max {latencies[-1] * 1000:8.1f} ms  "
+            f"{rejected}/{args.logins} logins busy"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Memory per API worker with and without preloading in the prefork parent.
+
+Starts ``app.cli.serve`` twice against a throwaway SQLite database: once preloading the app and
+its scoring data in the parent, and once with ``--no-preload`` so every worker imports it
+itself. Batch-score requests are sent until every worker has used the sparse engine. Then
+each worker's resident (RSS), proportional (PSS) and private (USS) memory is read from
+``/proc``. PSS splits shared pages between the processes that map them, so the PSS total is
+what the workers really cost together. Linux only. Run from ``backend/``::
+
+    python -m benchmarks.bench_prefork_memory --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+from app.cli.serve import worker_memory
+from benchmarks.bench_startup import environment
+from benchmarks.corpus import CorpusGenerator
+
+PASSWORD = "memory-benchmark-password"
+# A shared object only the sparse engine loads, so its mapping shows a worker has used it.
+_ENGINE_MARKER = "_multiarray_umath"
+
+
+def worker_pids(parent: int) -> list[int]:
+    children = Path(f"/proc/{parent}/task/{parent}/children").read_text().split()
+    return sorted(map(int, children))
+
+
+def engine_loaded(pid: int) -> bool:
+    return _ENGINE_MARKER in Path(f"/proc/{pid}/maps").read_text()
+
+
+def wait_until_serving(
+    server: subprocess.Popen[bytes], client: httpx.Client, workers: int, timeout: float
+) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with status {server.returncode}")
+        try:
+            if len(worker_pids(server.pid)) == workers:
+                if client.get("/api/v1/system/pool").status_code == 200:
+                    return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    raise RuntimeError(f"server not serving within {timeout:g}s")
+
+
+def exercise_workers(
+    server: subprocess.Popen[bytes], client: httpx.Client, resumes: int, timeout: float
+) -> None:
+    email = f"memory-{time.time_ns()}@example.com"
+    credentials = {"email": email, "password": PASSWORD}
+    client.post("/api/v1/auth/register", json=credentials).raise_for_status()
+    login = client.post("/api/v1/auth/login", json=credentials)
+    login.raise_for_status()
+    # A fresh connection per request lets every worker accept some of them.
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}", "Connection": "close"}
+    corpus = CorpusGenerator()
+    body = {
+        "resumes": [
+            {
+                "owner_id": 1,
+                "file_url": "http://bench/resume.pdf",
+                "parsed_text": corpus.text(2_000),
+                "extracted_keywords": corpus.skills(20),
+            }
+            for _ in range(resumes)
+        ],
+        "job_descriptions": [{"role_title": "Engineer", "required_skills": corpus.skills(20)}],
+    }
+
+    def score() -> None:
+        client.post("/api/v1/resumes/score/batch", json=body, headers=headers).raise_for_status()
+
+    deadline = time.monotonic() + timeout
+    pids = worker_pids(server.pid)
+    with ThreadPoolExecutor(max_workers=len(pids)) as pool:
+        while not all(map(engine_loaded, pids)):
+            if time.monotonic() > deadline:
+                raise RuntimeError("not every worker served a batch in time")
+            list(pool.map(lambda _: score(), range(len(pids))))
+
+
+def measure(env: dict[str, str], args: argparse.Namespace, preload: bool) -> dict[str, float]:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    command = [
+        sys.executable, "-m", "app.cli.serve", "--workers", str(args.workers), "--port", str(port)
+    ]
+    server = subprocess.Popen(
+        command if preload else [*command, "--no-preload"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=60) as client:
+            wait_until_serving(server, client, args.workers, args.timeout)
+            exercise_workers(server, client, args.resumes, args.timeout)
+        workers = [worker_memory(pid) for pid in worker_pids(server.pid)]
+        parent = worker_memory(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+    mib = 2**20
+    return {
+        "rss": statistics.mean(item["rss"] for item in workers) / mib,
+        "pss": statistics.mean(item["pss"] for item in workers) / mib,
+        "private": statistics.mean(item["private"] for item in workers) / mib,
+        "total_pss": (sum(item["pss"] for item in workers) + parent["pss"]) / mib,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--resumes", type=int, default=300, help="rows per batch-score request")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            **environment(Path(workdir)),
+            "PASSWORD_HASH_ROUNDS": "4",
+            "SCORE_CACHE_REDIS_ENABLED": "false",
+            "ANALYTICS_CACHE_ENABLED": "false",
+        }
+        subprocess.run(
+            [sys.executable, "-m", "app.cli.compile_skills"],
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+        results = {
+            "preloaded": measure(env, args, preload=True),
+            "per-worker import": measure(env, args, preload=False),
+        }
+
+    print(f"{args.workers} workers, MiB per worker (total PSS includes the parent)")
+    print(f"{'mode':>18} {'rss':>8} {'pss':>8} {'private':>8} {'total pss':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:>18} {result['rss']:>8.1f} {result['pss']:>8.1f} "
+            f"{result['private']:>8.1f} {result['total_pss']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
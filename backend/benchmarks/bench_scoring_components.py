@@ -0,0 +1,225 @@
+"""Throughput and peak allocation of the stages behind ResumeScoringService.
+
+Runs against the in-memory repository, so no database is needed. Only public entry points are
+timed: tokenizing resume and job text, fingerprinting a pair for the score caches, and
+``score_batch`` for one card and for a small batch. The service's own keyword, formatting,
+experience and recommendation stage timings are read from the scoring metrics and reported per
+card, but not gated: on small inputs some take well under a microsecond, where timer overhead
+dominates. A regression in any of them shows up in the ``score_*`` rows.
+
+Results are compared with a stored baseline and the process exits non-zero when any component
+is slower or allocates more than the tolerance allows. Run from ``backend/``::
+
+    python -m benchmarks.bench_scoring_components
+    python -m benchmarks.bench_scoring_components --save-baseline  # after an intended change
+
+Each sample repeats the operation enough times to take at least ``--sample-seconds``.
+Throughput is compared relative to a fixed pure-Python calibration workload sampled in
+alternation with each component, so a baseline recorded on one machine remains meaningful on
+a faster or slower one, or one whose speed drifts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import timeit
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from app.application.services.resume_scoring import (
+    ResumeScoringService,
+    score_fingerprint,
+    scoring_version,
+)
+from app.core.metrics import SCORING_STAGE_SECONDS
+from app.domain.terms import term_frequencies
+from app.infrastructure.repositories.memory import InMemoryResumeRepository
+from benchmarks.corpus import PROFILES, CorpusGenerator, CorpusProfile
+
+DEFAULT_BASELINE = Path(__file__).with_name("baselines") / "scoring_components.json"
+# Small absolute allowance so components allocating a few dozen bytes do not flap.
+ALLOCATION_SLACK_BYTES = 1_024
+STAGES = ("keyword", "formatting", "experience", "recommendations")
+
+
+@dataclass(slots=True)
+class ComponentResult:
+    ops_per_second: float
+    # Throughput as a multiple of the calibration workload's, comparable across machines.
+    relative_speed: float
+    peak_bytes: int
+
+
+def _calibration_workload() -> Callable[[], Any]:
+    words = [f"word{index % 997}" for index in range(5_000)]
+    return lambda: Counter(words)
+
+
+def _batch_size(timer: timeit.Timer, sample_seconds: float) -> int:
+    number = 1
+    while timer.timeit(number) < sample_seconds:
+        number *= 2
+    return number
+
+
+def measure(
+    operation: Callable[[], Any], *, samples: int, sample_seconds: float
+) -> ComponentResult:
+    """Median throughput over ``samples`` batched samples, and peak bytes of one call.
+
+    Each sample is paired with a calibration sample taken right before it, and the speed
+    relative to the calibration is the median of the pairs' ratios, so neither a drift in
+    machine speed during the run nor a short burst of it skews the result.
+    """
+    operation()  # warm caches and lazily built state before timing
+    timer = timeit.Timer(operation)
+    calibration = timeit.Timer(_calibration_workload())
+    number = _batch_size(timer, sample_seconds)
+    calibration_number = _batch_size(calibration, sample_seconds)
+    speeds: list[float] = []
+    ratios: list[float] = []
+    for _ in range(samples):
+        calibration_speed = calibration_number / calibration.timeit(calibration_number)
+        speeds.append(number / timer.timeit(number))
+        ratios.append(speeds[-1] / calibration_speed)
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return ComponentResult(
+        ops_per_second=statistics.median(speeds),
+        relative_speed=statistics.median(ratios),
+        peak_bytes=peak,
+    )
+
+
+def components(
+    profile: CorpusProfile, loop: asyncio.AbstractEventLoop
+) -> dict[str, Callable[[], Any]]:
+    service = ResumeScoringService(InMemoryResumeRepository())
+    resumes, jobs = CorpusGenerator().corpus(profile, resumes=4, jobs=2)
+    resume, job = resumes[0], jobs[0]
+    version = scoring_version()
+    return {
+        "resume_terms": lambda: term_frequencies(resume.parsed_text),
+        "job_terms": lambda: term_frequencies(job.canonical_text),
+        "fingerprint": lambda: score_fingerprint(resume, job, version=version),
+        "score_one": lambda: loop.run_until_complete(
+            service.score_batch(resumes=[resume], job_descriptions=[job])
+        ),
+        "score_batch": lambda: loop.run_until_complete(
+            service.score_batch(resumes=resumes, job_descriptions=jobs)
+        ),
+    }
+
+
+def stage_totals() -> dict[str, tuple[int, float]]:
+    """Observations and summed seconds recorded so far for each scoring stage."""
+    totals: dict[str, tuple[int, float]] = {}
+    for stage in STAGES:
+        child = SCORING_STAGE_SECONDS.labels(stage)
+        totals[stage] = (sum(child.counts), child.sum)
+    return totals
+
+
+def stage_seconds(
+    before: dict[str, tuple[int, float]], after: dict[str, tuple[int, float]]
+) -> dict[str, float]:
+    """Mean seconds per card spent in each stage between two ``stage_totals`` readings."""
+    return {
+        stage: (after[stage][1] - before[stage][1]) / max(after[stage][0] - before[stage][0], 1)
+        for stage in STAGES
+    }
+
+
+def compare(
+    results: dict[str, dict[str, ComponentResult]], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    regressions: list[str] = []
+    for profile, measured in results.items():
+        for name, result in measured.items():
+            stored = baseline["profiles"].get(profile, {}).get(name)
+            if stored is None:
+                continue
+            expected = ComponentResult(**stored)
+            if result.relative_speed < expected.relative_speed * (1 - tolerance):
+                regressions.append(
+                    f"{profile}/{name}: {result.relative_speed:.4g}x calibration, "
+                    f"baseline {expected.relative_speed:.4g}x"
+                )
+            allowed_bytes = expected.peak_bytes * (1 + tolerance) + ALLOCATION_SLACK_BYTES
+            if result.peak_bytes > allowed_bytes:
+                regressions.append(
+                    f"{profile}/{name}: {result.peak_bytes:,} peak bytes, "
+                    f"baseline {expected.peak_bytes:,}"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=list(PROFILES))
+    parser.add_argument("--samples", type=int, default=7)
+    parser.add_argument("--sample-seconds", type=float, default=0.02)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+    timing = {"samples": args.samples, "sample_seconds": args.sample_seconds}
+
+    results: dict[str, dict[str, ComponentResult]] = {}
+    loop = asyncio.new_event_loop()
+    for profile_name in args.profiles:
+        profile = PROFILES[profile_name]
+        print(f"{profile.name}: {profile.text_bytes:,} bytes of text, {profile.skills:,} skills")
+        results[profile.name] = {}
+        before = stage_totals()
+        for name, operation in components(profile, loop).items():
+            result = measure(operation, **timing)
+            results[profile.name][name] = result
+            print(
+                f"  {name:>16}: {result.ops_per_second:12,.1f} ops/s  "
+                f"{result.relative_speed:10.4g}x calibration  {result.peak_bytes:12,} peak bytes"
+            )
+        per_card = stage_seconds(before, stage_totals())
+        print(
+            "  stages per card: "
+            + ", ".join(f"{stage} {seconds * 1e6:,.2f}us" for stage, seconds in per_card.items())
+        )
+    loop.close()
+
+    if args.save_baseline:
+        stored = {
+            "profiles": {
+                profile: {name: asdict(result) for name, result in measured.items()}
+                for profile, measured in results.items()
+            },
+        }
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; rerun with --save-baseline", file=sys.stderr)
+        return
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
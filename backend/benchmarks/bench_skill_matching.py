@@ -0,0 +1,97 @@
+"""Compare one regex per skill with the compiled taxonomy automaton on synthetic resumes.
+
+Builds a taxonomy of ``--skills`` entries (a third of them multi-word, each with one alias),
+sprinkles mentions into corpus text and reports resumes per second for both matchers, plus the
+compile time, compiled size and the cost of opening the compiled file. Run from ``backend/``::
+
+    python -m benchmarks.bench_skill_matching --skills 5000 --text-bytes 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from app.infrastructure.skills.automaton import SkillAutomaton, compile_taxonomy, write_compiled
+from benchmarks.corpus import CorpusGenerator
+
+
+def build_taxonomy(count: int) -> dict[str, list[str]]:
+    taxonomy: dict[str, list[str]] = {}
+    for index in range(count):
+        name = f"skill{index} platform" if index % 3 == 0 else f"skill{index}"
+        taxonomy[name] = [f"alias{index}"]
+    return taxonomy
+
+
+def build_texts(
+    taxonomy: dict[str, list[str]], count: int, text_bytes: int, rng: random.Random
+) -> list[str]:
+    corpus = CorpusGenerator()
+    patterns = [pattern for name, aliases in taxonomy.items() for pattern in (name, *aliases)]
+    texts: list[str] = []
+    for _ in range(count):
+        words = corpus.text(text_bytes).split(" ")
+        for _ in range(max(1, len(words) // 50)):
+            words[rng.randrange(len(words))] = rng.choice(patterns)
+        texts.append(" ".join(words))
+    return texts
+
+
+def regex_matcher(taxonomy: dict[str, list[str]]) -> Callable[[str], list[str]]:
+    compiled = [
+        (name, re.compile(r"\b(?:" + "|".join(map(re.escape, (name, *aliases))) + r")\b", re.I))
+        for name, aliases in taxonomy.items()
+    ]
+    return lambda text: [name for name, pattern in compiled if pattern.search(text)]
+
+
+def throughput(match: Callable[[str], list[str]], texts: list[str], min_seconds: float) -> float:
+    calls = 0
+    started = time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < min_seconds or calls < len(texts):
+        match(texts[calls % len(texts)])
+        calls += 1
+    return calls / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--skills", type=int, default=5_000)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--text-bytes", type=int, default=20_000)
+    parser.add_argument("--min-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    taxonomy = build_taxonomy(args.skills)
+    texts = build_texts(taxonomy, args.resumes, args.text_bytes, rng)
+
+    started = time.perf_counter()
+    compiled = compile_taxonomy(taxonomy)
+    compile_seconds = time.perf_counter() - started
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "skills.automaton"
+        write_compiled(path, compiled)
+        started = time.perf_counter()
+        automaton = SkillAutomaton.open(path)
+        open_seconds = time.perf_counter() - started
+        print(
+            f"{args.skills:,} skills: compiled in {compile_seconds * 1000:.1f}ms to "
+            f"{len(compiled):,} bytes, opened in {open_seconds * 1000:.2f}ms"
+        )
+        regex = regex_matcher(taxonomy)
+        for name, match in (("regex per skill", regex), ("automaton", automaton.find)):
+            rate = throughput(match, texts, args.min_seconds)
+            print(f"  {name:>16}: {rate:10,.1f} resumes/s")
+
+
+if __name__ == "__main__":
+    main()
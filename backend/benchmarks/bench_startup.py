@@ -0,0 +1,144 @@
+"""Cold-start cost of a worker: application import time and time to the first 200 response.
+
+Each run starts a fresh interpreter, so nothing is shared with earlier runs beyond the OS page
+cache. The server runs under uvicorn against a throwaway SQLite database. Run from
+``backend/``::
+
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --max-import-seconds 1.5 --max-first-response-seconds 3
+
+The process exits non-zero when a budget is exceeded or when importing the application loads
+any module listed in ``--forbid``. Those are heavy libraries that only specific code paths
+need.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+HEAVY_MODULES = ("sklearn", "scipy", "numpy", "pandas", "openai", "celery")
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+print(json.dumps({"seconds": time.perf_counter() - started, "modules": sorted(sys.modules)}))
+"""
+
+
+def environment(workdir: Path) -> dict[str, str]:
+    return {
+        **os.environ,
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "startup-benchmark-secret"),
+        "DEBUG": "false",
+        "DATABASE_URL": f"sqlite+aiosqlite:///{workdir / 'startup.db'}",
+        "DB_CREATE_ALL": "true",
+        "UPLOAD_DIR": str(workdir / "uploads"),
+        "UPLOAD_STATE_DIR": str(workdir / "upload-state"),
+        "SKILL_AUTOMATON_PATH": str(workdir / "skills.automaton"),
+        "METRICS_LOOP_LAG_INTERVAL_SECONDS": "60",
+    }
+
+
+def measure_import(env: dict[str, str]) -> tuple[float, list[str]]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE], env=env, capture_output=True, text=True, check=True
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result["seconds"], result["modules"]
+
+
+def measure_first_response(env: dict[str, str], path: str, timeout: float) -> float:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1.0) as client:
+            while time.perf_counter() - started < timeout:
+                if server.poll() is not None:
+                    raise RuntimeError(f"server exited with status {server.returncode}")
+                try:
+                    if client.get(path).status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.01)
+        raise RuntimeError(f"no 200 from {path} within {timeout:g}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/api/v1/system/pool")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--max-import-seconds", type=float, default=None)
+    parser.add_argument("--max-first-response-seconds", type=float, default=None)
+    parser.add_argument("--forbid", nargs="*", default=list(HEAVY_MODULES))
+    args = parser.parse_args()
+
+    failures: list[str] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        env = environment(Path(workdir))
+        # Deployments compile the skill taxonomy before starting workers (scripts/start.sh).
+        subprocess.run(
+            [sys.executable, "-m", "app.cli.compile_skills"],
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+        imports: list[float] = []
+        responses: list[float] = []
+        loaded: set[str] = set()
+        for _ in range(args.runs):
+            seconds, modules = measure_import(env)
+            imports.append(seconds)
+            loaded.update(modules)
+            responses.append(measure_first_response(env, args.path, args.timeout))
+
+    import_median = statistics.median(imports)
+    response_median = statistics.median(responses)
+    print(f"import app.main:   median {import_median:.3f}s  max {max(imports):.3f}s")
+    print(f"first 200 response: median {response_median:.3f}s  max {max(responses):.3f}s")
+    heavy = sorted(name for name in args.forbid if name in loaded)
+    if heavy:
+        failures.append(f"importing the app loaded {', '.join(heavy)}")
+    if args.max_import_seconds is not None and import_median > args.max_import_seconds:
+        failures.append(f"import took {import_median:.3f}s, budget {args.max_import_seconds:g}s")
+    if (
+        args.max_first_response_seconds is not None
+        and response_median > args.max_first_response_seconds
+    ):
+        failures.append(
+            f"first response took {response_median:.3f}s, "
+            f"budget {args.max_first_response_seconds:g}s"
+        )
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
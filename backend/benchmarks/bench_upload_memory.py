@@ -0,0 +1,127 @@
+"""Measure peak RSS for concurrent resume uploads.
+
+Compares the streaming upload endpoint with a handler that reads the whole file into memory.
+Request bodies are generated chunk by chunk straight into the ASGI app, so the client holds no
+payload copies and the numbers reflect the server side only. Each mode runs in a fresh process.
+Run from ``backend/``::
+
+    python -m benchmarks.bench_upload_memory --uploads 20 --size-mb 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi import FastAPI, File, UploadFile  # noqa: E402
+
+from app.api.v1.endpoints import resumes  # noqa: E402
+
+_BOUNDARY = b"benchmarkboundary"
+_CHUNK = 64 * 1024
+
+
+def build_app(upload_dir: Path) -> FastAPI:
+    app = FastAPI()
+    app.include_router(resumes.router, prefix="/resumes")
+
+    @app.post("/buffered")
+    async def buffered_upload(file: UploadFile = File(...)) -> dict[str, int]:
+        contents = await file.read()
+        (upload_dir / f"{uuid4().hex}.pdf").write_bytes(contents)
+        return {"size_bytes": len(contents)}
+
+    return app
+
+
+async def post_upload(app: FastAPI, path: str, size: int) -> int:
+    head = (
+        b"--" + _BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="resume.pdf"\r\n'
+        b"Content-Type: application/pdf\r\n\r\n"
+    )
+    tail = b"\r\n--" + _BOUNDARY + b"--\r\n"
+    block = b"%" * _CHUNK
+    body = (block[: min(_CHUNK, size - offset)] for offset in range(0, size, _CHUNK))
+    chunks = [head, *body, tail]
+    status: list[int] = []
+
+    async def receive() -> dict[str, object]:
+        body = chunks.pop(0) if chunks else b""
+        await asyncio.sleep(0)
+        return {"type": "http.request", "body": body, "more_body": bool(chunks)}
+
+    async def send(message: dict[str, object]) -> None:
+        if message["type"] == "http.response.start":
+            status.append(int(message["status"]))  # type: ignore[arg-type]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"multipart/form-data; boundary=" + _BOUNDARY)],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    return status[0]
+
+
+async def run_mode(path: str, uploads: int, size: int) -> None:
+    with tempfile.TemporaryDirectory() as upload_dir:
+        os.environ["UPLOAD_DIR"] = upload_dir
+        app = build_app(Path(upload_dir))
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*(post_upload(app, path, size) for _ in range(uploads)))
+        elapsed = time.perf_counter() - started
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert all(code in (200, 201) for code in statuses), statuses
+    print(f"{path:>16}: peak RSS growth {(after - before) / 1024:8.1f} MiB  {elapsed:6.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploads", type=int, default=20)
+    parser.add_argument("--size-mb", type=int, default=8)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.path:
+        asyncio.run(run_mode(args.path, args.uploads, args.size_mb * 1024 * 1024))
+        return
+    for path in ("/buffered", "/resumes/upload"):
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.bench_upload_memory",
+                "--uploads",
+                str(args.uploads),
+                "--size-mb",
+                str(args.size_mb),
+                "--path",
+                path,
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Deterministic synthetic resumes and job descriptions for benchmarks.
+
+The same ``seed`` and sizes always produce the same corpus, so runs on different commits
+score identical inputs.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+
+VOCABULARY_SIZE = 20_000
+SKILL_POOL_SIZE = 5_000
+
+
+@dataclass(frozen=True, slots=True)
+class CorpusProfile:
+    name: str
+    text_bytes: int
+    skills: int
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        CorpusProfile("small", text_bytes=1_000, skills=10),
+        CorpusProfile("medium", text_bytes=20_000, skills=200),
+        CorpusProfile("large", text_bytes=200_000, skills=2_000),
+    )
+}
+
+
+class CorpusGenerator:
+    def __init__(self, seed: int = 13) -> None:
+        self._rng = random.Random(seed)
+        # Zipf-like frequencies so a handful of terms dominate, as in real prose.
+        self._vocabulary = [f"term{index}" for index in range(VOCABULARY_SIZE)]
+        self._weights = [1 / (rank + 1) for rank in range(VOCABULARY_SIZE)]
+        self._skills = [f"skill{index}" for index in range(SKILL_POOL_SIZE)]
+
+    def text(self, size_bytes: int) -> str:
+        """Roughly ``size_bytes`` of words split into paragraphs of about 60 words."""
+        paragraphs: list[str] = []
+        written = 0
+        while written < size_bytes:
+            paragraph = " ".join(self._rng.choices(self._vocabulary, self._weights, k=60))
+            paragraphs.append(paragraph)
+            written += len(paragraph) + 2
+        return "\n\n".join(paragraphs)[:size_bytes]
+
+    def skills(self, count: int) -> list[str]:
+        return self._rng.sample(self._skills, min(count, SKILL_POOL_SIZE))
+
+    def resume(self, *, text_bytes: int, skills: int, resume_id: int = 1) -> Resume:
+        return Resume(
+            id=resume_id,
+            owner_id=1,
+            file_url=f"http://localhost/uploads/{resume_id}.pdf",
+            parsed_text=self.text(text_bytes),
+            extracted_skills=self.skills(skills),
+            extracted_keywords=self.skills(skills),
+        )
+
+    def job_description(self, *, text_bytes: int, skills: int) -> JobDescription:
+        required = self.skills(skills)
+        return JobDescription(
+            role_title="Synthetic role",
+            canonical_text=self.text(text_bytes),
+            required_skills=required[: len(required) // 2],
+            preferred_skills=required[len(required) // 2 :],
+        )
+
+    def corpus(
+        self, profile: CorpusProfile, *, resumes: int, jobs: int
+    ) -> tuple[list[Resume], list[JobDescription]]:
+        return (
+            [
+                self.resume(text_bytes=profile.text_bytes, skills=profile.skills, resume_id=index)
+                for index in range(1, resumes + 1)
+            ],
+            [
+                self.job_description(text_bytes=profile.text_bytes // 4, skills=profile.skills)
+                for _ in range(jobs)
+            ],
+        )
@@ -0,0 +1,189 @@
+"""Drive the real application in-process with concurrent clients and report per-endpoint latency.
+
+Uses ``create_app`` with its startup and shutdown hooks, against a throwaway SQLite database
+unless ``--database-url`` points elsewhere. Redis-backed caches are off by default so no other
+services are needed. Run from ``backend/``::
+
+    python -m benchmarks.load_api --clients 32 --requests 2000
+    python -m benchmarks.load_api --database-url postgresql+asyncpg://user:pw@host/db --redis
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+
+from benchmarks.corpus import CorpusGenerator
+
+PASSWORD = "load-test-password"
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 20_000 + b"\n%%EOF"
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def configure_environment(args: argparse.Namespace, workdir: Path) -> None:
+    """Settings are read once at import, so this must run before the app is imported."""
+    os.environ.setdefault("SECRET_KEY", "load-test-secret")
+    os.environ["DEBUG"] = "false"  # SQL echo and debug logging would dominate the timings
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{workdir / 'load.db'}"
+    if not args.database_url:
+        os.environ["DB_CREATE_ALL"] = "true"
+    os.environ["UPLOAD_DIR"] = str(workdir / "uploads")
+    os.environ["STORAGE_BACKEND"] = "local"
+    os.environ["PASSWORD_HASH_ROUNDS"] = "4"
+    if not args.redis:
+        os.environ["SCORE_CACHE_REDIS_ENABLED"] = "false"
+        os.environ["ANALYTICS_CACHE_ENABLED"] = "false"
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    from loguru import logger
+
+    from app.core.config import get_settings
+    from app.main import create_app
+
+    app = create_app()
+    # aiosqlite logs every operation at DEBUG, which would dominate the measured latency.
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    prefix = get_settings().api_v1_prefix
+    corpus = CorpusGenerator()
+    stats: dict[str, EndpointStats] = defaultdict(EndpointStats)
+    await app.router.startup()
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://load", timeout=60) as client:
+            email = f"load-{time.time_ns()}@example.com"
+            registered = await client.post(
+                f"{prefix}/auth/register", json={"email": email, "password": PASSWORD}
+            )
+            registered.raise_for_status()
+            owner_id = registered.json()["id"]
+            login = await client.post(
+                f"{prefix}/auth/login", json={"email": email, "password": PASSWORD}
+            )
+            login.raise_for_status()
+            client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+            texts = [corpus.text(args.text_bytes) for _ in range(32)]
+            skills = [corpus.skills(args.skills) for _ in range(32)]
+            job = {
+                "role_title": "Backend engineer",
+                "canonical_text": corpus.text(args.text_bytes // 4),
+                "required_skills": corpus.skills(args.skills),
+            }
+
+            def upload() -> Awaitable[httpx.Response]:
+                files = {"file": ("resume.pdf", PDF_BYTES, "application/pdf")}
+                return client.post(f"{prefix}/resumes/upload", files=files)
+
+            def score(index: int) -> Awaitable[httpx.Response]:
+                resume = {
+                    "owner_id": owner_id,
+                    "file_url": "http://load/uploads/resume.pdf",
+                    "parsed_text": texts[index % len(texts)],
+                    "extracted_keywords": skills[index % len(skills)],
+                }
+                return client.post(
+                    f"{prefix}/resumes/score", json={"resume": resume, "job_description": job}
+                )
+
+            def list_page() -> Awaitable[httpx.Response]:
+                params = {"owner_id": owner_id, "limit": 20, "fields": "created_at,file_url"}
+                return client.get(f"{prefix}/resumes/", params=params)
+
+            def analytics() -> Awaitable[httpx.Response]:
+                return client.get(f"{prefix}/analytics/summary", params={"owner_id": owner_id})
+
+            mix: dict[str, tuple[float, Callable[[int], Awaitable[httpx.Response]]]] = {
+                "upload": (args.upload_weight, lambda index: upload()),
+                "score": (args.score_weight, score),
+                "list": (args.list_weight, lambda index: list_page()),
+                "analytics": (args.analytics_weight, lambda index: analytics()),
+            }
+            names = list(mix)
+            weights = [mix[name][0] for name in names]
+            rng = random.Random(7)
+            plan = rng.choices(names, weights=weights, k=args.requests)
+            queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+            for item in enumerate(plan):
+                queue.put_nowait(item)
+
+            async def worker() -> None:
+                while not queue.empty():
+                    index, name = queue.get_nowait()
+                    started = time.perf_counter()
+                    try:
+                        response = await mix[name][1](index)
+                        failed = response.status_code >= 400
+                    except httpx.HTTPError:
+                        failed = True
+                    stats[name].latencies.append(time.perf_counter() - started)
+                    stats[name].errors += failed
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.clients)))
+            elapsed = time.perf_counter() - started
+    finally:
+        await app.router.shutdown()
+    report(stats, elapsed)
+
+
+def report(stats: dict[str, EndpointStats], elapsed: float) -> None:
+    total = sum(len(item.latencies) for item in stats.values())
+    print(f"{total:,} requests in {elapsed:.2f}s: {total / elapsed:,.1f} req/s overall")
+    print(
+        f"{'endpoint':>10} {'count':>7} {'errors':>6} {'req/s':>8} "
+        f"{'p50':>9} {'p95':>9} {'p99':>9}"
+    )
+    for name, item in sorted(stats.items()):
+        ordered = sorted(item.latencies)
+        print(
+            f"{name:>10} {len(ordered):>7} {item.errors:>6} {len(ordered) / elapsed:>8.1f} "
+            f"{statistics.median(ordered) * 1000:>7.1f}ms "
+            f"{percentile(ordered, 0.95) * 1000:>7.1f}ms "
+            f"{percentile(ordered, 0.99) * 1000:>7.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--redis", action="store_true", help="keep the Redis cache tiers on")
+    parser.add_argument("--text-bytes", type=int, default=8_000)
+    parser.add_argument("--skills", type=int, default=40)
+    parser.add_argument("--upload-weight", type=float, default=1)
+    parser.add_argument("--score-weight", type=float, default=3)
+    parser.add_argument("--list-weight", type=float, default=4)
+    parser.add_argument("--analytics-weight", type=float, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        configure_environment(args, Path(workdir))
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,13 @@ from logging.config import fileConfig
 
 from alembic import context
 from sqlalchemy import pool
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from app.core.config import get_settings
 from app.infrastructure.db import models  # noqa: F401 - ensure metadata registration
 from app.infrastructure.db.base import Base
+from app.infrastructure.db.session import database_url
 
 config = context.config
 
@@ -21,15 +22,15 @@ target_metadata = Base.metadata
 
 
 def get_database_url() -> str:
-    settings = get_settings()
-    return (
-        f"postgresql+asyncpg://{settings.postgres_user}:{settings.postgres_password}"
-        f"@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_db}"
-    )
+    return database_url(get_settings())
 
 
 def get_sync_database_url() -> str:
-    return get_database_url().replace("+asyncpg", "+psycopg")
+    url = make_url(get_database_url())
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite").render_as_string(hide_password=False)
+    url = url.difference_update_query(["prepared_statement_cache_size"])
+    return url.set(drivername="postgresql+psycopg").render_as_string(hide_password=False)
 
 
 def run_migrations_offline() -> None:
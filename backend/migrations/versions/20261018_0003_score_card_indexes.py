@@ -0,0 +1,21 @@
+"""Index score cards for per-resume lookups and daily analytics"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "20261018_0003"
+down_revision: str | None = "20261018_0002"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_score_cards_resume_id", "score_cards", ["resume_id"], unique=False)
+    op.create_index("ix_score_cards_generated_at", "score_cards", ["generated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_score_cards_generated_at", table_name="score_cards")
+    op.drop_index("ix_score_cards_resume_id", table_name="score_cards")
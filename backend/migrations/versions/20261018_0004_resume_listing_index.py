@@ -0,0 +1,24 @@
+"""Index resumes for keyset pagination of an owner's newest resumes"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "20261018_0004"
+down_revision: str | None = "20261018_0003"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_resumes_owner_id_created_at_id",
+        "resumes",
+        ["owner_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_owner_id_created_at_id", table_name="resumes")
@@ -0,0 +1,52 @@
+"""Store normalized term frequencies on resumes and backfill existing rows"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.domain.terms import term_frequencies
+
+
+revision: str = "20261018_0005"
+down_revision: str | None = "20261018_0004"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    op.add_column("resumes", sa.Column("term_frequencies", sa.JSON(), nullable=True))
+
+    resumes = sa.table(
+        "resumes",
+        sa.column("id", sa.Integer()),
+        sa.column("parsed_text", sa.Text()),
+        sa.column("term_frequencies", sa.JSON()),
+    )
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(resumes.c.id, resumes.c.parsed_text)
+            .where(resumes.c.id > last_id, resumes.c.parsed_text.is_not(None))
+            .order_by(resumes.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            sa.update(resumes)
+            .where(resumes.c.id == sa.bindparam("resume_id"))
+            .values(term_frequencies=sa.bindparam("frequencies")),
+            [
+                {"resume_id": row.id, "frequencies": term_frequencies(row.parsed_text)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_column("resumes", "term_frequencies")
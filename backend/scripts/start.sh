@@ -2,5 +2,6 @@
 set -eu
 
 alembic upgrade head
+python -m app.cli.compile_skills
 
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000
+exec python -m app.cli.serve --host 0.0.0.0 --port 8000
@@ -0,0 +1,4 @@
+import os
+
+# Several modules read settings at import time; the secret has no default.
+os.environ.setdefault("SECRET_KEY", "test-secret")
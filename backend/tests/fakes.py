@@ -0,0 +1,68 @@
+from typing import Iterable, Mapping, Sequence
+
+from app.application.interfaces.score_card_repository import AbstractScoreCardRepository
+from app.application.interfaces.user_repository import AbstractUserRepository
+from app.domain.entities.resume import Resume
+from app.domain.entities.score_card import ScoreCard
+from app.domain.entities.user import User
+from app.infrastructure.repositories import memory
+
+
+class InMemoryResumeRepository(memory.InMemoryResumeRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_many_calls = 0
+        self.add_many_calls = 0
+
+    async def add_many(self, resumes: Sequence[Resume]) -> list[Resume]:
+        self.add_many_calls += 1
+        return await super().add_many(resumes)
+
+    async def get_many(
+        self, resume_ids: Sequence[int], *, owner_id: int | None = None
+    ) -> Iterable[Resume]:
+        self.get_many_calls += 1
+        return await super().get_many(resume_ids, owner_id=owner_id)
+
+
+class InMemoryScoreCardRepository(AbstractScoreCardRepository):
+    def __init__(self) -> None:
+        self.items: list[ScoreCard] = []
+        self.add_many_calls = 0
+
+    async def add_many(self, score_cards: Sequence[ScoreCard]) -> list[ScoreCard]:
+        self.add_many_calls += 1
+        for card in score_cards:
+            card.id = len(self.items) + 1
+            self.items.append(card)
+        return list(score_cards)
+
+    async def latest_matching(self, fingerprints: Mapping[int, str]) -> dict[int, ScoreCard]:
+        return {
+            card.resume_id: card
+            for card in self.items
+            if fingerprints.get(card.resume_id) == card.fingerprint
+        }
+
+
+class InMemoryUserRepository(AbstractUserRepository):
+    def __init__(self) -> None:
+        self.items: dict[int, User] = {}
+        self.password_updates = 0
+        self.get_calls = 0
+
+    async def get_by_email(self, email: str) -> User | None:
+        return next((user for user in self.items.values() if user.email == email), None)
+
+    async def get(self, user_id: int) -> User | None:
+        self.get_calls += 1
+        return self.items.get(user_id)
+
+    async def add(self, user: User) -> User:
+        user.id = len(self.items) + 1
+        self.items[user.id] = user
+        return user
+
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        self.password_updates += 1
+        self.items[user_id].hashed_password = hashed_password
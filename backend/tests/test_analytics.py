@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.application.services.analytics import AnalyticsService
+from app.infrastructure.cache.analytics_cache import RedisAnalyticsCache
+from app.infrastructure.cache.memory import InMemoryRedis
+from app.infrastructure.db import models
+from app.infrastructure.db.base import Base
+from app.schemas.analytics import AnalyticsSummary
+
+
+def _card(resume: models.ResumeModel, score: float, day: int) -> models.ScoreCardModel:
+    return models.ScoreCardModel(
+        resume=resume,
+        ats_score=score,
+        keyword_match=score,
+        formatting_score=score,
+        overall_score=score,
+        recommendations=[],
+        generated_at=datetime(2026, 3, day, 12),
+    )
+
+
+async def test_summary_is_aggregated_without_loading_resume_text() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    async with AsyncSession(engine) as session:
+        first = models.ResumeModel(
+            owner_id=1,
+            file_url="http://x/1.pdf",
+            parsed_text="x" * 10_000,
+            extracted_keywords=["python", "sql", "python"],
+        )
+        second = models.ResumeModel(
+            owner_id=1, file_url="http://x/2.pdf", extracted_keywords=["go", "sql"]
+        )
+        other = models.ResumeModel(owner_id=2, file_url="http://x/3.pdf", extracted_keywords=["go"])
+        session.add_all(
+            [
+                _card(first, 0.5, 1),
+                _card(second, 0.7, 1),
+                _card(first, 0.9, 2),
+                _card(other, 0.1, 2),
+            ]
+        )
+        await session.commit()
+        statements.clear()
+
+        summary = await AnalyticsService(session).summary_for_owner(1)
+
+    await engine.dispose()
+    assert summary.total_resumes == 2
+    assert summary.average_score == 0.7
+    assert [(item.keyword, item.count) for item in summary.keywords] == [
+        ("python", 2),
+        ("sql", 2),
+        ("go", 1),
+    ]
+    assert [
+        (point.date.day, point.average_score, point.submissions) for point in summary.score_trends
+    ] == [(1, 0.6, 2), (2, 0.9, 1)]
+    assert len(statements) == 3
+    assert not any("parsed_text" in statement for statement in statements)
+
+
+async def test_summary_cache_collapses_recomputes_until_invalidated() -> None:
+    redis = InMemoryRedis()
+    caches = [RedisAnalyticsCache(redis, retention_seconds=60) for _ in range(2)]
+    calls = 0
+
+    async def compute() -> AnalyticsSummary:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return AnalyticsSummary(
+            total_resumes=calls, average_score=0.5, keywords=[], score_trends=[]
+        )
+
+    results = await asyncio.gather(
+        *(caches[index % 2].get_or_compute(7, compute) for index in range(10))
+    )
+    assert calls == 1 and {summary.total_resumes for summary in results} == {1}
+
+    await caches[1].invalidate([7])
+    assert (await caches[0].get_or_compute(7, compute)).total_resumes == 2
+    assert (await caches[1].get_or_compute(7, compute)).total_resumes == 2
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from app.application.interfaces.password_hasher import PasswordHasherBusyError
+from app.application.services.auth import AuthService
+from app.infrastructure.security.hasher import ExecutorPasswordHasher
+from tests.fakes import InMemoryUserRepository
+
+
+async def test_login_upgrades_hashes_below_the_current_work_factor() -> None:
+    repository = InMemoryUserRepository()
+    legacy = ExecutorPasswordHasher(rounds=4, max_workers=1, max_pending=1)
+    await AuthService(repository, legacy).register_user(
+        email="a@example.com", password="secret-password", full_name=None
+    )
+    current = ExecutorPasswordHasher(rounds=5, max_workers=1, max_pending=1)
+    service = AuthService(repository, current)
+
+    with pytest.raises(ValueError):
+        await service.authenticate(email="a@example.com", password="wrong")
+    _, user = await service.authenticate(email="a@example.com", password="secret-password")
+    await service.authenticate(email="a@example.com", password="secret-password")
+
+    assert user.hashed_password.startswith("$2b$05$")
+    assert repository.password_updates == 1
+
+
+async def test_hashing_leaves_the_event_loop_responsive() -> None:
+    hasher = ExecutorPasswordHasher(rounds=10, max_workers=2, max_pending=4)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(ticker())
+    results = await asyncio.gather(
+        *(hasher.hash("secret-password") for _ in range(5)), return_exceptions=True
+    )
+    task.cancel()
+    hasher.shutdown()
+    assert ticks > 5
+    assert sum(isinstance(result, PasswordHasherBusyError) for result in results) == 1
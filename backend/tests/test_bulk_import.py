@@ -0,0 +1,110 @@
+import json
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.dependencies import get_analytics_cache, get_current_user, get_score_cache
+from app.api.v1.endpoints import resumes
+from app.application.services.bulk_import import ResumeImportService, split_lines
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.user import User
+from app.infrastructure.db import models
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.session import get_db_session
+from tests.fakes import InMemoryResumeRepository, InMemoryScoreCardRepository
+
+
+def _record(owner_id: int, text: str = "python") -> bytes:
+    payload = {"owner_id": owner_id, "file_url": "http://x/r.pdf", "parsed_text": text}
+    return json.dumps(payload).encode()
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def test_split_lines_handles_chunk_boundaries_and_oversized_lines() -> None:
+    data = b"first\nsecond line\n" + b"x" * 50 + b"\nlast"
+    lines = [line async for line in split_lines(_chunks(data, 7), max_line_bytes=20)]
+
+    assert lines == [b"first", b"second line", b"x" * 21, b"last"]
+
+
+async def test_import_reports_bad_records_and_resumes_from_checkpoint() -> None:
+    repository = InMemoryResumeRepository()
+    score_cards = InMemoryScoreCardRepository()
+    scoring = ResumeScoringService(repository, score_cards=score_cards)
+    importer = ResumeImportService(repository, scoring=scoring, batch_size=2)
+    lines = [_record(1), b"{not json", b"", _record(2), _record(3), b'{"owner_id": 4}', _record(5)]
+
+    async def feed():
+        for line in lines:
+            yield line
+
+    batches = [batch async for batch in importer.import_lines(feed(), score=True)]
+
+    assert [batch.checkpoint for batch in batches] == [4, 7]
+    assert [[item.owner_id for item in batch.imported] for batch in batches] == [[1, 2], [3, 5]]
+    assert [error.line for batch in batches for error in batch.errors] == [2, 6]
+    assert "file_url" in batches[1].errors[0].error
+    assert sum(batch.scored for batch in batches) == 4 and len(score_cards.items) == 4
+    assert repository.add_many_calls == 2
+
+    resumed = [batch async for batch in importer.import_lines(feed(), skip_lines=4)]
+    assert [item.owner_id for batch in resumed for item in batch.imported] == [3, 5]
+    assert [batch async for batch in importer.import_lines(feed(), skip_lines=7)] == []
+
+
+async def test_import_endpoint_commits_batches_with_multi_row_inserts() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    inserts: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record_insert(conn, cursor, statement, *args) -> None:
+        if statement.startswith("INSERT"):
+            inserts.append(statement.split("(")[0])
+
+    async def session_override():
+        async with sessions() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(resumes.router, prefix="/resumes")
+    app.dependency_overrides[get_db_session] = session_override
+    app.dependency_overrides[get_score_cache] = lambda: None
+    app.dependency_overrides[get_analytics_cache] = lambda: None
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=1, email="a@example.com", hashed_password=""
+    )
+    body = b"\n".join([*(_record(1, f"resume {index}") for index in range(2_500)), b"[]"])
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.post(
+            "/resumes/import",
+            params={"score": "true"},
+            content=_chunks(body, 4096),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "imported": 2_500,
+        "scored": 2_500,
+        "failed": 1,
+        "checkpoint": 2_501,
+        "errors": [{"line": 2_501, "error": "record: Input should be an object"}],
+    }
+    async with sessions() as session:
+        counts = [
+            await session.scalar(select(func.count()).select_from(model))
+            for model in (models.ResumeModel, models.ScoreCardModel)
+        ]
+    await engine.dispose()
+    assert counts == [2_500, 2_500]
+    # Three batches of up to 1,000 records, each one resume and one score card statement.
+    assert inserts == ["INSERT INTO resumes ", "INSERT INTO score_cards "] * 3
@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+from app.api.dependencies import (
+    get_current_user,
+    get_token_cache,
+    get_user_cache,
+    get_user_repository,
+)
+from app.domain.entities.user import User
+from app.infrastructure.cache.memory import TTLLRUCache
+from app.infrastructure.security import auth
+from app.infrastructure.security.auth import (
+    VerifiedTokenCache,
+    create_access_token,
+    create_refresh_token,
+)
+from tests.fakes import InMemoryUserRepository
+
+
+@pytest.fixture
+async def principal(monkeypatch):
+    repository = InMemoryUserRepository()
+    await repository.add(User(email="a@example.com", hashed_password=""))
+    decoded: list[str] = []
+    decode_token = auth.decode_token
+
+    def counting_decode(token: str) -> dict[str, str]:
+        decoded.append(token)
+        return decode_token(token)
+
+    monkeypatch.setattr(auth, "decode_token", counting_decode)
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(user: User = Depends(get_current_user)) -> dict[str, int | None]:
+        return {"id": user.id}
+
+    tokens = VerifiedTokenCache(max_entries=10, ttl_seconds=60)
+    users: TTLLRUCache[int, User] = TTLLRUCache(max_entries=10, ttl_seconds=60)
+    app.dependency_overrides[get_user_repository] = lambda: repository
+    app.dependency_overrides[get_token_cache] = lambda: tokens
+    app.dependency_overrides[get_user_cache] = lambda: users
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        yield client, repository, decoded
+
+
+async def test_repeat_requests_skip_token_verification_and_user_lookup(principal) -> None:
+    client, repository, decoded = principal
+    headers = {"Authorization": f"Bearer {create_access_token('1')}"}
+
+    for _ in range(3):
+        response = await client.get("/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"id": 1}
+
+    assert len(decoded) == 1
+    assert repository.get_calls == 1
+
+
+async def test_missing_expired_and_unknown_tokens_are_rejected(principal) -> None:
+    client, _, decoded = principal
+    expired = create_access_token("1", expires_delta=timedelta(seconds=-1))
+    unknown = create_access_token("99")
+
+    assert (await client.get("/me")).status_code == 401
+    for token in (expired, unknown, expired):
+        response = await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+    assert len(decoded) == 3  # the expired token is never cached
+
+
+async def test_refresh_tokens_are_not_accepted_as_bearer_tokens(principal) -> None:
+    client, _, _ = principal
+    headers = {"Authorization": f"Bearer {create_refresh_token('1')}"}
+
+    assert (await client.get("/me", headers=headers)).status_code == 401
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import Settings
+from app.infrastructure.db.pool import InstrumentedQueuePool, pool_stats, warm_pool
+from app.infrastructure.db.session import build_engine
+
+
+async def test_pool_records_waits_timeouts_and_warmup(tmp_path) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    assert await warm_pool(engine, 1) == 1
+    assert pool_stats(engine).checked_in == 1
+
+    held = await engine.connect().start()
+    with pytest.raises(exc.TimeoutError):
+        await engine.connect().start()
+
+    async def release_soon() -> None:
+        await asyncio.sleep(0.05)
+        await held.close()
+
+    release = asyncio.create_task(release_soon())
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+        stats = pool_stats(engine)
+    await release
+    await engine.dispose()
+
+    assert (stats.size, stats.checked_out, stats.timeouts) == (1, 1, 1)
+    assert stats.max_wait_seconds >= 0.15
+    assert stats.checkouts == 4
+
+
+def test_engine_follows_database_url_driver(tmp_path) -> None:
+    file_engine = build_engine(
+        Settings(secret_key="x", database_url=f"sqlite+aiosqlite:///{tmp_path / 'a.db'}")
+    )
+    memory_engine = build_engine(Settings(secret_key="x", database_url="sqlite+aiosqlite://"))
+    postgres_url = build_engine(
+        Settings(secret_key="x", database_url=None, db_statement_cache_size=0)
+    ).url
+
+    assert isinstance(file_engine.pool, InstrumentedQueuePool)
+    assert not isinstance(memory_engine.pool, InstrumentedQueuePool)
+    assert postgres_url.drivername == "postgresql+asyncpg"
+    assert postgres_url.query == {"prepared_statement_cache_size": "0"}
@@ -0,0 +1,174 @@
+import io
+import sys
+import threading
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from app.application.interfaces.document_extractor import (
+    ExtractionError,
+    ExtractionQueueFullError,
+    ExtractionTimeoutError,
+)
+from app.application.services.extraction import ResumeExtractionService
+from app.domain.entities.resume import Resume
+from app.infrastructure.extraction import parsers, pool
+from app.infrastructure.extraction.pool import ProcessPoolExtractor
+from app.infrastructure.storage.local import LocalFileStorage
+from tests.fakes import InMemoryResumeRepository
+
+_PARAGRAPHS = ["Jane Doe", "", "Skills:", "Python, FastAPI; PostgreSQL", "", "Built Python APIs."]
+
+
+def _docx(paragraphs: list[str]) -> bytes:
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    document = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def _pdf(lines: list[str]) -> bytes:
+    content = b"BT " + b" T* ".join(b"(" + line.encode() + b") Tj" for line in lines) + b" ET"
+    stream = zlib.compress(content)
+    header = f"1 0 obj\n<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode()
+    return b"%PDF-1.4\n" + header + stream + b"\nendstream\nendobj\n%%EOF"
+
+
+def test_docx_text_skills_and_keywords(tmp_path) -> None:
+    path = tmp_path / "resume.docx"
+    path.write_bytes(_docx(_PARAGRAPHS))
+
+    document = parsers.extract_document(path, max_keywords=3)
+
+    assert document.text == "\n".join(_PARAGRAPHS)
+    assert document.skills == ["Python", "FastAPI", "PostgreSQL"]
+    assert document.keywords[0] == "python"
+
+
+def test_pdf_fallback_reads_flate_text(tmp_path) -> None:
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(_pdf(["Senior Engineer", "Skills: Go \\(Golang\\), SQL"]))
+
+    text = parsers._pdf_text_fallback(path.read_bytes())
+
+    assert text == "Senior Engineer\nSkills: Go (Golang), SQL"
+    assert parsers.extract_skills(text) == ["Go (Golang)", "SQL"]
+    assert parsers.extract_skills("Skills in leadership\nmentoring") == []
+
+
+def test_malformed_documents_are_extraction_errors(tmp_path, monkeypatch) -> None:
+    broken = io.BytesIO()
+    with zipfile.ZipFile(broken, "w") as archive:
+        archive.writestr("word/document.xml", "<w:document><w:body>")
+    path = tmp_path / "broken.docx"
+    path.write_bytes(broken.getvalue())
+    with pytest.raises(ExtractionError, match="not a valid Word document"):
+        parsers.extract_text(path)
+
+    class DamagedReader:
+        def __init__(self, path: str) -> None:
+            raise ValueError("damaged xref table")
+
+    monkeypatch.setitem(sys.modules, "pypdf", SimpleNamespace(PdfReader=DamagedReader))
+    with pytest.raises(ExtractionError, match="not a readable PDF"):
+        parsers.extract_text(tmp_path / "damaged.pdf")
+
+
+def test_decompressed_size_is_capped(tmp_path) -> None:
+    docx = tmp_path / "resume.docx"
+    docx.write_bytes(_docx(["word " * 1_000]))
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(_pdf(["word " * 1_000]))
+
+    with pytest.raises(ExtractionError, match="expands beyond 1000 bytes"):
+        parsers.extract_text(docx, max_expanded_bytes=1_000)
+    with pytest.raises(ExtractionError, match="expands beyond 1000 bytes"):
+        parsers._pdf_text_fallback(pdf.read_bytes(), max_expanded_bytes=1_000)
+    assert parsers._pdf_text_fallback(pdf.read_bytes(), max_expanded_bytes=10_000)
+
+
+def test_worker_alarm_aborts_slow_parse(monkeypatch) -> None:
+    monkeypatch.setattr(parsers, "extract_document", lambda *args, **kwargs: time.sleep(2))
+    with pytest.raises(ExtractionTimeoutError):
+        parsers.extract_document_with_timeout("slow.pdf", timeout_seconds=0.05, max_keywords=5)
+
+
+async def test_reextract_writes_results_back_through_process_pool(tmp_path) -> None:
+    storage = LocalFileStorage(
+        tmp_path / "uploads", state_dir=tmp_path / "state", public_base_url="http://test"
+    )
+    stored = await storage.put(
+        io.BytesIO(_docx(_PARAGRAPHS)), suffix=".docx", max_bytes=10_000, chunk_size=512
+    )
+    repository = InMemoryResumeRepository()
+    resume = await repository.add(Resume(owner_id=1, file_url=storage.public_url(stored.key)))
+    extractor = ProcessPoolExtractor(
+        max_workers=1, max_pending=2, timeout_seconds=30, max_keywords=5
+    )
+    service = ResumeExtractionService(repository, storage, extractor)
+    try:
+        updated = await service.reextract(resume.id or 0)
+    finally:
+        extractor.shutdown()
+
+    assert updated is not None
+    assert updated.parsed_text == "\n".join(_PARAGRAPHS)
+    assert updated.extracted_skills == ["Python", "FastAPI", "PostgreSQL"]
+
+
+async def test_complete_leaves_files_stored_elsewhere_to_be_scored_without_text(
+    tmp_path,
+) -> None:
+    storage = LocalFileStorage(
+        tmp_path / "uploads", state_dir=tmp_path / "state", public_base_url="http://test"
+    )
+    extractor = ProcessPoolExtractor(
+        max_workers=1, max_pending=0, timeout_seconds=1, max_keywords=5
+    )
+    service = ResumeExtractionService(InMemoryResumeRepository(), storage, extractor)
+    resume = Resume(owner_id=1, file_url="http://elsewhere/r.pdf", extracted_keywords=["go"])
+
+    completed = await service.complete(resume)
+
+    assert completed.parsed_text is None and completed.extracted_keywords == ["go"]
+
+
+async def test_extractor_rejects_work_beyond_queue_limit(tmp_path) -> None:
+    extractor = ProcessPoolExtractor(
+        max_workers=1, max_pending=0, timeout_seconds=1, max_keywords=5
+    )
+    with pytest.raises(ExtractionQueueFullError):
+        await extractor.extract(tmp_path / "resume.pdf")
+
+
+async def test_timed_out_extraction_holds_its_slot_until_the_worker_finishes(
+    monkeypatch, tmp_path
+) -> None:
+    finish = threading.Event()
+    monkeypatch.setattr(pool, "extract_document_with_timeout", lambda *_, **__: finish.wait(5))
+    monkeypatch.setattr(pool, "_TIMEOUT_GRACE_SECONDS", 0.0)
+    extractor = ProcessPoolExtractor(
+        max_workers=1, max_pending=1, timeout_seconds=0.05, max_keywords=5
+    )
+    # A thread stands in for the worker process, so the patched parse is the one that runs.
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(extractor, "_get_executor", lambda: executor)
+    try:
+        with pytest.raises(ExtractionTimeoutError):
+            await extractor.extract(tmp_path / "slow.pdf")
+        assert extractor.pending == 1
+        with pytest.raises(ExtractionQueueFullError):
+            await extractor.extract(tmp_path / "next.pdf")
+    finally:
+        finish.set()
+        executor.shutdown(wait=True)
+    assert extractor.pending == 0
@@ -0,0 +1,200 @@
+import asyncio
+import signal
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.dependencies import get_current_user, get_job_queue
+from app.api.v1.endpoints import jobs
+from app.application.services.jobs import JobWorker
+from app.application.services.resume_scoring import ResumeScoringService
+from app.application.services.scoring_jobs import ScoringJobHandlers
+from app.cli import job_worker
+from app.domain.entities.job import Job, JobStatus
+from app.domain.entities.resume import Resume
+from app.domain.entities.user import User
+from app.infrastructure.jobs.memory import InMemoryJobQueue
+from tests.fakes import InMemoryResumeRepository, InMemoryScoreCardRepository
+
+
+def _worker(queue: InMemoryJobQueue, handlers: dict[str, Any], concurrency: int = 2) -> JobWorker:
+    return JobWorker(
+        queue,
+        handlers,
+        concurrency=concurrency,
+        max_attempts=3,
+        retry_initial_seconds=0,
+        retry_max_seconds=0,
+        poll_seconds=0.01,
+    )
+
+
+async def _run_until_done(worker: JobWorker, queue: InMemoryJobQueue, job_ids: list[str]) -> None:
+    stop = asyncio.Event()
+    running = asyncio.create_task(worker.run(stop))
+    for _ in range(500):
+        stored = [await queue.get(job_id) for job_id in job_ids]
+        if all(job and job.status in (JobStatus.SUCCEEDED, JobStatus.FAILED) for job in stored):
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await running
+
+
+async def test_transient_failures_are_retried() -> None:
+    queue = InMemoryJobQueue()
+    calls = 0
+
+    async def flaky(job: Job) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise ConnectionError("broker hiccup")
+        return {"ok": True}
+
+    job = await queue.submit(Job(kind="flaky", owner_id=1, payload={}))
+    await _run_until_done(_worker(queue, {"flaky": flaky}), queue, [job.id])
+
+    stored = await queue.get(job.id)
+    assert stored is not None
+    assert (stored.status, stored.attempts, stored.result) == (JobStatus.SUCCEEDED, 3, {"ok": True})
+
+
+async def test_invalid_input_fails_without_retrying() -> None:
+    queue = InMemoryJobQueue()
+
+    async def invalid(job: Job) -> dict[str, Any]:
+        raise ValueError("no resumes")
+
+    failing = await queue.submit(Job(kind="invalid", owner_id=1, payload={}))
+    unknown = await queue.submit(Job(kind="missing", owner_id=1, payload={}))
+    await _run_until_done(_worker(queue, {"invalid": invalid}), queue, [failing.id, unknown.id])
+
+    stored = await queue.get(failing.id)
+    assert stored is not None
+    assert (stored.status, stored.attempts, stored.error) == (JobStatus.FAILED, 1, "no resumes")
+    stored = await queue.get(unknown.id)
+    assert stored is not None and stored.status == JobStatus.FAILED
+
+
+async def test_concurrency_is_bounded() -> None:
+    queue = InMemoryJobQueue()
+    active = peak = 0
+
+    async def slow(job: Job) -> dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return {}
+
+    submitted = [await queue.submit(Job(kind="slow", owner_id=1, payload={})) for _ in range(8)]
+    await _run_until_done(_worker(queue, {"slow": slow}), queue, [job.id for job in submitted])
+
+    assert peak == 2
+    stored = [await queue.get(job.id) for job in submitted]
+    assert all(job is not None and job.status == JobStatus.SUCCEEDED for job in stored)
+
+
+async def test_batch_score_job_is_submitted_run_and_polled() -> None:
+    queue = InMemoryJobQueue()
+    resumes, score_cards = InMemoryResumeRepository(), InMemoryScoreCardRepository()
+
+    @asynccontextmanager
+    async def scoring() -> AsyncIterator[ResumeScoringService]:
+        yield ResumeScoringService(resumes, score_cards=score_cards)
+
+    app = FastAPI()
+    app.include_router(jobs.router, prefix="/jobs")
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    app.dependency_overrides[get_current_user] = lambda: User(
+        email="a@b.c", hashed_password="", id=7
+    )
+    payload = {
+        "resumes": [
+            {
+                "owner_id": 7,
+                "file_url": "http://test/resume.pdf",
+                "parsed_text": "python and sql",
+                "extracted_keywords": ["python", "sql"],
+            }
+        ],
+        "job_descriptions": [{"role_title": "Engineer", "required_skills": ["python"]}],
+    }
+
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        submitted = await client.post("/jobs/score/batch", json=payload)
+        assert submitted.status_code == 202
+        job_id = submitted.json()["id"]
+        assert submitted.json()["status"] == "queued"
+
+        worker = _worker(queue, ScoringJobHandlers(scoring).handlers())
+        await _run_until_done(worker, queue, [job_id])
+
+        polled = await client.get(f"/jobs/{job_id}")
+        assert polled.status_code == 200
+        body = polled.json()
+        assert body["status"] == "succeeded"
+        assert body["result"]["resume_ids"] == [0]  # inline resumes are scored, not stored
+        assert body["result"]["results"][0][0]["keyword_match"] == 1.0
+
+        app.dependency_overrides[get_current_user] = lambda: User(
+            email="x@y.z", hashed_password="", id=8
+        )
+        assert (await client.get(f"/jobs/{job_id}")).status_code == 404
+
+
+async def test_jobs_only_score_their_owners_resumes() -> None:
+    queue = InMemoryJobQueue()
+    resumes = InMemoryResumeRepository()
+    mine = await resumes.add(Resume(owner_id=7, file_url="http://test/a.pdf", parsed_text="go"))
+    theirs = await resumes.add(Resume(owner_id=8, file_url="http://test/b.pdf", parsed_text="go"))
+
+    @asynccontextmanager
+    async def scoring() -> AsyncIterator[ResumeScoringService]:
+        yield ResumeScoringService(resumes)
+
+    job = {"role_title": "Engineer", "required_skills": ["go"]}
+    submitted = [
+        await queue.submit(Job(kind=kind, owner_id=7, payload=payload))
+        for kind, payload in [
+            ("rescore", {"resume_ids": [mine.id]}),
+            ("rescore", {"resume_ids": [mine.id, theirs.id]}),
+            ("batch_score", {"resume_ids": [theirs.id], "job_descriptions": [job]}),
+        ]
+    ]
+    worker = _worker(queue, ScoringJobHandlers(scoring).handlers())
+    await _run_until_done(worker, queue, [item.id for item in submitted])
+
+    stored = [await queue.get(item.id) for item in submitted]
+    assert [(item.status, item.error) for item in stored if item is not None] == [
+        (JobStatus.SUCCEEDED, None),
+        (JobStatus.FAILED, f"Resumes not found: {theirs.id}"),
+        (JobStatus.FAILED, f"Resumes not found: {theirs.id}"),
+    ]
+
+
+class _ExitedProcess:
+    name = "job-worker-0"
+    exitcode = -9
+
+    def is_alive(self) -> bool:
+        return False
+
+
+def test_supervisor_restarts_dead_workers_until_stopped(monkeypatch) -> None:
+    supervisor = job_worker._Supervisor(2, concurrency=1)
+    started: list[int] = []
+    monkeypatch.setattr(supervisor, "_start", started.append)
+    supervisor._processes = {0: (_ExitedProcess(), 0.0)}  # type: ignore[dict-item]
+
+    supervisor._reap()
+    assert started == [0]
+
+    supervisor._processes = {0: (_ExitedProcess(), 0.0)}  # type: ignore[dict-item]
+    supervisor._stop(signal.SIGINT, None)
+    supervisor._reap()
+    assert started == [0] and supervisor._processes == {}
@@ -0,0 +1,114 @@
+import heapq
+import random
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.infrastructure.db.base import Base
+from app.infrastructure.repositories.resume_repository import ResumeRepository
+from app.infrastructure.search.keyword_index import KeywordIndex, KeywordIndexRegistry
+from tests.fakes import InMemoryResumeRepository
+
+
+def test_top_k_matches_exhaustive_ranking() -> None:
+    rng = random.Random(3)
+    skills = [f"skill{index}" for index in range(40)]
+    documents = {resume_id: rng.sample(skills, rng.randint(0, 12)) for resume_id in range(2_000)}
+    index = KeywordIndex.from_entries(documents.items())
+    weights = {skill: rng.choice([1.0, 2.0, 0.5]) for skill in rng.sample(skills, 8)}
+
+    ranked = index.top_k(weights, 25)
+
+    exhaustive = sorted(
+        (sum(weights.get(term, 0.0) for term in terms) for terms in documents.values()),
+        reverse=True,
+    )
+    assert [score for _, score in ranked.hits] == exhaustive[:25]
+    for resume_id, score in ranked.hits:
+        assert score == sum(weights.get(term, 0.0) for term in documents[resume_id])
+
+
+def test_top_k_skips_postings_that_cannot_change_the_result() -> None:
+    entries = [(resume_id, ["rare", "common"]) for resume_id in range(5)]
+    entries += [(resume_id, ["common"]) for resume_id in range(5, 10_000)]
+    index = KeywordIndex.from_entries(entries)
+
+    ranked = index.top_k({"Rare": 2.0, "common": 1.0}, 5)
+
+    assert sorted(resume_id for resume_id, _ in ranked.hits) == [0, 1, 2, 3, 4]
+    assert (ranked.postings_scanned, ranked.documents_scored) == (1, 5)
+
+
+def test_top_k_breaks_ties_like_the_unindexed_ranking() -> None:
+    index = KeywordIndex.from_entries([(5, ["a"]), (1, ["b"]), (7, ["b"])])
+    assert index.top_k({"a": 1.0, "b": 1.0}, 1).hits == [(1, 1.0)]
+
+    rng = random.Random(5)
+    skills = [f"skill{index}" for index in range(12)]
+    documents = {resume_id: rng.sample(skills, rng.randint(0, 4)) for resume_id in range(500)}
+    index = KeywordIndex.from_entries(rng.sample(list(documents.items()), len(documents)))
+    weights = dict.fromkeys(rng.sample(skills, 5), 1.0)
+    for k in (1, 3, 10, 50):
+        # Same ordering as the scoring service's heapq fallback without an index.
+        counts = ((len(weights.keys() & set(terms)), -item) for item, terms in documents.items())
+        best = heapq.nlargest(k, (count for count in counts if count[0]))
+        expected = [(-negated_id, float(matches)) for matches, negated_id in best]
+        assert index.top_k(weights, k).hits == expected
+
+
+def test_index_updates_incrementally() -> None:
+    index = KeywordIndex()
+    index.add(1, [" Python ", "SQL"])
+    index.add(2, ["python"])
+    index.remove(1)
+    index.add(2, ["go"])
+
+    assert index.top_k({"python": 1.0}, 10).hits == []
+    assert index.top_k({"go": 1.0}, 10).hits == [(2, 1.0)]
+    assert len(index) == 1
+
+
+async def test_rank_candidates_scores_best_matches_first() -> None:
+    repository = InMemoryResumeRepository()
+    for keywords in (["python"], ["python", "fastapi"], [], ["go"]):
+        await repository.add(
+            Resume(owner_id=1, file_url="http://x/r.pdf", extracted_keywords=keywords)
+        )
+    await repository.add(Resume(owner_id=2, file_url="http://x/r.pdf", extracted_skills=["python"]))
+    registry = KeywordIndexRegistry(max_owners=4, ttl_seconds=60)
+    service = ResumeScoringService(repository, index=registry)
+    job = JobDescription(role_title="Backend", required_skills=["Python", "FastAPI"])
+
+    ranked = await service.rank_candidates(owner_id=1, job_description=job, limit=2)
+
+    assert [(resume.id, card.keyword_match) for resume, card in ranked] == [(2, 1.0), (1, 0.5)]
+    assert registry.get(1) is not None and registry.get(2) is None
+    unindexed = await ResumeScoringService(repository).rank_candidates(
+        owner_id=1, job_description=job, limit=2
+    )
+    assert [resume.id for resume, _ in unindexed] == [2, 1]
+
+
+async def test_repository_updates_the_index_only_after_commit() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    registry = KeywordIndexRegistry(max_owners=4, ttl_seconds=60)
+    registry.load(1, [])
+    resume = Resume(owner_id=1, file_url="http://x/r.pdf", extracted_keywords=["python"])
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        repository = ResumeRepository(session, index=registry)
+        await repository.add(resume)
+        assert registry.top_k(1, {"python": 1.0}, 5) == []
+        await session.rollback()
+        [stored] = await repository.add_many([resume])
+        await session.commit()
+        assert registry.top_k(1, {"python": 1.0}, 5) == [(stored.id, 1.0)]
+
+        await repository.delete(stored.id or 0)
+        assert registry.top_k(1, {"python": 1.0}, 5) == [(stored.id, 1.0)]
+        await session.commit()
+    assert registry.top_k(1, {"python": 1.0}, 5) == []
+    await engine.dispose()
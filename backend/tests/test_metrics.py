@@ -0,0 +1,81 @@
+import httpx
+from fastapi import FastAPI
+
+from app.api import metrics
+from app.api.middleware import RequestMetricsMiddleware
+from app.application.services.resume_scoring import ResumeScoringService
+from app.core.metrics import SCORING_STAGE_SECONDS, MetricsRegistry
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.infrastructure.cache.score_cache import TieredScoreCache
+from tests.fakes import InMemoryResumeRepository
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("path",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        latency.labels('/a"b').observe(value)
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{path="/a\\"b",le="0.1"} 1',
+        'latency_seconds_bucket{path="/a\\"b",le="1"} 2',
+        'latency_seconds_bucket{path="/a\\"b",le="+Inf"} 3',
+        'latency_seconds_sum{path="/a\\"b"} 5.55',
+        'latency_seconds_count{path="/a\\"b"} 3',
+    ]
+
+
+async def test_requests_are_labelled_by_route_template() -> None:
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware, excluded_paths=["/metrics"])
+    app.include_router(metrics.router)
+
+    @app.get("/widgets/{widget_id}")
+    async def widget(widget_id: int) -> dict[str, int]:
+        return {"id": widget_id}
+
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        for widget_id in (1, 2):
+            assert (await client.get(f"/widgets/{widget_id}")).status_code == 200
+        await client.get("/nowhere/3")
+        body = (await client.get("/metrics")).text
+
+    assert 'http_requests_total{method="GET",route="/widgets/{widget_id}",status="200"} 2' in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in body
+    assert 'route="/metrics"' not in body
+    assert "http_requests_in_flight 0" in body
+
+
+async def test_score_cache_lookups_are_exported(monkeypatch) -> None:
+    cache = TieredScoreCache(max_entries=4, ttl_seconds=60)
+    service = ResumeScoringService(InMemoryResumeRepository(), cache=cache)
+    resume = Resume(owner_id=1, file_url="http://x/r.pdf", parsed_text="python")
+    job = JobDescription(role_title="Dev", canonical_text="python")
+    for _ in range(3):
+        await service.score_batch(resumes=[resume], job_descriptions=[job])
+    monkeypatch.setattr(metrics, "get_score_cache", lambda: cache)
+    app = FastAPI()
+    app.include_router(metrics.router)
+
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        body = (await client.get("/metrics")).text
+
+    assert 'score_cache_lookups{result="local_hit"} 2' in body
+    assert 'score_cache_lookups{result="remote_hit"} 0' in body
+    assert 'score_cache_lookups{result="miss"} 1' in body
+
+
+async def test_each_scoring_stage_is_timed() -> None:
+    stages = ("keyword", "formatting", "experience", "recommendations")
+    before = {stage: sum(SCORING_STAGE_SECONDS.labels(stage).counts) for stage in stages}
+    service = ResumeScoringService(InMemoryResumeRepository())
+    resume = Resume(owner_id=1, file_url="http://x/r.pdf", parsed_text="python sql")
+
+    job = JobDescription(role_title="Dev", canonical_text="sql")
+
+    await service.score_batch(resumes=[resume], job_descriptions=[job])
+
+    assert {
+        stage: sum(SCORING_STAGE_SECONDS.labels(stage).counts) - before[stage] for stage in stages
+    } == dict.fromkeys(stages, 1)
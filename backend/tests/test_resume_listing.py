@@ -0,0 +1,107 @@
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.dependencies import get_analytics_cache, get_current_user, get_score_cache
+from app.api.v1.endpoints import resumes
+from app.domain.entities.user import User
+from app.infrastructure.db import models
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.session import get_db_session
+
+
+@pytest.fixture
+async def listing():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with sessions() as session:
+        session.add_all(
+            models.ResumeModel(
+                owner_id=1 if index < 5 else 2,
+                file_url=f"http://x/{index}.pdf",
+                parsed_text="text " * 1_000,
+                created_at=datetime(2026, 3, 1 + min(index, 3)),
+            )
+            for index in range(6)
+        )
+        await session.commit()
+
+    async def session_override():
+        async with sessions() as session:
+            yield session
+
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    app = FastAPI()
+    app.include_router(resumes.router, prefix="/resumes")
+    app.dependency_overrides[get_db_session] = session_override
+    app.dependency_overrides[get_score_cache] = lambda: None
+    app.dependency_overrides[get_analytics_cache] = lambda: None
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=1, email="a@example.com", hashed_password=""
+    )
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        yield client, statements
+    await engine.dispose()
+
+
+async def test_pages_follow_cursor_newest_first_without_loading_text(listing) -> None:
+    client, statements = listing
+    seen: list[int] = []
+    params = {"owner_id": 1, "limit": 2, "fields": "created_at"}
+    while True:
+        response = await client.get("/resumes/", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        assert all(set(item) == {"id", "created_at"} for item in body["items"])
+        seen += [item["id"] for item in body["items"]]
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    # Resumes 4 and 5 share created_at; ties are broken by id.
+    assert seen == [5, 4, 3, 2, 1]
+    assert not any("parsed_text" in statement for statement in statements)
+
+
+async def test_listing_rejects_unknown_fields_and_bad_cursors(listing) -> None:
+    client, _ = listing
+    full = await client.get("/resumes/", params={"owner_id": 1, "limit": 1})
+    assert full.json()["items"][0]["parsed_text"].startswith("text")
+    unknown = await client.get("/resumes/", params={"owner_id": 1, "fields": "secret"})
+    assert unknown.status_code == 400
+    garbled = await client.get("/resumes/", params={"owner_id": 1, "cursor": "not-a-cursor"})
+    assert garbled.status_code == 400
+    foreign = await client.get("/resumes/", params={"owner_id": 2})
+    assert foreign.status_code == 403
+
+
+async def test_other_owners_resumes_are_not_found(listing) -> None:
+    client, _ = listing
+    job = {"role_title": "Engineer", "required_skills": ["python"]}
+
+    assert (await client.get("/resumes/6")).status_code == 404
+    assert (await client.post("/resumes/6/extract")).status_code == 404
+    assert (await client.delete("/resumes/6")).status_code == 404
+    batch = {"resume_ids": [1, 6], "job_descriptions": [job]}
+    assert (await client.post("/resumes/score/batch", json=batch)).status_code == 404
+    assert (await client.post("/resumes/score/stream", json=batch)).status_code == 404
+    assert (await client.post("/resumes/rescore", json={"resume_ids": [6]})).status_code == 404
+    rank = {"owner_id": 2, "job_description": job}
+    assert (await client.post("/resumes/rank", json=rank)).status_code == 403
+    resume = {"owner_id": 2, "file_url": "http://x/7.pdf", "parsed_text": "python"}
+    assert (await client.post("/resumes/score", json={"resume": resume})).status_code == 403
+    imported = await client.post("/resumes/import", content=json.dumps(resume).encode())
+    assert imported.json()["errors"] == [{"line": 1, "error": "owner_id: not the importing user"}]
+    assert (await client.get("/resumes/1")).status_code == 200
@@ -0,0 +1,85 @@
+import pytest
+
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from tests.fakes import InMemoryResumeRepository, InMemoryScoreCardRepository
+
+
+def _resume(text: str, keywords: list[str]) -> Resume:
+    return Resume(
+        owner_id=1,
+        file_url="http://localhost/uploads/resume.pdf",
+        parsed_text=text,
+        extracted_keywords=keywords,
+    )
+
+
+_JOBS = [
+    JobDescription(
+        role_title="Backend Engineer",
+        canonical_text="Python APIs with FastAPI and PostgreSQL python",
+        required_skills=["Python", "FastAPI"],
+        preferred_skills=["PostgreSQL"],
+    ),
+    JobDescription(role_title="Data Engineer", canonical_text="", required_skills=["Spark"]),
+    JobDescription(role_title="Generalist"),
+]
+
+
+async def test_score_batch_matches_single_scoring() -> None:
+    repository = InMemoryResumeRepository()
+    stored = await repository.add(_resume("python python fastapi\n\nsql", ["python", "SQL"]))
+    inline = _resume("Spark pipelines and Python", ["spark"])
+    service = ResumeScoringService(repository=repository)
+
+    resumes, matrix = await service.score_batch(
+        resumes=[inline], resume_ids=[stored.id or 0], job_descriptions=_JOBS
+    )
+
+    assert [item.id for item in resumes] == [None, stored.id]
+    assert repository.get_many_calls == 1
+    # (keyword_match, overall_score, recommendation count), worked out from the single-resume
+    # formulas: 0.5 keywords + 0.2 formatting + 0.3 clipped term overlap with the job text.
+    expected = [
+        [(0.0, 0.24571, 2), (1.0, 0.825, 1), (0.6, 0.625, 1)],
+        [(0.3333, 0.45523, 2), (0.0, 0.325, 2), (0.6, 0.625, 1)],
+    ]
+    for row, expected_row in zip(matrix, expected, strict=True):
+        for card, (keyword, overall, recommendations) in zip(row, expected_row, strict=True):
+            assert card.keyword_match == keyword
+            assert card.overall_score == pytest.approx(overall)
+            assert len(card.recommendations) == recommendations
+
+
+async def test_score_batch_reports_missing_resumes() -> None:
+    service = ResumeScoringService(repository=InMemoryResumeRepository())
+    with pytest.raises(ValueError, match="42"):
+        await service.score_batch(resume_ids=[42], job_descriptions=_JOBS)
+
+
+async def test_rescore_reuses_stored_cards_until_inputs_change() -> None:
+    repository = InMemoryResumeRepository()
+    first = await repository.add(_resume("python fastapi", ["python"]))
+    second = await repository.add(_resume("spark", ["spark"]))
+    score_cards = InMemoryScoreCardRepository()
+    service = ResumeScoringService(repository=repository, score_cards=score_cards)
+
+    scored, reused = await service.rescore(
+        resume_ids=[first.id or 0, second.id or 0], job_description=_JOBS[0]
+    )
+    assert reused == [] and len(score_cards.items) == 2 and score_cards.add_many_calls == 1
+
+    await repository.update_extraction(
+        second.id or 0, parsed_text="python", extracted_skills=[], extracted_keywords=["python"]
+    )
+    rescored, reused = await service.rescore(
+        resume_ids=[second.id or 0, first.id or 0], job_description=_JOBS[0]
+    )
+
+    cards = [card for _, card in scored]
+    again = [card for _, card in rescored]
+    assert reused == [first.id]
+    assert again[1] is cards[0]
+    assert again[0].keyword_match > cards[1].keyword_match
+    assert len(score_cards.items) == 3 and score_cards.add_many_calls == 2
@@ -0,0 +1,65 @@
+from app.application.services import resume_scoring
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.infrastructure.cache.memory import InMemoryRedis, TTLLRUCache
+from app.infrastructure.cache.score_cache import TieredScoreCache
+from tests.fakes import InMemoryResumeRepository
+
+_JOB = JobDescription(
+    role_title="Backend Engineer",
+    canonical_text="python fastapi services",
+    required_skills=["Python", "FastAPI"],
+)
+
+
+def _cache(redis: InMemoryRedis) -> TieredScoreCache:
+    return TieredScoreCache(max_entries=16, ttl_seconds=60, redis=redis)
+
+
+def test_ttl_lru_cache_evicts_oldest_and_expired_entries() -> None:
+    now = [0.0]
+    cache: TTLLRUCache[str, int] = TTLLRUCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+async def test_score_cards_are_shared_through_redis_tier() -> None:
+    redis = InMemoryRedis()
+    repository = InMemoryResumeRepository()
+    resume = await repository.add(
+        Resume(owner_id=1, file_url="http://x/r.pdf", parsed_text="python fastapi")
+    )
+    first = _cache(redis)
+    expected = await ResumeScoringService(repository, cache=first).score_existing_resume(
+        resume_id=resume.id or 0, job_description=_JOB
+    )
+    second = _cache(redis)
+    card = await ResumeScoringService(repository, cache=second).score_existing_resume(
+        resume_id=resume.id or 0, job_description=_JOB
+    )
+
+    assert (first.stats.misses, second.stats.remote_hits) == (1, 1)
+    assert card.resume_id == resume.id
+    assert card.overall_score == expected.overall_score
+    assert card.recommendations == expected.recommendations
+
+
+async def test_weight_change_invalidates_cached_scores(monkeypatch) -> None:
+    cache = _cache(InMemoryRedis())
+    service = ResumeScoringService(InMemoryResumeRepository(), cache=cache)
+    resume = Resume(owner_id=1, file_url="http://x/r.pdf", parsed_text="python")
+
+    await service.score_batch(resumes=[resume], job_descriptions=[_JOB])
+    await service.score_batch(resumes=[resume], job_descriptions=[_JOB])
+    assert (cache.stats.local_hits, cache.stats.misses) == (1, 1)
+
+    monkeypatch.setattr(resume_scoring, "KEYWORD_WEIGHT", 0.6)
+    await service.score_batch(resumes=[resume], job_descriptions=[_JOB])
+    assert cache.stats.misses == 2
@@ -0,0 +1,50 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.domain.entities.score_card import ScoreCard
+from app.infrastructure.db import models
+from app.infrastructure.db.base import Base
+from app.infrastructure.repositories.score_card_repository import ScoreCardRepository
+
+
+def _card(resume_id: int, fingerprint: str, score: float) -> ScoreCard:
+    return ScoreCard(
+        resume_id=resume_id,
+        job_description_id=None,
+        ats_score=score,
+        keyword_match=score,
+        formatting_score=score,
+        overall_score=score,
+        recommendations=["Keep going."],
+        fingerprint=fingerprint,
+    )
+
+
+async def test_add_many_inserts_in_one_statement_and_finds_latest_match() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            [models.ResumeModel(owner_id=1, file_url=f"http://x/{index}.pdf") for index in (1, 2)]
+        )
+        await session.flush()
+        statements.clear()
+        repository = ScoreCardRepository(session)
+
+        stored = await repository.add_many(
+            [_card(1, "a", 0.1), _card(2, "b", 0.2), _card(1, "a", 0.3), _card(1, "c", 0.4)]
+        )
+
+        assert len(statements) == 1
+        assert [card.overall_score for card in stored] == [0.1, 0.2, 0.3, 0.4]
+        assert all(card.id is not None for card in stored)
+        latest = await repository.latest_matching({1: "a", 2: "c"})
+        assert {resume_id: card.overall_score for resume_id, card in latest.items()} == {1: 0.3}
+    await engine.dispose()
@@ -0,0 +1,153 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.dependencies import get_current_user, get_resume_scoring_service
+from app.api.v1.endpoints import resumes
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.domain.entities.user import User
+from tests.fakes import InMemoryResumeRepository
+
+_JOB = {"role_title": "Engineer", "required_skills": ["python", "sql"]}
+
+
+class CountingScoringService(ResumeScoringService):
+    def __init__(self, repository: InMemoryResumeRepository) -> None:
+        super().__init__(repository)
+        self.scored_rows = 0
+
+    async def _score_matrix(self, resumes, job_descriptions):  # type: ignore[no-untyped-def]
+        self.scored_rows += len(resumes)
+        return await super()._score_matrix(resumes, job_descriptions)
+
+
+async def _stored_service(count: int) -> CountingScoringService:
+    repository = InMemoryResumeRepository()
+    for index in range(count):
+        await repository.add(
+            Resume(
+                owner_id=1,
+                file_url="http://test/resume.pdf",
+                parsed_text=f"python engineer {index}",
+                extracted_keywords=["python"] if index % 2 else ["sql"],
+            )
+        )
+    return CountingScoringService(repository)
+
+
+async def test_stream_matches_batch_scores_in_growing_chunks() -> None:
+    service = await _stored_service(20)
+    jobs = [JobDescription(role_title="a", required_skills=["python"]), JobDescription("b")]
+    ids = list(range(20, 0, -1))
+
+    _, expected = await service.score_batch(resume_ids=ids, job_descriptions=jobs)
+    service.scored_rows = 0
+    rows = await service.stream_batch(
+        resume_ids=ids, job_descriptions=jobs, first_chunk=2, max_chunk=8
+    )
+    streamed = [item async for item in rows]
+
+    assert [index for index, _ in streamed] == list(range(20))
+    assert [[(card.resume_id, card.overall_score) for card in row] for _, row in streamed] == [
+        [(card.resume_id, card.overall_score) for card in row] for row in expected
+    ]
+    assert service.scored_rows == 20
+
+
+async def test_stream_scores_nothing_ahead_of_the_consumer() -> None:
+    service = await _stored_service(50)
+    rows = await service.stream_batch(
+        resume_ids=list(range(1, 51)),
+        job_descriptions=[JobDescription("a")],
+        first_chunk=1,
+        max_chunk=1,
+    )
+
+    assert [index for index, _ in [await anext(rows), await anext(rows)]] == [0, 1]
+    await rows.aclose()
+    assert service.scored_rows == 2
+
+
+async def test_unknown_resume_ids_fail_before_streaming() -> None:
+    service = await _stored_service(1)
+
+    with pytest.raises(ValueError):
+        await service.stream_batch(
+            resume_ids=[1, 9], job_descriptions=[JobDescription("a")], first_chunk=1, max_chunk=1
+        )
+
+
+def _app(service: ResumeScoringService) -> FastAPI:
+    app = FastAPI()
+    app.include_router(resumes.router, prefix="/resumes")
+    app.dependency_overrides[get_resume_scoring_service] = lambda: service
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=1, email="a@example.com", hashed_password=""
+    )
+    return app
+
+
+async def test_endpoint_streams_server_sent_events_and_ndjson() -> None:
+    service = await _stored_service(3)
+    body = {"resume_ids": [3, 1], "job_descriptions": [_JOB]}
+
+    async with httpx.AsyncClient(app=_app(service), base_url="http://test") as client:
+        events = await client.post("/resumes/score/stream", json=body)
+        lines = await client.post(
+            "/resumes/score/stream", json=body, headers={"Accept": "application/x-ndjson"}
+        )
+        missing = await client.post(
+            "/resumes/score/stream", json={"resume_ids": [7], "job_descriptions": [_JOB]}
+        )
+
+    assert events.headers["content-type"].startswith("text/event-stream")
+    blocks = [block.split("\n") for block in events.text.strip().split("\n\n")]
+    assert [lines_[0] for lines_ in blocks] == ["event: score", "event: score", "event: done"]
+    first = json.loads(blocks[0][1].removeprefix("data: "))
+    assert (first["resume_index"], first["score_card"]["resume_id"]) == (0, 3)
+    items = [json.loads(line) for line in lines.text.splitlines()]
+    assert [item["score_card"]["resume_id"] for item in items] == [3, 1]
+    assert missing.status_code == 404
+
+
+async def test_disconnect_stops_scoring() -> None:
+    service = await _stored_service(200)
+    app = _app(service)
+    body = json.dumps({"resume_ids": list(range(1, 201)), "job_descriptions": [_JOB]}).encode()
+    first_chunk_sent = asyncio.Event()
+    messages: list[dict[str, Any]] = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive() -> dict[str, Any]:
+        if messages:
+            return messages.pop()
+        await first_chunk_sent.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            first_chunk_sent.set()
+        await asyncio.sleep(0.001)  # a slow client
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/resumes/score/stream",
+        "raw_path": b"/resumes/score/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"host", b"test")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+
+    assert 0 < service.scored_rows < 200
@@ -0,0 +1,72 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.cli.serve import worker_memory
+
+pytestmark = pytest.mark.skipif(sys.platform != "linux", reason="reads /proc")
+
+
+def _environment(workdir: Path) -> dict[str, str]:
+    return {
+        **os.environ,
+        "SECRET_KEY": "serve-test-secret",
+        "DEBUG": "false",
+        "DATABASE_URL": f"sqlite+aiosqlite:///{workdir / 'serve.db'}",
+        "DB_CREATE_ALL": "true",
+        "UPLOAD_DIR": str(workdir / "uploads"),
+        "UPLOAD_STATE_DIR": str(workdir / "upload-state"),
+        "SKILL_AUTOMATON_PATH": str(workdir / "skills.automaton"),
+    }
+
+
+def _children(pid: int) -> set[int]:
+    return set(map(int, Path(f"/proc/{pid}/task/{pid}/children").read_text().split()))
+
+
+def _wait_for(condition, timeout: float = 30.0) -> None:  # type: ignore[no-untyped-def]
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+def test_prefork_workers_share_preloaded_pages_and_reload_gracefully(tmp_path: Path) -> None:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.cli.serve", "--workers", "2", "--port", str(port)],
+        env=_environment(tmp_path),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    client = httpx.Client(base_url=f"http://127.0.0.1:{port}", headers={"Connection": "close"})
+
+    def serving() -> bool:
+        try:
+            return client.get("/api/v1/system/pool").status_code == 200
+        except httpx.TransportError:
+            return False
+
+    try:
+        _wait_for(lambda: len(_children(server.pid)) == 2 and serving())
+        first = _children(server.pid)
+        for pid in first:
+            memory = worker_memory(pid)
+            assert memory["shared"] > memory["private"]
+
+        server.send_signal(signal.SIGHUP)
+        _wait_for(lambda: len(_children(server.pid)) == 2 and not first & _children(server.pid))
+        _wait_for(serving)
+    finally:
+        client.close()
+        server.send_signal(signal.SIGTERM)
+        assert server.wait(timeout=60) == 0
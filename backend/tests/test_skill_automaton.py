@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.application.services.bulk_import import ResumeImportService
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.infrastructure.scoring.sparse_engine import SparseScoringEngine
+from app.infrastructure.search.keyword_index import KeywordIndexRegistry
+from app.infrastructure.skills.automaton import (
+    DEFAULT_TAXONOMY_PATH,
+    SkillAutomaton,
+    TaxonomyError,
+    load_skill_automaton,
+    read_taxonomy,
+)
+from tests.fakes import InMemoryResumeRepository
+
+_TAXONOMY = {
+    "PostgreSQL": ["Postgres", "psql"],
+    "Machine Learning": ["ML"],
+    "Java": [],
+    "JavaScript": ["JS"],
+    "SQL": [],
+    "SQL Server": ["MSSQL"],
+}
+
+
+def test_finds_aliases_and_multi_word_skills_on_word_boundaries() -> None:
+    automaton = SkillAutomaton.from_taxonomy(_TAXONOMY)
+
+    found = automaton.find("Tuned postgres.\nMachine\n  learning with JavaScript; SQL Server")
+
+    assert found == ["postgresql", "machine learning", "javascript", "sql", "sql server"]
+    assert automaton.find("Javanese machinery, learning") == []
+    assert automaton.canonicalize(" MSSQL ") == "sql server"
+    assert automaton.canonicalize("Cobol") == "cobol"
+
+
+def test_conflicting_aliases_are_rejected() -> None:
+    with pytest.raises(TaxonomyError):
+        SkillAutomaton.from_taxonomy({"Go": ["golang"], "Golang": []})
+
+
+def test_packaged_taxonomy_compiles() -> None:
+    assert len(SkillAutomaton.from_taxonomy(read_taxonomy(DEFAULT_TAXONOMY_PATH))) > 100
+
+
+def test_compiled_file_is_reused_until_the_taxonomy_changes(tmp_path: Path) -> None:
+    taxonomy_path, compiled_path = tmp_path / "taxonomy.json", tmp_path / "skills.automaton"
+    taxonomy_path.write_text(json.dumps(_TAXONOMY))
+
+    first = load_skill_automaton(compiled_path, taxonomy_path)
+    modified = compiled_path.stat().st_mtime_ns
+    second = load_skill_automaton(compiled_path, taxonomy_path)
+    assert first.path == compiled_path and second.version == first.version
+    assert compiled_path.stat().st_mtime_ns == modified
+
+    taxonomy_path.write_text(json.dumps({**_TAXONOMY, "Kubernetes": ["k8s"]}))
+    third = load_skill_automaton(compiled_path, taxonomy_path)
+    assert third.version != first.version
+    assert third.find("k8s") == ["kubernetes"]
+
+
+@pytest.mark.parametrize("engine", [None, SparseScoringEngine(min_batch_size=1)])
+async def test_aliases_and_text_mentions_count_as_keyword_matches(
+    engine: SparseScoringEngine | None,
+) -> None:
+    service = ResumeScoringService(
+        InMemoryResumeRepository(), engine=engine, skills=SkillAutomaton.from_taxonomy(_TAXONOMY)
+    )
+    job = JobDescription(
+        role_title="Data engineer",
+        canonical_text="",
+        required_skills=["PostgreSQL", "machine learning"],
+        preferred_skills=["Rust"],
+    )
+    resume = Resume(
+        owner_id=1,
+        file_url="http://x/r.pdf",
+        parsed_text="Built ML models",
+        extracted_keywords=["Postgres", "rust"],
+    )
+
+    _, [[card]] = await service.score_batch(resumes=[resume], job_descriptions=[job])
+
+    assert card.keyword_match == 1.0
+    assert resume.extracted_skills == ["machine learning"]
+
+
+async def test_ranking_and_scoring_read_the_skills_tagged_at_import() -> None:
+    skills = SkillAutomaton.from_taxonomy(_TAXONOMY)
+    repository = InMemoryResumeRepository()
+    importer = ResumeImportService(repository, skills=skills, batch_size=10)
+    record = {"owner_id": 1, "file_url": "http://x/r.pdf", "parsed_text": "Built ML models"}
+
+    async def lines():
+        yield json.dumps(record).encode()
+
+    [batch] = [batch async for batch in importer.import_lines(lines())]
+    index = KeywordIndexRegistry(max_owners=1, ttl_seconds=60, canonicalize=skills.canonicalize)
+    service = ResumeScoringService(repository, index=index, skills=skills)
+    job = JobDescription(role_title="Data engineer", required_skills=["Machine Learning"])
+
+    [(resume, ranked)] = await service.rank_candidates(owner_id=1, job_description=job, limit=5)
+    _, [[scored]] = await service.score_batch(resume_ids=[resume.id or 0], job_descriptions=[job])
+
+    assert batch.imported[0].extracted_skills == ["machine learning"]
+    assert ranked.keyword_match == scored.keyword_match == 1.0
@@ -0,0 +1,66 @@
+import random
+
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.infrastructure.scoring.sparse_engine import SparseScoringEngine
+from tests.fakes import InMemoryResumeRepository
+
+_VOCABULARY = ["Python", "python", "SQL", "Kubernetes", "go", "Go,", "ML", "ÄPI", "data", "team"]
+
+
+def _corpus(seed: int, size: int) -> tuple[list[Resume], list[JobDescription | None]]:
+    rng = random.Random(seed)
+
+    def text(words: int) -> str:
+        return " ".join(rng.choice(_VOCABULARY + ["\n\n"]) for _ in range(words))
+
+    resumes = [
+        Resume(
+            id=index + 1,
+            owner_id=1,
+            file_url="http://x/r.pdf",
+            parsed_text=text(rng.randint(0, 120)) if index % 7 else None,
+            extracted_keywords=rng.sample(_VOCABULARY, rng.randint(0, 5)),
+        )
+        for index in range(size)
+    ]
+    jobs: list[JobDescription | None] = [
+        JobDescription(
+            role_title="Role",
+            canonical_text=text(rng.randint(1, 40)),
+            required_skills=rng.sample(_VOCABULARY, 3),
+            preferred_skills=["", *rng.sample(_VOCABULARY, 2)],
+        ),
+        JobDescription(role_title="Empty"),
+        JobDescription(role_title="Unknown", canonical_text="cobol", required_skills=["cobol"]),
+        None,
+    ]
+    return resumes, jobs
+
+
+async def test_sparse_engine_matches_per_resume_scoring() -> None:
+    resumes, jobs = _corpus(seed=7, size=300)
+    reference = ResumeScoringService(InMemoryResumeRepository())
+    vectorized = ResumeScoringService(
+        InMemoryResumeRepository(), engine=SparseScoringEngine(min_batch_size=1)
+    )
+
+    expected = reference._compute_matrix(resumes, jobs)
+    actual = vectorized._compute_matrix(resumes, jobs)
+
+    for expected_row, actual_row in zip(expected, actual):
+        for expected_card, actual_card in zip(expected_row, actual_row):
+            actual_card.generated_at = expected_card.generated_at
+            assert actual_card == expected_card
+
+
+async def test_sparse_engine_handles_batch_without_terms() -> None:
+    resumes = [Resume(owner_id=1, file_url="http://x/r.pdf") for _ in range(3)]
+    engine = SparseScoringEngine(min_batch_size=1)
+    service = ResumeScoringService(InMemoryResumeRepository(), engine=engine)
+    _, jobs = _corpus(seed=1, size=0)
+
+    [row, *_] = service._compute_matrix(resumes, jobs)
+
+    assert [card.keyword_match for card in row] == [0.0, 0.6, 0.0, 0.5]
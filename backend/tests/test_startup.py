@@ -0,0 +1,23 @@
+import json
+import subprocess
+import sys
+
+# Libraries only specific code paths need; importing the app must not pull them in.
+HEAVY_MODULES = ("sklearn", "scipy", "numpy", "pandas", "openai", "celery")
+
+
+def test_importing_the_app_skips_heavy_modules_and_opens_no_engine() -> None:
+    probe = (
+        "import json, sys\n"
+        "import app.main\n"
+        "from app.infrastructure.db import session\n"
+        "built = session._engine is not None\n"
+        "print(json.dumps({'modules': sorted(sys.modules), 'engine_built': built}))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert [name for name in HEAVY_MODULES if name in result["modules"]] == []
+    assert result["engine_built"] is False
@@ -0,0 +1,78 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.dependencies import get_analytics_cache, get_current_user, get_score_cache
+from app.api.v1.endpoints import auth, resumes
+from app.domain.entities.user import User
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.session import get_db_session
+
+
+@pytest.fixture
+async def api():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def session_override():
+        async with sessions() as session:
+            yield session
+
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement.split()[0])
+
+    app = FastAPI()
+    app.include_router(resumes.router, prefix="/resumes")
+    app.include_router(auth.router, prefix="/auth")
+    app.dependency_overrides[get_db_session] = session_override
+    app.dependency_overrides[get_score_cache] = lambda: None
+    app.dependency_overrides[get_analytics_cache] = lambda: None
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=1, email="a@example.com", hashed_password=""
+    )
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        yield client, statements
+    await engine.dispose()
+
+
+async def test_each_endpoint_costs_one_round_trip_per_write(api) -> None:
+    client, statements = api
+    resume = {"owner_id": 1, "file_url": "http://elsewhere/r.pdf", "parsed_text": "python"}
+
+    scored = await client.post("/resumes/score", json={"resume": resume})
+    assert scored.status_code == 201
+    assert statements == ["INSERT", "INSERT"]  # the resume, then its score card
+
+    statements.clear()
+    resume_id = scored.json()["resume"]["id"]
+    assert (await client.get(f"/resumes/{resume_id}")).status_code == 200
+    assert statements == ["SELECT"]
+
+    statements.clear()
+    assert (await client.delete(f"/resumes/{resume_id}")).status_code == 204
+    assert statements == ["DELETE"]
+
+    statements.clear()
+    assert (await client.delete(f"/resumes/{resume_id}")).status_code == 404
+    assert statements == ["DELETE"]
+
+    statements.clear()
+    registered = await client.post(
+        "/auth/register", json={"email": "a@example.com", "password": "secret-password"}
+    )
+    assert registered.status_code == 201
+    assert statements == ["SELECT", "INSERT"]  # the duplicate check, then the insert
+
+    statements.clear()
+    login = await client.post(
+        "/auth/login", json={"email": "a@example.com", "password": "secret-password"}
+    )
+    assert login.status_code == 200
+    assert statements == ["SELECT"]  # the hash is current, so nothing is rewritten
@@ -0,0 +1,53 @@
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.application.services.resume_scoring import ResumeScoringService
+from app.domain.entities.job_description import JobDescription
+from app.domain.entities.resume import Resume
+from app.domain.terms import term_frequencies
+from app.infrastructure.db.base import Base
+from app.infrastructure.repositories.resume_repository import ResumeRepository
+from tests.fakes import InMemoryResumeRepository
+
+
+def test_tokens_are_lowercased_and_stripped_of_edge_punctuation() -> None:
+    assert term_frequencies("Python, (SQL) C++ and C#; python. node.js ...") == {
+        "python": 2,
+        "sql": 1,
+        "c++": 1,
+        "and": 1,
+        "c#": 1,
+        "node.js": 1,
+    }
+    assert term_frequencies(None) == {}
+
+
+async def test_scoring_uses_stored_term_frequencies_instead_of_text() -> None:
+    service = ResumeScoringService(InMemoryResumeRepository())
+    job = JobDescription(role_title="Dev", canonical_text="python sql")
+    resume = Resume(owner_id=1, file_url="http://x/r.pdf", parsed_text="cobol")
+
+    resume.term_frequencies = {"python": 1, "sql": 1}
+    _, [[card]] = await service.score_batch(resumes=[resume], job_descriptions=[job])
+
+    assert "Highlight achievements aligned with the job description." not in card.recommendations
+
+
+async def test_repository_stores_terms_at_ingest_and_extraction() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        repository = ResumeRepository(session)
+        stored = await repository.add(
+            Resume(owner_id=1, file_url="http://x/r.pdf", parsed_text="Go, go!")
+        )
+        assert stored.term_frequencies == {"go": 2}
+
+        await repository.update_extraction(
+            stored.id or 0, parsed_text="Rust", extracted_skills=[], extracted_keywords=[]
+        )
+        [fetched] = await repository.get_many([stored.id or 0])
+        assert fetched.term_frequencies == {"rust": 1}
+        [listed] = await repository.list_for_owner(1, limit=1)
+        assert listed.term_frequencies is None  # deferred; listings never load it
+    await engine.dispose()
@@ -0,0 +1,147 @@
+import hashlib
+import io
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.dependencies import get_file_storage
+from app.api.middleware import UploadSizeLimitMiddleware
+from app.api.v1.endpoints import resumes
+from app.core.config import get_settings
+from app.domain.entities.resume import Resume
+from app.infrastructure.db.base import Base
+from app.infrastructure.repositories.resume_repository import ResumeRepository
+from app.infrastructure.storage.local import LocalFileStorage
+from app.infrastructure.storage.s3 import InMemoryS3Client, S3FileStorage
+from app.infrastructure.storage.uploads import UploadTooLargeError, copy_upload
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setenv("UPLOAD_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setenv("MAX_UPLOAD_BYTES", "1000")
+    monkeypatch.setenv("UPLOAD_CHUNK_BYTES", "64")
+    get_settings.cache_clear()
+    get_file_storage.cache_clear()
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_bytes=1000, paths=["/resumes/upload"])
+    app.include_router(resumes.router, prefix="/resumes")
+    yield httpx.AsyncClient(app=app, base_url="http://test")
+    get_settings.cache_clear()
+    get_file_storage.cache_clear()
+
+
+def _pdf(size: int) -> dict[str, tuple[str, bytes, str]]:
+    return {"file": ("resume.pdf", b"%" * size, "application/pdf")}
+
+
+async def test_upload_streams_file_and_reports_digest(client, tmp_path) -> None:
+    response = await client.post("/resumes/upload", files=_pdf(700))
+
+    assert response.status_code == 201
+    body = response.json()
+    digest = hashlib.sha256(b"%" * 700).hexdigest()
+    assert body["size_bytes"] == 700
+    assert body["sha256"] == digest
+    assert body["file_url"].endswith(f"/uploads/{digest[:2]}/{digest[2:4]}/{digest}.pdf")
+    stored = tmp_path / "uploads" / digest[:2] / digest[2:4] / f"{digest}.pdf"
+    assert stored.read_bytes() == b"%" * 700
+
+
+async def test_upload_over_limit_is_rejected_without_leftovers(client, tmp_path) -> None:
+    response = await client.post("/resumes/upload", files=_pdf(1001))
+
+    assert response.status_code == 413
+    assert [path for path in tmp_path.rglob("*") if path.is_file()] == []
+
+
+async def test_middleware_rejects_declared_oversized_body(client) -> None:
+    response = await client.post("/resumes/upload", files=_pdf(200_000))
+
+    assert response.status_code == 413
+
+
+def test_copy_upload_removes_partial_file(tmp_path) -> None:
+    target = tmp_path / "partial.pdf"
+    with pytest.raises(UploadTooLargeError):
+        copy_upload(io.BytesIO(b"x" * 300), target, max_bytes=200, chunk_size=64)
+    assert not target.exists()
+
+
+async def test_local_storage_counts_resume_references_outside_the_served_root(
+    tmp_path,
+) -> None:
+    root = tmp_path / "uploads"
+    storage = LocalFileStorage(root, state_dir=tmp_path / "state", public_base_url="http://test")
+    first = await storage.put(io.BytesIO(b"resume"), suffix=".pdf", max_bytes=100, chunk_size=4)
+    second = await storage.put(io.BytesIO(b"resume"), suffix=".pdf", max_bytes=100, chunk_size=4)
+
+    assert (first.key, first.references, second.references) == (second.key, 0, 0)
+    assert [path for path in root.rglob("*") if path.is_file()] == [root / first.key]
+    assert storage.key_from_url(storage.public_url(first.key)) == first.key
+    assert storage.key_from_url("http://test/uploads/../../etc/passwd") is None
+    assert await storage.acquire(first.key, 2) == 2
+    assert await storage.collect_unreferenced(older_than_seconds=0) == []
+    assert await storage.release(first.key) == 1
+    assert await storage.release(first.key) == 0
+    # Left for collection, so a concurrent upload of the same bytes can still take it.
+    assert (root / first.key).exists()
+    assert await storage.collect_unreferenced(older_than_seconds=60) == []
+    assert await storage.collect_unreferenced(older_than_seconds=0) == [first.key]
+    assert not (root / first.key).exists()
+
+
+async def test_local_storage_collects_uploads_no_resume_took(tmp_path) -> None:
+    storage = LocalFileStorage(
+        tmp_path / "uploads", state_dir=tmp_path / "state", public_base_url="http://test"
+    )
+    orphan = await storage.put(io.BytesIO(b"orphan"), suffix=".pdf", max_bytes=100, chunk_size=4)
+
+    assert await storage.collect_unreferenced(older_than_seconds=60) == []
+    assert await storage.collect_unreferenced(older_than_seconds=0) == [orphan.key]
+    assert await storage.acquire(orphan.key) == 0
+
+
+async def test_s3_storage_counts_resume_references_and_collects_orphans() -> None:
+    client = InMemoryS3Client()
+    storage = S3FileStorage(client, bucket="uploads", public_base_url="http://s3/uploads")
+    first = await storage.put(io.BytesIO(b"resume"), suffix=".pdf", max_bytes=100, chunk_size=4)
+    second = await storage.put(io.BytesIO(b"resume"), suffix=".pdf", max_bytes=100, chunk_size=4)
+    orphan = await storage.put(io.BytesIO(b"orphan"), suffix=".pdf", max_bytes=100, chunk_size=4)
+
+    assert (second.key, second.references) == (first.key, 0)
+    assert await storage.acquire(first.key, 2) == 2
+    assert await storage.collect_unreferenced(older_than_seconds=0) == [orphan.key]
+    assert list(client.objects) == [("uploads", first.key)]
+    assert await storage.release(first.key) == 1
+    assert await storage.release(first.key) == 0
+    assert list(client.objects) == [("uploads", first.key)]
+    assert await storage.collect_unreferenced(older_than_seconds=0) == [first.key]
+    assert client.objects == {}
+
+
+async def test_each_resume_row_holds_a_reference_to_its_upload(tmp_path) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    root = tmp_path / "uploads"
+    storage = LocalFileStorage(root, state_dir=tmp_path / "state", public_base_url="http://test")
+    stored = await storage.put(io.BytesIO(b"resume"), suffix=".pdf", max_bytes=100, chunk_size=4)
+    url = storage.public_url(stored.key)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        repository = ResumeRepository(session, storage=storage)
+        first, _ = await repository.add_many(
+            [Resume(owner_id=1, file_url=url), Resume(owner_id=2, file_url=url)]
+        )
+        await session.commit()
+        await repository.delete(first.id or 0)
+        await session.commit()
+        await repository.add(Resume(owner_id=3, file_url=url))
+        await session.rollback()
+
+    assert await storage.release(stored.key) == 1
+    assert (root / stored.key).exists()
+    await engine.dispose()
@@ -1,6 +1,7 @@
-import { useMemo } from "react";
+import { useEffect, useMemo, useState } from "react";
 
 import { resumeService } from "../../services/resume";
+import type { Resume } from "../../types/resume";
 import { useQuery } from "../shared/useQuery";
 
 type ResumeListProps = {
@@ -13,7 +14,22 @@ export const ResumeList = ({ ownerId, onRemoved }: ResumeListProps) => {
     resumeService.list(ownerId)
   );
 
-  const resumes = useMemo(() => data ?? [], [data]);
+  const [more, setMore] = useState<{ items: Resume[]; cursor: string | null }>({
+    items: [],
+    cursor: null
+  });
+
+  useEffect(() => {
+    // eslint-disable-next-line react-hooks/set-state-in-effect -- a new first page restarts paging
+    setMore({ items: [], cursor: data?.next_cursor ?? null });
+  }, [data]);
+
+  const resumes = useMemo(() => [...(data?.items ?? []), ...more.items], [data, more.items]);
+
+  const handleLoadMore = async () => {
+    const page = await resumeService.list(ownerId, more.cursor);
+    setMore((prev) => ({ items: [...prev.items, ...page.items], cursor: page.next_cursor }));
+  };
 
   const handleDelete = async (id: number) => {
     await resumeService.remove(id);
@@ -56,6 +72,16 @@ export const ResumeList = ({ ownerId, onRemoved }: ResumeListProps) => {
           </button>
         </li>
       ))}
+      {more.cursor && (
+        <li>
+          <button
+            onClick={handleLoadMore}
+            className="w-full rounded-md border border-slate-700 px-3 py-2 text-xs font-medium text-slate-300 transition hover:border-slate-500 hover:text-white"
+          >
+            Load more
+          </button>
+        </li>
+      )}
     </ul>
   );
 };
@@ -1,6 +1,6 @@
 import { apiClient } from "./api";
 import type {
-  Resume,
+  ResumePage,
   ResumeScoreRequest,
   ResumeScoreResponse,
   ResumeUploadResponse
@@ -11,9 +11,13 @@ export const resumeService = {
     const { data } = await apiClient.post<ResumeScoreResponse>("/resumes/score", payload);
     return data;
   },
-  async list(ownerId: number) {
-    const { data } = await apiClient.get<Resume[]>("/resumes", {
-      params: { owner_id: ownerId }
+  async list(ownerId: number, cursor?: string | null) {
+    const { data } = await apiClient.get<ResumePage>("/resumes", {
+      params: {
+        owner_id: ownerId,
+        fields: "created_at",
+        ...(cursor ? { cursor } : {})
+      }
     });
     return data;
   },
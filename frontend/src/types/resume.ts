@@ -9,6 +9,11 @@ export type Resume = {
   updated_at: string;
 };
 
+export type ResumePage = {
+  items: Resume[];
+  next_cursor: string | null;
+};
+
 export type JobDescription = {
   role_title: string;
   company_name?: string | null;